@@ -1,65 +1,137 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import bindparam, exists, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import List, Optional, Union
 
-from ..core.database import get_db
+from ..core.config import settings
+from ..core.database import dialect_insert, get_db
+from ..core.etag import etag_matches
+from ..core.pagination import apply_keyset, split_page
+from ..core.serialization import ORJSONResponse, row_dicts, schema_columns
+from ..core.storage import DIGEST_PATTERN, ContentStore, InvalidUpload, RangeFileResponse, UploadTooLarge
 from ..models.user import User
-from ..models.assignment import Assignment, Submission
+from ..models.assignment import Assignment, AssignmentStatus, FileUpload, StoredFile, Submission
 from ..schemas.assignment import (
     AssignmentCreate,
+    AssignmentPage,
     AssignmentResponse,
+    BulkGradeRequest,
+    BulkGradeResponse,
+    StoredFileResponse,
     SubmissionCreate,
-    SubmissionResponse,
-    SubmissionUpdate
+    SubmissionResponse
 )
 from .auth import get_current_user
 
 router = APIRouter()
 
-@router.get("/", response_model=List[AssignmentResponse])
-def get_assignments(
+GRADING_BATCH_SIZE = 500
+
+content_store = ContentStore(settings.UPLOAD_DIR, settings.MAX_UPLOAD_SIZE)
+
+# The upload body is parsed by hand, so describe it for the OpenAPI docs
+_UPLOAD_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "multipart/form-data": {
+            "schema": {
+                "type": "object",
+                "required": ["file"],
+                "properties": {"file": {"type": "string", "format": "binary"}}
+            }
+        }
+    }
+}
+
+_assignment_columns = schema_columns(Assignment, AssignmentResponse)
+
+def _file_url(digest: str) -> str:
+    return f"{settings.API_V1_STR}/assignments/files/{digest}"
+
+async def _uploaded_by(db: AsyncSession, user_id: int, digest: str) -> bool:
+    result = await db.execute(select(exists().where(
+        FileUpload.user_id == user_id,
+        FileUpload.digest == digest
+    )))
+    return result.scalar()
+
+def _upload_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"Files are limited to {settings.MAX_UPLOAD_SIZE // (1024 * 1024)} MB"
+    )
+
+@router.get("/", response_model=Union[AssignmentPage, List[AssignmentResponse]])
+async def get_assignments(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    assignments = db.query(Assignment).offset(skip).limit(limit).all()
-    return assignments
+    """
+    List assignments. Passing `cursor` (empty for the first page) switches to
+    keyset pagination; without it the legacy skip/limit list is returned.
+    """
+    stmt = select(*_assignment_columns)
+    if cursor is None:
+        result = await db.execute(stmt.offset(skip).limit(limit))
+        return ORJSONResponse(row_dicts(result))
+    
+    try:
+        stmt = apply_keyset(stmt, Assignment.id, cursor, limit)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    result = await db.execute(stmt)
+    rows, next_cursor = split_page(result.all(), limit)
+    return ORJSONResponse({"items": row_dicts(rows), "next_cursor": next_cursor})
 
 @router.get("/{assignment_id}", response_model=AssignmentResponse)
-def get_assignment(
+async def get_assignment(
     assignment_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    assignment = db.query(Assignment).filter(Assignment.id == assignment_id).first()
+    assignment = await db.get(Assignment, assignment_id)
     if not assignment:
         raise HTTPException(status_code=404, detail="Assignment not found")
     return assignment
 
 @router.post("/", response_model=AssignmentResponse)
-def create_assignment(
+async def create_assignment(
     assignment_in: AssignmentCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     assignment = Assignment(**assignment_in.dict())
     db.add(assignment)
-    db.commit()
-    db.refresh(assignment)
+    await db.commit()
+    await db.refresh(assignment)
     return assignment
 
 @router.post("/{assignment_id}/submit", response_model=SubmissionResponse)
-def submit_assignment(
+async def submit_assignment(
     assignment_id: int,
     submission_in: SubmissionCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    assignment = db.query(Assignment).filter(Assignment.id == assignment_id).first()
+    assignment = await db.get(Assignment, assignment_id)
     if not assignment:
         raise HTTPException(status_code=404, detail="Assignment not found")
     
+    if submission_in.file_url is not None:
+        # Attaching a file grants its readers access, so it must be the caller's own upload
+        prefix = _file_url("")
+        digest = submission_in.file_url[len(prefix):]
+        if (
+            not submission_in.file_url.startswith(prefix)
+            or not DIGEST_PATTERN.match(digest)
+            or not await _uploaded_by(db, current_user.id, digest)
+        ):
+            raise HTTPException(status_code=400, detail="file_url must be a file you uploaded")
+    
     submission = Submission(
         assignment_id=assignment_id,
         student_id=current_user.id,
@@ -68,7 +140,151 @@ def submit_assignment(
     )
     
     db.add(submission)
-    db.commit()
-    db.refresh(submission)
+    await db.commit()
+    await db.refresh(submission)
     
     return submission
+
+@router.post("/submissions/grade", response_model=BulkGradeResponse)
+async def bulk_grade_submissions(
+    grading_in: BulkGradeRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Grade many submissions in one transaction. Grades are checked against
+    their assignment's max_grade up front; nothing is written if any fail.
+    """
+    if current_user.role.value not in ("instructor", "admin"):
+        raise HTTPException(status_code=403, detail="Not authorized to grade submissions")
+    
+    grades = {item.submission_id: item for item in grading_in.grades}
+    if len(grades) != len(grading_in.grades):
+        raise HTTPException(status_code=400, detail="Each submission can only be graded once per request")
+    
+    # Max grades for every submission in one joined query per batch
+    submission_ids = sorted(grades)
+    max_grades = {}
+    for start in range(0, len(submission_ids), GRADING_BATCH_SIZE):
+        batch = submission_ids[start:start + GRADING_BATCH_SIZE]
+        result = await db.execute(
+            select(Submission.id, Assignment.max_grade)
+            .join(Assignment, Assignment.id == Submission.assignment_id)
+            .where(Submission.id.in_(batch))
+        )
+        max_grades.update(result.all())
+    
+    missing = [submission_id for submission_id in submission_ids if submission_id not in max_grades]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Submissions not found: {missing}")
+    too_high = [
+        submission_id for submission_id in submission_ids
+        if max_grades[submission_id] is not None and grades[submission_id].grade > max_grades[submission_id]
+    ]
+    if too_high:
+        raise HTTPException(status_code=400, detail=f"Grades exceed the assignment's max grade: {too_high}")
+    
+    graded_at = datetime.utcnow()
+    submissions = Submission.__table__
+    stmt = (
+        update(submissions)
+        .where(submissions.c.id == bindparam("b_id"))
+        .values(
+            grade=bindparam("b_grade"),
+            # Omitted feedback keeps whatever the submission already has
+            feedback=func.coalesce(bindparam("b_feedback"), submissions.c.feedback),
+            status=AssignmentStatus.GRADED,
+            graded_at=graded_at
+        )
+    )
+    for start in range(0, len(submission_ids), GRADING_BATCH_SIZE):
+        await db.execute(stmt, [
+            {
+                "b_id": submission_id,
+                "b_grade": grades[submission_id].grade,
+                "b_feedback": grades[submission_id].feedback,
+            }
+            for submission_id in submission_ids[start:start + GRADING_BATCH_SIZE]
+        ])
+    await db.commit()
+    
+    return BulkGradeResponse(graded=len(submission_ids), graded_at=graded_at)
+
+@router.post(
+    "/files",
+    response_model=StoredFileResponse,
+    openapi_extra={"requestBody": _UPLOAD_REQUEST_BODY}
+)
+async def upload_file(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Upload a file (multipart field `file`) to attach to a submission via the
+    returned `url`. Identical content is stored once.
+    """
+    # Streamed from the socket into the store, so oversized bodies are cut off early
+    try:
+        digest, size, created, content_type = await content_store.receive(request)
+    except UploadTooLarge:
+        raise _upload_too_large()
+    except InvalidUpload as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    await db.execute(
+        dialect_insert(StoredFile).values(
+            digest=digest,
+            size=size,
+            content_type=content_type
+        ).on_conflict_do_nothing()
+    )
+    await db.execute(
+        dialect_insert(FileUpload).values(
+            user_id=current_user.id,
+            digest=digest,
+            created_at=datetime.utcnow()
+        ).on_conflict_do_nothing()
+    )
+    await db.commit()
+    
+    return StoredFileResponse(
+        digest=digest,
+        size=size,
+        content_type=content_type,
+        url=_file_url(digest),
+        deduplicated=not created
+    )
+
+@router.get("/files/{digest}")
+async def download_file(
+    digest: str,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Download an uploaded file; supports single byte ranges and conditional requests"""
+    if not DIGEST_PATTERN.match(digest):
+        raise HTTPException(status_code=404, detail="File not found")
+    
+    if current_user.role.value not in ("instructor", "admin"):
+        if not await _uploaded_by(db, current_user.id, digest):
+            raise HTTPException(status_code=403, detail="Not authorized to access this file")
+    
+    stored = await db.get(StoredFile, digest)
+    path = content_store.path(digest)
+    if stored is None or not path.exists():
+        raise HTTPException(status_code=404, detail="File not found")
+    
+    # Content-addressed: the digest is a permanent validator
+    headers = {"ETag": f'"{digest}"', "Cache-Control": "private, max-age=31536000, immutable"}
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    
+    return RangeFileResponse(
+        path,
+        stored.size,
+        range_header=request.headers.get("range"),
+        media_type=stored.content_type,
+        headers=headers
+    )
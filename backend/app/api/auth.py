@@ -1,10 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
 from datetime import timedelta
 
+from ..core.cache import TTLCache
 from ..core.database import get_db
-from ..core.security import verify_password, get_password_hash, create_access_token, decode_access_token
+from ..core.metrics import counter
+from ..core.security import (
+    HashingOverloaded,
+    password_hasher,
+    create_access_token,
+    decode_access_token
+)
 from ..core.config import settings
 from ..models.user import User
 from ..schemas.user import UserCreate, UserResponse, Token
@@ -13,9 +22,59 @@ router = APIRouter()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+# Detached User instances keyed by email (the token subject)
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+counter(
+    "principal_cache_hits_total",
+    "Authenticated requests served from the principal cache",
+    function=lambda: principal_cache.hits
+)
+counter(
+    "principal_cache_misses_total",
+    "Authenticated requests that loaded the user from the database",
+    function=lambda: principal_cache.misses
+)
+
+def invalidate_principal(email: str) -> None:
+    """Drop a cached user so the next request reloads it from the database"""
+    principal_cache.invalidate(email)
+
+# Flushed user changes are invalidated on commit; dropping them at flush time
+# would let a concurrent request re-cache the still-committed row
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _note_changed_user(mapper, connection, target):
+    session = object_session(target)
+    if session is None:
+        return
+    stale = session.info.setdefault("stale_principals", set())
+    stale.add(target.email)
+    # A changed email leaves the old subject cached as well
+    stale.update(inspect(target).attrs.email.history.deleted)
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session):
+    for email in session.info.pop("stale_principals", ()):
+        invalidate_principal(email)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session):
+    session.info.pop("stale_principals", None)
+
+def _hashing_unavailable() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many sign-in requests, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -24,48 +83,69 @@ async def get_current_user(
     )
     
     payload = decode_access_token(token)
-    if payload is None:
+    # Scoped tokens (e.g. calendar feed links) only work on their own endpoint
+    if payload is None or "scope" in payload:
         raise credentials_exception
     
     email: str = payload.get("sub")
     if email is None:
         raise credentials_exception
     
-    user = db.query(User).filter(User.email == email).first()
+    user = principal_cache.get(email)
     if user is None:
-        raise credentials_exception
+        result = await db.execute(select(User).where(User.email == email))
+        user = result.scalar_one_or_none()
+        if user is None:
+            raise credentials_exception
+        # Detach so commits later in this request don't expire the cached copy
+        db.expunge(user)
+        principal_cache.set(email, user)
     
     return user
 
 @router.post("/register", response_model=UserResponse)
-def register(user_in: UserCreate, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == user_in.email).first()
+async def register(user_in: UserCreate, db: AsyncSession = Depends(get_db)):
+    result = await db.execute(select(User).where(User.email == user_in.email))
+    user = result.scalar_one_or_none()
     if user:
         raise HTTPException(
             status_code=400,
             detail="Email already registered"
         )
     
+    try:
+        hashed_password = await password_hasher.hash(user_in.password)
+    except HashingOverloaded:
+        raise _hashing_unavailable()
+    
     user = User(
         email=user_in.email,
         name=user_in.name,
         role=user_in.role,
-        hashed_password=get_password_hash(user_in.password)
+        hashed_password=hashed_password
     )
     
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     
     return user
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    user = db.query(User).filter(User.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    result = await db.execute(select(User).where(User.email == form_data.username))
+    user = result.scalar_one_or_none()
+    try:
+        password_ok = user is not None and await password_hasher.verify(
+            form_data.password, user.hashed_password
+        )
+    except HashingOverloaded:
+        raise _hashing_unavailable()
+    
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -80,5 +160,5 @@ def login(
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.get("/me", response_model=UserResponse)
-def read_users_me(current_user: User = Depends(get_current_user)):
+async def read_users_me(current_user: User = Depends(get_current_user)):
     return current_user
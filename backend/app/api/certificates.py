@@ -1,90 +1,229 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
-from sqlalchemy.orm import Session
-from typing import List
-from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import event, exists, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from typing import List, Optional
+from datetime import datetime, timedelta
+import asyncio
+import logging
+import re
 import secrets
-from ..core.database import get_db
+import time
+from ..core.bloom import BloomFilter
+from ..core.cache import TTLCache
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal, dialect_insert, get_db
+from ..core.metrics import counter
+from ..core.replica import get_read_db, read_session, replica_router
+from ..core.serialization import ORJSONResponse, row_dicts, schema_columns
 from ..models import User, Course, Certificate, Enrollment
-from ..schemas.certificate import CertificateResponse, CertificateDetail, CertificateCreate
+from ..schemas.certificate import (
+    CertificateBatchResponse,
+    CertificateResponse,
+    CertificateDetail,
+    CertificateCreate
+)
 from .auth import get_current_user
+from .leaderboard import apply_leaderboard_deltas
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Enrollments processed per transaction when issuing certificates in bulk
+CERTIFICATE_BATCH_SIZE = 500
+
+# Listing reads only the columns CertificateResponse exposes
+_certificate_columns = schema_columns(Certificate, CertificateResponse)
+
 def generate_certificate_number() -> str:
     """Generate a unique certificate number"""
     timestamp = datetime.utcnow().strftime("%Y%m%d")
     random_part = secrets.token_hex(4).upper()
     return f"CERT-{timestamp}-{random_part}"
 
+class CertificateNumberFilter:
+    """
+    Bloom filter of issued certificate numbers, rebuilt from the table.
+    
+    A worker only sees certificates that existed when its filter was built,
+    so it is trusted only for numbers dated before that build (minus a safety
+    margin); anything newer is always checked against the database.
+    
+    Rebuilds run as a background task; lookups keep using the current filter
+    (or none, before the first build) until the new one is swapped in.
+    """
+
+    _dated_number = re.compile(r"^CERT-(\d{8})-")
+
+    def __init__(self, rebuild_interval: float):
+        self.rebuild_interval = rebuild_interval
+        self.bloom: Optional[BloomFilter] = None
+        self.cutoff = ""
+        self.built_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def is_stale(self) -> bool:
+        return self.bloom is None or time.monotonic() - self.built_at > self.rebuild_interval
+
+    def refresh(self) -> None:
+        """Start a background rebuild if the filter is stale and none is running"""
+        if self.is_stale() and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._rebuild_logged())
+
+    async def _rebuild_logged(self) -> None:
+        try:
+            await self.rebuild()
+        except Exception:
+            logger.exception("Certificate filter rebuild failed; will retry on a later request")
+
+    async def rebuild(self) -> None:
+        """Scan every issued number into a new filter, on the replica when it's usable"""
+        engine, _ = await replica_router.choose(None)
+        started = datetime.utcnow()
+        async with AsyncSessionLocal(bind=engine) as db:
+            total = (await db.execute(select(func.count(Certificate.id)))).scalar_one()
+            bloom = BloomFilter(capacity=max(total * 2, 1024))
+            numbers = await db.stream_scalars(
+                select(Certificate.certificate_number).execution_options(yield_per=5000)
+            )
+            async for number in numbers:
+                bloom.add(number)
+        # No await between these, so lookups never see a mix of old and new
+        self.bloom = bloom
+        self.cutoff = (started - timedelta(minutes=10)).strftime("%Y%m%d")
+        self.built_at = time.monotonic()
+
+    def definitely_missing(self, certificate_number: str) -> bool:
+        match = self._dated_number.match(certificate_number)
+        if match:
+            # Numbers carry their UTC issue date, so none can be dated after today
+            # (plus the same margin for clock skew between workers)
+            today = (datetime.utcnow() + timedelta(minutes=10)).strftime("%Y%m%d")
+            if match.group(1) > today:
+                return True
+        if self.bloom is None:
+            return False
+        if match and match.group(1) >= self.cutoff:
+            return False
+        return certificate_number not in self.bloom
+
+# Public verification lookups: CertificateDetail by number, fronted by the filter
+verified_certificates = TTLCache(
+    maxsize=settings.CERTIFICATE_CACHE_MAX_SIZE,
+    ttl=settings.CERTIFICATE_CACHE_TTL_SECONDS
+)
+certificate_filter = CertificateNumberFilter(settings.CERTIFICATE_FILTER_REBUILD_SECONDS)
+CERTIFICATE_VERIFICATIONS = counter(
+    "certificate_verifications_total",
+    "Public certificate verifications by how they were answered",
+    ["result"]
+)
+
+@event.listens_for(Certificate, "after_update")
+@event.listens_for(Certificate, "after_delete")
+def _invalidate_verified_certificate(mapper, connection, target):
+    verified_certificates.invalidate(target.certificate_number)
+
+@event.listens_for(Course, "after_update")
+def _invalidate_verified_certificates(mapper, connection, target):
+    # Cached details embed course thumbnail/category/duration
+    verified_certificates.clear()
+
+def certificate_grade(progress_percentage: float) -> str:
+    """Generate grade based on progress (you can customize this logic)"""
+    if progress_percentage >= 95:
+        return "Excellent"
+    elif progress_percentage >= 90:
+        return "Very Good"
+    return "Pass"
+
+def _instructor_name(course: Course) -> str:
+    return course.instructor.name if course.instructor else "Platform Instructor"
+
+def _certificate_detail_query():
+    """Certificate plus the course fields CertificateDetail needs, in one query"""
+    return select(
+        Certificate, Course.thumbnail, Course.category, Course.duration
+    ).outerjoin(Course, Course.id == Certificate.course_id)
+
+def _certificate_detail(row) -> CertificateDetail:
+    certificate, course_thumbnail, course_category, course_duration = row
+    return CertificateDetail(
+        id=certificate.id,
+        user_id=certificate.user_id,
+        course_id=certificate.course_id,
+        certificate_number=certificate.certificate_number,
+        issued_at=certificate.issued_at,
+        completed_at=certificate.completed_at,
+        instructor_name=certificate.instructor_name,
+        course_title=certificate.course_title,
+        student_name=certificate.student_name,
+        grade=certificate.grade,
+        course_thumbnail=course_thumbnail,
+        course_category=course_category,
+        course_duration=course_duration
+    )
+
 @router.get("/", response_model=List[CertificateResponse])
-def get_my_certificates(
-    db: Session = Depends(get_db),
+async def get_my_certificates(
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get all certificates for the current user"""
-    certificates = db.query(Certificate).filter(
-        Certificate.user_id == current_user.id
-    ).order_by(Certificate.issued_at.desc()).all()
+    result = await db.execute(
+        select(*_certificate_columns)
+        .where(Certificate.user_id == current_user.id)
+        .order_by(Certificate.issued_at.desc())
+    )
     
-    return certificates
+    return ORJSONResponse(row_dicts(result))
 
 @router.get("/{certificate_id}", response_model=CertificateDetail)
-def get_certificate(
+async def get_certificate(
     certificate_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get a specific certificate by ID"""
-    certificate = db.query(Certificate).filter(
-        Certificate.id == certificate_id
-    ).first()
+    result = await db.execute(
+        _certificate_detail_query().where(Certificate.id == certificate_id)
+    )
+    row = result.first()
     
-    if not certificate:
+    if not row:
         raise HTTPException(status_code=404, detail="Certificate not found")
+    certificate = row[0]
     
     # Check if user owns this certificate or is an admin
     if certificate.user_id != current_user.id and current_user.role.value != "admin":
         raise HTTPException(status_code=403, detail="Not authorized to view this certificate")
     
-    # Get course details
-    course = db.query(Course).filter(Course.id == certificate.course_id).first()
-    
-    # Prepare detailed response
-    cert_detail = CertificateDetail(
-        id=certificate.id,
-        user_id=certificate.user_id,
-        course_id=certificate.course_id,
-        certificate_number=certificate.certificate_number,
-        issued_at=certificate.issued_at,
-        completed_at=certificate.completed_at,
-        instructor_name=certificate.instructor_name,
-        course_title=certificate.course_title,
-        student_name=certificate.student_name,
-        grade=certificate.grade,
-        course_thumbnail=course.thumbnail if course else None,
-        course_category=course.category if course else None,
-        course_duration=course.duration if course else None
-    )
-    
-    return cert_detail
+    return _certificate_detail(row)
 
 @router.post("/generate/{course_id}", response_model=CertificateResponse)
-def generate_certificate(
+async def generate_certificate(
     course_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Generate a certificate for a completed course"""
     # Check if course exists
-    course = db.query(Course).filter(Course.id == course_id).first()
+    result = await db.execute(
+        select(Course).where(Course.id == course_id).options(selectinload(Course.instructor))
+    )
+    course = result.scalar_one_or_none()
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
     
     # Check if user is enrolled
-    enrollment = db.query(Enrollment).filter(
-        Enrollment.user_id == current_user.id,
-        Enrollment.course_id == course_id
-    ).first()
+    result = await db.execute(
+        select(Enrollment).where(
+            Enrollment.user_id == current_user.id,
+            Enrollment.course_id == course_id
+        )
+    )
+    enrollment = result.scalars().first()
     
     if not enrollment:
         raise HTTPException(status_code=400, detail="You are not enrolled in this course")
@@ -97,10 +236,13 @@ def generate_certificate(
         )
     
     # Check if certificate already exists
-    existing_cert = db.query(Certificate).filter(
-        Certificate.user_id == current_user.id,
-        Certificate.course_id == course_id
-    ).first()
+    result = await db.execute(
+        select(Certificate).where(
+            Certificate.user_id == current_user.id,
+            Certificate.course_id == course_id
+        )
+    )
+    existing_cert = result.scalars().first()
     
     if existing_cert:
         return existing_cert
@@ -108,17 +250,8 @@ def generate_certificate(
     # Mark enrollment as completed if not already
     if not enrollment.completed_at:
         enrollment.completed_at = datetime.utcnow()
-        db.commit()
-    
-    # Get instructor name
-    instructor_name = course.instructor.name if course.instructor else "Platform Instructor"
-    
-    # Generate grade based on progress (you can customize this logic)
-    grade = "Pass"
-    if enrollment.progress_percentage >= 95:
-        grade = "Excellent"
-    elif enrollment.progress_percentage >= 90:
-        grade = "Very Good"
+        await apply_leaderboard_deltas(db, {current_user.id: {"courses_completed": 1}})
+        await db.commit()
     
     # Create certificate
     certificate = Certificate(
@@ -126,29 +259,131 @@ def generate_certificate(
         course_id=course_id,
         certificate_number=generate_certificate_number(),
         completed_at=enrollment.completed_at or datetime.utcnow(),
-        instructor_name=instructor_name,
+        instructor_name=_instructor_name(course),
         course_title=course.title,
         student_name=current_user.name,
-        grade=grade
+        grade=certificate_grade(enrollment.progress_percentage)
     )
     
     db.add(certificate)
-    db.commit()
-    db.refresh(certificate)
+    await db.commit()
+    await db.refresh(certificate)
     
     return certificate
 
+async def issue_course_certificates(
+    db: AsyncSession,
+    course: Course,
+    batch_size: int = CERTIFICATE_BATCH_SIZE
+) -> CertificateBatchResponse:
+    """
+    Issue certificates for every enrollment at 100% that doesn't have one yet.
+    
+    Each batch commits on its own and eligibility excludes enrollments that
+    already have a certificate, so an interrupted run can simply be repeated.
+    The course must be loaded with its instructor.
+    """
+    has_certificate = exists().where(
+        Certificate.user_id == Enrollment.user_id,
+        Certificate.course_id == Enrollment.course_id
+    )
+    instructor_name = _instructor_name(course)
+    issued = 0
+    batches = 0
+    last_id = 0
+    
+    while True:
+        result = await db.execute(
+            select(
+                Enrollment.id,
+                Enrollment.user_id,
+                Enrollment.progress_percentage,
+                Enrollment.completed_at,
+                User.name
+            )
+            .join(User, User.id == Enrollment.user_id)
+            .where(
+                Enrollment.course_id == course.id,
+                Enrollment.progress_percentage >= 100,
+                Enrollment.id > last_id,
+                ~has_certificate
+            )
+            .order_by(Enrollment.id)
+            .limit(batch_size)
+        )
+        rows = result.all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+        now = datetime.utcnow()
+        
+        # Mark enrollments as completed if not already
+        result = await db.execute(
+            update(Enrollment)
+            .where(Enrollment.id.in_([row.id for row in rows]), Enrollment.completed_at.is_(None))
+            .values(completed_at=now)
+            .returning(Enrollment.user_id)
+            .execution_options(synchronize_session=False)
+        )
+        await apply_leaderboard_deltas(
+            db, {user_id: {"courses_completed": 1} for user_id in result.scalars().all()}
+        )
+        
+        result = await db.execute(
+            dialect_insert(Certificate).values([
+                {
+                    "user_id": row.user_id,
+                    "course_id": course.id,
+                    "certificate_number": generate_certificate_number(),
+                    "issued_at": now,
+                    "completed_at": row.completed_at or now,
+                    "instructor_name": instructor_name,
+                    "course_title": course.title,
+                    "student_name": row.name,
+                    "grade": certificate_grade(row.progress_percentage),
+                }
+                for row in rows
+            ]).on_conflict_do_nothing().returning(Certificate.id)
+        )
+        issued += len(result.all())
+        await db.commit()
+        batches += 1
+    
+    return CertificateBatchResponse(course_id=course.id, issued=issued, batches=batches)
+
+@router.post("/issue/{course_id}", response_model=CertificateBatchResponse)
+async def issue_certificates(
+    course_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Issue certificates to everyone who completed a course (instructors and admins only)"""
+    if current_user.role.value not in ("instructor", "admin"):
+        raise HTTPException(status_code=403, detail="Not authorized to issue certificates")
+    
+    result = await db.execute(
+        select(Course).where(Course.id == course_id).options(selectinload(Course.instructor))
+    )
+    course = result.scalar_one_or_none()
+    if not course:
+        raise HTTPException(status_code=404, detail="Course not found")
+    
+    return await issue_course_certificates(db, course)
+
 @router.get("/course/{course_id}", response_model=CertificateResponse)
-def get_certificate_by_course(
+async def get_certificate_by_course(
     course_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get certificate for a specific course"""
-    certificate = db.query(Certificate).filter(
-        Certificate.user_id == current_user.id,
-        Certificate.course_id == course_id
-    ).first()
+    result = await db.execute(
+        select(Certificate).where(
+            Certificate.user_id == current_user.id,
+            Certificate.course_id == course_id
+        )
+    )
+    certificate = result.scalars().first()
     
     if not certificate:
         raise HTTPException(status_code=404, detail="Certificate not found for this course")
@@ -156,39 +391,32 @@ def get_certificate_by_course(
     return certificate
 
 @router.get("/verify/{certificate_number}", response_model=CertificateDetail)
-def verify_certificate(
+async def verify_certificate(
     certificate_number: str,
-    db: Session = Depends(get_db)
+    request: Request
 ):
     """Verify a certificate by its certificate number (public endpoint)"""
-    certificate = db.query(Certificate).filter(
-        Certificate.certificate_number == certificate_number
-    ).first()
+    cert_detail = verified_certificates.get(certificate_number)
+    if cert_detail is not None:
+        CERTIFICATE_VERIFICATIONS.inc(result="cache_hit")
+        return cert_detail
     
-    if not certificate:
+    certificate_filter.refresh()
+    if certificate_filter.definitely_missing(certificate_number):
+        CERTIFICATE_VERIFICATIONS.inc(result="filter_reject")
         raise HTTPException(status_code=404, detail="Certificate not found")
     
-    # Get course details
-    course = db.query(Course).filter(Course.id == certificate.course_id).first()
+    async with read_session(request) as db:
+        result = await db.execute(
+            _certificate_detail_query().where(Certificate.certificate_number == certificate_number)
+        )
+        row = result.first()
     
-    cert_detail = CertificateDetail(
-        id=certificate.id,
-        user_id=certificate.user_id,
-        course_id=certificate.course_id,
-        certificate_number=certificate.certificate_number,
-        issued_at=certificate.issued_at,
-        completed_at=certificate.completed_at,
-        instructor_name=certificate.instructor_name,
-        course_title=certificate.course_title,
-        student_name=certificate.student_name,
-        grade=certificate.grade,
-        course_thumbnail=course.thumbnail if course else None,
-        course_category=course.category if course else None,
-        course_duration=course.duration if course else None
-    )
+    if not row:
+        CERTIFICATE_VERIFICATIONS.inc(result="not_found")
+        raise HTTPException(status_code=404, detail="Certificate not found")
     
+    CERTIFICATE_VERIFICATIONS.inc(result="database")
+    cert_detail = _certificate_detail(row)
+    verified_certificates.set(certificate_number, cert_detail)
     return cert_detail
-
-
-
-
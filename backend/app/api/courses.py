@@ -1,17 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List, Optional
+import time
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import and_, event, exists, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, noload, object_session, selectinload
+from typing import List, Optional, Union
 from pydantic import BaseModel
 
-from ..core.database import get_db
+from ..core.cache import VersionedCache
+from ..core.config import settings
+from ..core.database import dialect_insert, get_db
+from ..core.etag import etag_matches, make_etag
+from ..core.metrics import counter
+from ..core.pagination import apply_keyset, split_page
+from ..core.replica import get_read_db, read_session, replica_router
+from ..core.serialization import dumps, row_dicts, schema_columns
 from ..models.user import User
-from ..models.course import Course, Enrollment
+from ..models.course import Course, Enrollment, Lesson
 from ..models.certificate import Certificate
-from ..schemas.course import CourseCreate, CourseResponse, EnrollmentCreate, EnrollmentResponse
+from ..schemas.course import (
+    BulkEnrollmentRequest,
+    BulkEnrollmentResponse,
+    CourseCreate,
+    CoursePage,
+    CourseResponse,
+    EnrollmentCreate,
+    EnrollmentResponse,
+    LessonResponse
+)
 from .auth import get_current_user
 
 router = APIRouter()
 
+# Users enrolled per INSERT ... SELECT statement in bulk enrollment
+ENROLLMENT_BATCH_SIZE = 500
+
 class CourseDetailResponse(CourseResponse):
     """Extended course response with user-specific info"""
     has_certificate: bool = False
@@ -19,46 +42,183 @@ class CourseDetailResponse(CourseResponse):
     enrollment_progress: float = 0.0
     is_enrolled: bool = False
 
-@router.get("/", response_model=List[CourseResponse])
-def get_courses(
+# Serialized catalog bodies + ETags keyed by (version, query params)
+catalog_cache = VersionedCache(
+    maxsize=settings.CATALOG_CACHE_MAX_SIZE,
+    ttl=settings.CATALOG_CACHE_TTL_SECONDS
+)
+# Catalog pages are built from Core rows rather than hydrated ORM objects
+_course_columns = schema_columns(Course, CourseResponse)
+_lesson_columns = schema_columns(Lesson, LessonResponse)
+
+counter(
+    "catalog_cache_hits_total",
+    "Course catalog requests served from the in-process cache",
+    function=lambda: catalog_cache.hits
+)
+counter(
+    "catalog_cache_misses_total",
+    "Course catalog requests that queried the database",
+    function=lambda: catalog_cache.misses
+)
+
+# Catalog writes only mark the session; the bump waits for commit, or a read
+# in between could cache pre-commit rows under the new version
+_CATALOG_TABLES = (Course.__table__, Lesson.__table__)
+
+@event.listens_for(Course, "after_insert")
+@event.listens_for(Course, "after_update")
+@event.listens_for(Course, "after_delete")
+@event.listens_for(Lesson, "after_insert")
+@event.listens_for(Lesson, "after_update")
+@event.listens_for(Lesson, "after_delete")
+def _note_catalog_flush(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info["catalog_changed"] = True
+
+@event.listens_for(Session, "do_orm_execute")
+def _note_catalog_statement(orm_execute_state):
+    state = orm_execute_state
+    if (state.is_insert or state.is_update or state.is_delete) and state.statement.table in _CATALOG_TABLES:
+        state.session.info["catalog_changed"] = True
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_catalog(session):
+    if session.info.pop("catalog_changed", False):
+        catalog_cache.bump()
+
+@event.listens_for(Session, "after_rollback")
+def _discard_catalog_change(session):
+    session.info.pop("catalog_changed", None)
+
+def _lessons_option(include_lessons: bool):
+    """Load all lessons for a page of courses in one batched query, or not at all"""
+    return selectinload(Course.lessons) if include_lessons else noload(Course.lessons)
+
+async def _attach_lessons(db: AsyncSession, courses: List[dict], include_lessons: bool) -> None:
+    """Fill each course's `lessons` from one query over the whole page"""
+    by_course = {}
+    for course in courses:
+        course["lessons"] = by_course[course["id"]] = []
+    if not include_lessons or not by_course:
+        return
+    result = await db.execute(
+        select(*_lesson_columns)
+        .where(Lesson.course_id.in_(by_course))
+        .order_by(Lesson.course_id, Lesson.id)
+    )
+    for row in result:
+        by_course[row.course_id].append(row._asdict())
+
+async def _render_courses(
+    db: AsyncSession,
+    skip: int,
+    limit: int,
+    cursor: Optional[str],
+    include_lessons: bool
+) -> bytes:
+    stmt = select(*_course_columns)
+    
+    if cursor is None:
+        result = await db.execute(stmt.offset(skip).limit(limit))
+        courses = row_dicts(result)
+        await _attach_lessons(db, courses, include_lessons)
+        return dumps(courses)
+    
+    try:
+        stmt = apply_keyset(stmt, Course.id, cursor, limit)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    result = await db.execute(stmt)
+    rows, next_cursor = split_page(result.all(), limit)
+    courses = row_dicts(rows)
+    await _attach_lessons(db, courses, include_lessons)
+    return dumps({"items": courses, "next_cursor": next_cursor})
+
+@router.get("/", response_model=Union[CoursePage, List[CourseResponse]])
+async def get_courses(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    include_lessons: bool = True,
     current_user: User = Depends(get_current_user)
 ):
-    courses = db.query(Course).offset(skip).limit(limit).all()
-    return courses
+    """
+    List courses. Passing `cursor` (empty for the first page) switches to
+    keyset pagination and returns a page with `next_cursor`; without it the
+    legacy skip/limit list is returned.
+    
+    Responses are served from an in-process cache with a strong ETag, so a
+    matching If-None-Match gets a 304 without touching the database. Send
+    `X-Cache-Bypass: 1` to force a fresh read.
+    """
+    bypass = request.headers.get("x-cache-bypass") == "1"
+    version = catalog_cache.version
+    key = (version, skip, limit, cursor, include_lessons)
+    
+    cached = None if bypass else catalog_cache.get(key)
+    if cached is None:
+        # Only a miss opens a session, so hits and 304s never check out a connection
+        async with read_session(request) as db:
+            body = await _render_courses(db, skip, limit, cursor, include_lessons)
+            from_replica = db.info["replica"]
+        cached = (body, make_etag(body))
+        # Right after a bump the replica may not have the change yet; caching its
+        # answer would pin the stale catalog under the new version until the TTL
+        settling = time.monotonic() - catalog_cache.bumped_at < replica_router.max_lag
+        if not bypass and not (settling and from_replica):
+            catalog_cache.set(key, cached)
+        cache_status = "BYPASS" if bypass else "MISS"
+    else:
+        cache_status = "HIT"
+    
+    body, etag = cached
+    headers = {"ETag": etag, "X-Cache": cache_status, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 @router.get("/my-courses", response_model=List[CourseResponse])
-def get_my_courses(
-    db: Session = Depends(get_db),
+async def get_my_courses(
+    include_lessons: bool = True,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    enrollments = db.query(Enrollment).filter(Enrollment.user_id == current_user.id).all()
-    courses = [enrollment.course for enrollment in enrollments]
-    return courses
+    result = await db.execute(
+        select(Course)
+        .join(Enrollment, Enrollment.course_id == Course.id)
+        .where(Enrollment.user_id == current_user.id)
+        .order_by(Enrollment.id)
+        .options(_lessons_option(include_lessons))
+    )
+    return result.scalars().all()
 
 @router.get("/{course_id}", response_model=CourseDetailResponse)
-def get_course(
+async def get_course(
     course_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
-    course = db.query(Course).filter(Course.id == course_id).first()
-    if not course:
+    # Course, the user's certificate and enrollment in a single round trip
+    result = await db.execute(
+        select(Course, Certificate.id, Enrollment.id, Enrollment.progress_percentage)
+        .outerjoin(
+            Certificate,
+            and_(Certificate.course_id == Course.id, Certificate.user_id == current_user.id)
+        )
+        .outerjoin(
+            Enrollment,
+            and_(Enrollment.course_id == Course.id, Enrollment.user_id == current_user.id)
+        )
+        .where(Course.id == course_id)
+        .limit(1)
+    )
+    row = result.first()
+    if not row:
         raise HTTPException(status_code=404, detail="Course not found")
-    
-    # Check if user has a certificate for this course
-    certificate = db.query(Certificate).filter(
-        Certificate.user_id == current_user.id,
-        Certificate.course_id == course_id
-    ).first()
-    
-    # Check enrollment status and progress
-    enrollment = db.query(Enrollment).filter(
-        Enrollment.user_id == current_user.id,
-        Enrollment.course_id == course_id
-    ).first()
+    course, certificate_id, enrollment_id, enrollment_progress = row
     
     return CourseDetailResponse(
         id=course.id,
@@ -72,45 +232,97 @@ def get_course(
         instructor_id=course.instructor_id,
         created_at=course.created_at,
         updated_at=course.updated_at,
-        has_certificate=certificate is not None,
-        certificate_id=certificate.id if certificate else None,
-        enrollment_progress=enrollment.progress_percentage if enrollment else 0.0,
-        is_enrolled=enrollment is not None
+        has_certificate=certificate_id is not None,
+        certificate_id=certificate_id,
+        enrollment_progress=enrollment_progress if enrollment_id is not None else 0.0,
+        is_enrolled=enrollment_id is not None
     )
 
 @router.post("/", response_model=CourseResponse)
-def create_course(
+async def create_course(
     course_in: CourseCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     course = Course(**course_in.dict())
     db.add(course)
-    db.commit()
-    db.refresh(course)
+    await db.commit()
+    await db.refresh(course, attribute_names=["lessons"])
     return course
 
 @router.post("/{course_id}/enroll", response_model=EnrollmentResponse)
-def enroll_in_course(
+async def enroll_in_course(
     course_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    course = db.query(Course).filter(Course.id == course_id).first()
+    course = await db.get(Course, course_id)
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
     
-    existing_enrollment = db.query(Enrollment).filter(
-        Enrollment.user_id == current_user.id,
-        Enrollment.course_id == course_id
-    ).first()
+    result = await db.execute(
+        select(Enrollment).where(
+            Enrollment.user_id == current_user.id,
+            Enrollment.course_id == course_id
+        )
+    )
+    existing_enrollment = result.scalars().first()
     
     if existing_enrollment:
         raise HTTPException(status_code=400, detail="Already enrolled in this course")
     
     enrollment = Enrollment(user_id=current_user.id, course_id=course_id)
     db.add(enrollment)
-    db.commit()
-    db.refresh(enrollment)
+    await db.commit()
+    await db.refresh(enrollment)
     
     return enrollment
+
+@router.post("/{course_id}/enrollments", response_model=BulkEnrollmentResponse)
+async def bulk_enroll_in_course(
+    course_id: int,
+    enrollment_in: BulkEnrollmentRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Enroll many users in a course at once, skipping those already enrolled"""
+    if current_user.role.value not in ("instructor", "admin"):
+        raise HTTPException(status_code=403, detail="Not authorized to enroll other users")
+    
+    course = await db.get(Course, course_id)
+    if not course:
+        raise HTTPException(status_code=404, detail="Course not found")
+    
+    user_ids = sorted(set(enrollment_in.user_ids))
+    enrolled_at = datetime.utcnow()
+    known_user_ids = set()
+    created = 0
+    
+    for start in range(0, len(user_ids), ENROLLMENT_BATCH_SIZE):
+        batch = user_ids[start:start + ENROLLMENT_BATCH_SIZE]
+        
+        result = await db.execute(select(User.id).where(User.id.in_(batch)))
+        known_user_ids.update(result.scalars().all())
+        
+        # Existing rows are skipped by NOT EXISTS, concurrent inserts by ON CONFLICT
+        already_enrolled = exists().where(
+            Enrollment.course_id == course_id,
+            Enrollment.user_id == User.id
+        )
+        stmt = dialect_insert(Enrollment).from_select(
+            ["user_id", "course_id", "enrolled_at", "progress_percentage"],
+            select(User.id, literal(course_id), literal(enrolled_at), literal(0.0))
+            .where(User.id.in_(batch), ~already_enrolled)
+        ).on_conflict_do_nothing().returning(Enrollment.id)
+        result = await db.execute(stmt)
+        created += len(result.all())
+    
+    await db.commit()
+    
+    return BulkEnrollmentResponse(
+        course_id=course_id,
+        requested=len(user_ids),
+        created=created,
+        already_enrolled=len(known_user_ids) - created,
+        unknown_user_ids=[user_id for user_id in user_ids if user_id not in known_user_ids]
+    )
@@ -0,0 +1,453 @@
+import asyncio
+import bisect
+import calendar
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import delete, distinct, func, or_, select, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.database import dialect_insert, get_db, is_sqlite
+from ..models.user import User, UserRole
+from ..models.course import Enrollment
+from ..models.progress import Progress
+from ..models.leaderboard import (
+    DailyActivity,
+    LeaderboardEntry,
+    LeaderboardSnapshot,
+    LeaderboardSnapshotEntry,
+    LeaderboardState
+)
+from ..schemas.leaderboard import (
+    LeaderboardEntryResponse,
+    LeaderboardRebuildResponse,
+    WindowEntryResponse,
+    WindowLeaderboardResponse
+)
+from .auth import get_current_user
+
+router = APIRouter()
+
+TOTAL_FIELDS = ("total_points", "courses_completed", "current_streak", "total_time_spent")
+
+# Entries changed shortly before the last sync are re-read to cover late commits
+SYNC_OVERLAP = timedelta(seconds=30)
+
+# A window is finished (and frozen) once this long past its last day, leaving
+# time for buffered progress to reach its daily buckets
+WINDOW_SETTLE_TIME = timedelta(hours=1)
+MAX_WINDOW_DAYS = 366
+
+def _sort_key(entry: dict) -> tuple:
+    return (-entry["total_points"], -entry["courses_completed"], entry["user_id"])
+
+class LeaderboardIndex:
+    """
+    In-memory ranking of student leaderboard entries. Entries are kept in a
+    sorted list, so top-N is a slice and a rank is one bisection. Each worker
+    periodically pulls entries changed since its last sync, and reloads
+    everything when another worker has rebuilt the table.
+    """
+
+    def __init__(self, sync_interval: float):
+        self.sync_interval = sync_interval
+        self._entries: Dict[int, dict] = {}
+        self._order: List[tuple] = []
+        self._synced_until: Optional[datetime] = None
+        self._generation: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def put(self, entry: dict) -> None:
+        self.discard(entry["user_id"])
+        self._entries[entry["user_id"]] = entry
+        bisect.insort(self._order, _sort_key(entry))
+
+    def discard(self, user_id: int) -> None:
+        entry = self._entries.pop(user_id, None)
+        if entry is not None:
+            del self._order[bisect.bisect_left(self._order, _sort_key(entry))]
+
+    def get(self, user_id: int) -> Optional[dict]:
+        return self._entries.get(user_id)
+
+    def top(self, limit: int) -> List[dict]:
+        return [self._entries[key[2]] for key in self._order[:limit]]
+
+    def rank(self, entry: dict) -> int:
+        """1-based position of entry, whether or not it is in the index"""
+        return bisect.bisect_left(self._order, _sort_key(entry)) + 1
+
+    def reset(self) -> None:
+        self._entries.clear()
+        self._order.clear()
+        self._synced_until = None
+        self._generation = None
+        self._checked_at = 0.0
+
+    async def sync(self, db: AsyncSession, force: bool = False) -> None:
+        if not force and time.monotonic() - self._checked_at < self.sync_interval:
+            return
+        async with self._lock:
+            if not force and time.monotonic() - self._checked_at < self.sync_interval:
+                return
+            started = datetime.utcnow()
+            generation = (await db.execute(
+                select(LeaderboardState.generation).where(LeaderboardState.id == 1)
+            )).scalar_one_or_none() or 0
+            if generation != self._generation:
+                # Rebuilt since we loaded: rows it dropped must go, so start over
+                self._entries.clear()
+                self._order.clear()
+                self._synced_until = None
+                self._generation = generation
+            stmt = select(LeaderboardEntry, User.name, User.avatar, User.role).join(
+                User, User.id == LeaderboardEntry.user_id
+            )
+            if self._synced_until is not None:
+                stmt = stmt.where(LeaderboardEntry.updated_at > self._synced_until - SYNC_OVERLAP)
+            result = await db.execute(stmt)
+            for row, name, avatar, role in result.all():
+                if role != UserRole.STUDENT:
+                    self.discard(row.user_id)
+                    continue
+                entry = {"user_id": row.user_id, "name": name, "avatar": avatar}
+                entry.update({field: getattr(row, field) for field in TOTAL_FIELDS})
+                self.put(entry)
+            self._synced_until = started
+            self._checked_at = time.monotonic()
+
+leaderboard_index = LeaderboardIndex(settings.LEADERBOARD_SYNC_SECONDS)
+
+async def apply_leaderboard_deltas(
+    db: AsyncSession,
+    deltas: Dict[int, dict],
+    refresh_streaks: bool = False
+) -> None:
+    """
+    Add per-user deltas (total_points, total_time_spent, courses_completed)
+    to the persisted totals inside the caller's transaction.
+    """
+    if not deltas:
+        return
+    now = datetime.utcnow()
+    entries = LeaderboardEntry.__table__
+    insert_stmt = dialect_insert(entries)
+    excluded = insert_stmt.excluded
+    await db.execute(
+        insert_stmt.on_conflict_do_update(
+            index_elements=[entries.c.user_id],
+            set_={
+                "total_points": entries.c.total_points + excluded.total_points,
+                "total_time_spent": entries.c.total_time_spent + excluded.total_time_spent,
+                "courses_completed": entries.c.courses_completed + excluded.courses_completed,
+                "updated_at": excluded.updated_at,
+            }
+        ),
+        [
+            {
+                "user_id": user_id,
+                "total_points": delta.get("total_points", 0),
+                "total_time_spent": delta.get("total_time_spent", 0),
+                "courses_completed": delta.get("courses_completed", 0),
+                "current_streak": 0,
+                "updated_at": now,
+            }
+            for user_id, delta in deltas.items()
+        ]
+    )
+
+    if refresh_streaks:
+        # The streak is the best current streak across the user's courses
+        await db.execute(
+            update(entries)
+            .where(entries.c.user_id.in_(list(deltas)))
+            .values(current_streak=func.coalesce(
+                select(func.max(Progress.streak))
+                .where(Progress.user_id == entries.c.user_id)
+                .scalar_subquery(),
+                0
+            ))
+        )
+
+async def record_daily_activity(db: AsyncSession, activity: Dict[Tuple[int, date], dict]) -> None:
+    """Add points/time deltas to each (user_id, day) bucket inside the caller's transaction"""
+    if not activity:
+        return
+    buckets = DailyActivity.__table__
+    insert_stmt = dialect_insert(buckets)
+    excluded = insert_stmt.excluded
+    await db.execute(
+        insert_stmt.on_conflict_do_update(
+            index_elements=[buckets.c.user_id, buckets.c.day],
+            set_={
+                "points": buckets.c.points + excluded.points,
+                "time_spent": buckets.c.time_spent + excluded.time_spent,
+            }
+        ),
+        [
+            {"user_id": user_id, "day": day, "points": delta["points"], "time_spent": delta["time_spent"]}
+            for (user_id, day), delta in activity.items()
+        ]
+    )
+
+async def _recompute_totals(db: AsyncSession) -> Dict[int, dict]:
+    """Aggregate totals from progress and enrollments separately (no join fan-out)"""
+    progress_totals = (
+        select(
+            Progress.user_id,
+            func.sum(Progress.points).label("total_points"),
+            func.sum(Progress.time_spent).label("total_time_spent"),
+            func.max(Progress.streak).label("current_streak")
+        )
+        .group_by(Progress.user_id)
+        .subquery()
+    )
+    completions = (
+        select(
+            Enrollment.user_id,
+            func.count(distinct(Enrollment.course_id)).label("courses_completed")
+        )
+        .where(Enrollment.completed_at.isnot(None))
+        .group_by(Enrollment.user_id)
+        .subquery()
+    )
+    result = await db.execute(
+        select(
+            User.id,
+            func.coalesce(progress_totals.c.total_points, 0),
+            func.coalesce(completions.c.courses_completed, 0),
+            func.coalesce(progress_totals.c.current_streak, 0),
+            func.coalesce(progress_totals.c.total_time_spent, 0)
+        )
+        .outerjoin(progress_totals, progress_totals.c.user_id == User.id)
+        .outerjoin(completions, completions.c.user_id == User.id)
+        .where(or_(progress_totals.c.user_id.isnot(None), completions.c.user_id.isnot(None)))
+    )
+    return {
+        user_id: dict(zip(TOTAL_FIELDS, map(int, totals)))
+        for user_id, *totals in result.all()
+    }
+
+async def _begin_rebuild(db: AsyncSession) -> None:
+    """
+    Block delta writes until this transaction commits, then move to the next
+    generation. Flushes already past their upsert are waited for (and so are
+    in the recomputed totals); later ones add onto the rebuilt rows.
+    """
+    if not is_sqlite:
+        # Conflicts with the upserts' ROW EXCLUSIVE lock but not with reads
+        await db.execute(text("LOCK TABLE leaderboard_entries IN EXCLUSIVE MODE"))
+    # On SQLite this first write takes the database write lock instead
+    state = LeaderboardState.__table__
+    upsert = dialect_insert(state).values(id=1, generation=1, rebuilt_at=datetime.utcnow())
+    await db.execute(upsert.on_conflict_do_update(
+        index_elements=[state.c.id],
+        set_={"generation": state.c.generation + 1, "rebuilt_at": upsert.excluded.rebuilt_at}
+    ))
+
+async def rebuild_leaderboard(db: AsyncSession, dry_run: bool = False) -> LeaderboardRebuildResponse:
+    """Recompute every entry from source tables and report where the stored totals drifted"""
+    if not dry_run:
+        await _begin_rebuild(db)
+    expected = await _recompute_totals(db)
+    result = await db.execute(select(LeaderboardEntry))
+    stored = {
+        entry.user_id: {field: getattr(entry, field) for field in TOTAL_FIELDS}
+        for entry in result.scalars().all()
+    }
+    zero = dict.fromkeys(TOTAL_FIELDS, 0)
+    mismatches = sum(
+        1 for user_id in expected.keys() | stored.keys()
+        if expected.get(user_id, zero) != stored.get(user_id, zero)
+    )
+
+    if not dry_run:
+        now = datetime.utcnow()
+        await db.execute(delete(LeaderboardEntry))
+        if expected:
+            await db.execute(
+                LeaderboardEntry.__table__.insert(),
+                [{"user_id": user_id, "updated_at": now, **totals} for user_id, totals in expected.items()]
+            )
+        await db.commit()
+        leaderboard_index.reset()
+        await leaderboard_index.sync(db, force=True)
+
+    return LeaderboardRebuildResponse(users=len(expected), mismatches=mismatches)
+
+@router.get("/", response_model=List[LeaderboardEntryResponse])
+async def get_leaderboard(
+    limit: int = Query(default=10, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Top students by points, then completed courses"""
+    await leaderboard_index.sync(db)
+    return [
+        LeaderboardEntryResponse(rank=rank, **entry)
+        for rank, entry in enumerate(leaderboard_index.top(limit), start=1)
+    ]
+
+@router.get("/me", response_model=LeaderboardEntryResponse)
+async def get_my_rank(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """The current user's totals and position on the leaderboard"""
+    await leaderboard_index.sync(db)
+    entry = leaderboard_index.get(current_user.id) or {
+        "user_id": current_user.id,
+        "name": current_user.name,
+        "avatar": current_user.avatar,
+        **dict.fromkeys(TOTAL_FIELDS, 0)
+    }
+    return LeaderboardEntryResponse(rank=leaderboard_index.rank(entry), **entry)
+
+def resolve_window(
+    period: str,
+    on: Optional[date],
+    start: Optional[date],
+    end: Optional[date]
+) -> Tuple[date, date]:
+    """First and last day of the week/month containing `on`, or a custom range"""
+    on = on or datetime.utcnow().date()
+    if period == "week":
+        start = on - timedelta(days=on.weekday())
+        return start, start + timedelta(days=6)
+    if period == "month":
+        last_day = calendar.monthrange(on.year, on.month)[1]
+        return on.replace(day=1), on.replace(day=last_day)
+    if start is None or end is None:
+        raise HTTPException(status_code=400, detail="Custom windows need start and end dates")
+    if end < start or (end - start).days >= MAX_WINDOW_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Window must end after it starts and span at most {MAX_WINDOW_DAYS} days"
+        )
+    return start, end
+
+def _window_ranking(start: date, end: date):
+    """Students ranked by points summed over the window's daily buckets"""
+    totals = (
+        select(
+            DailyActivity.user_id,
+            func.sum(DailyActivity.points).label("points"),
+            func.sum(DailyActivity.time_spent).label("time_spent")
+        )
+        .where(DailyActivity.day >= start, DailyActivity.day <= end)
+        .group_by(DailyActivity.user_id)
+        .subquery()
+    )
+    return (
+        select(
+            func.row_number().over(
+                order_by=(totals.c.points.desc(), totals.c.time_spent.desc(), totals.c.user_id)
+            ).label("rank"),
+            totals.c.user_id,
+            User.name,
+            User.avatar,
+            totals.c.points,
+            totals.c.time_spent
+        )
+        .join(User, User.id == totals.c.user_id)
+        .where(User.role == UserRole.STUDENT)
+        .subquery()
+    )
+
+async def _get_or_create_snapshot(db: AsyncSession, start: date, end: date) -> int:
+    """Freeze a finished window's full ranking once; later reads never re-aggregate"""
+    lookup = select(LeaderboardSnapshot.id).where(
+        LeaderboardSnapshot.window_start == start,
+        LeaderboardSnapshot.window_end == end
+    )
+    snapshot_id = (await db.execute(lookup)).scalar_one_or_none()
+    if snapshot_id is not None:
+        return snapshot_id
+
+    ranking = _window_ranking(start, end)
+    rows = (await db.execute(
+        select(ranking.c.rank, ranking.c.user_id, ranking.c.points, ranking.c.time_spent)
+    )).all()
+    snapshot = LeaderboardSnapshot(window_start=start, window_end=end)
+    db.add(snapshot)
+    try:
+        await db.flush()
+        if rows:
+            await db.execute(
+                LeaderboardSnapshotEntry.__table__.insert(),
+                [{"snapshot_id": snapshot.id, **row._mapping} for row in rows]
+            )
+        await db.commit()
+    except IntegrityError:
+        # Another worker froze the same window first
+        await db.rollback()
+        return (await db.execute(lookup)).scalar_one()
+    return snapshot.id
+
+@router.get("/window", response_model=WindowLeaderboardResponse)
+async def get_window_leaderboard(
+    period: str = Query(default="week", pattern="^(week|month|custom)$"),
+    on: Optional[date] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    limit: int = Query(default=10, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Leaderboard for the week or month containing `on` (default today), or for
+    a custom start..end range. Finished weeks and months are snapshotted on
+    first read; custom ranges are always computed live and never stored.
+    """
+    start, end = resolve_window(period, on, start, end)
+    finished = datetime.utcnow() - WINDOW_SETTLE_TIME > datetime.combine(end, datetime.max.time())
+
+    # Only canonical windows are frozen, so callers can't fill the table with arbitrary ranges
+    if finished and period != "custom":
+        snapshot_id = await _get_or_create_snapshot(db, start, end)
+        ranking = (
+            select(
+                LeaderboardSnapshotEntry.rank,
+                LeaderboardSnapshotEntry.user_id,
+                User.name,
+                User.avatar,
+                LeaderboardSnapshotEntry.points,
+                LeaderboardSnapshotEntry.time_spent
+            )
+            .join(User, User.id == LeaderboardSnapshotEntry.user_id)
+            .where(LeaderboardSnapshotEntry.snapshot_id == snapshot_id)
+            .subquery()
+        )
+    else:
+        ranking = _window_ranking(start, end)
+
+    top = await db.execute(select(ranking).order_by(ranking.c.rank).limit(limit))
+    mine = await db.execute(select(ranking).where(ranking.c.user_id == current_user.id))
+    me = mine.first()
+
+    return WindowLeaderboardResponse(
+        start=start,
+        end=end,
+        finished=finished,
+        entries=[WindowEntryResponse(**row._mapping) for row in top.all()],
+        me=WindowEntryResponse(**me._mapping) if me else None
+    )
+
+@router.post("/rebuild", response_model=LeaderboardRebuildResponse)
+async def rebuild(
+    dry_run: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Recompute the leaderboard from progress and enrollments (admins only)"""
+    if current_user.role.value != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized to rebuild the leaderboard")
+    return await rebuild_leaderboard(db, dry_run=dry_run)
@@ -0,0 +1,292 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import bindparam, case, func, select, update
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal, dialect_insert, greatest, is_sqlite
+from ..core.metrics import counter, gauge, histogram
+from ..models.user import User
+from ..models.course import Enrollment
+from ..models.progress import Progress
+from ..schemas.progress import ProgressAccepted, ProgressUpdate
+from .auth import get_current_user
+from .leaderboard import apply_leaderboard_deltas, record_daily_activity
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+PROGRESS_UPDATES = counter(
+    "progress_updates_received_total",
+    "Progress heartbeats accepted into the write-behind buffer"
+)
+PROGRESS_ROWS_FLUSHED = counter(
+    "progress_rows_flushed_total",
+    "Coalesced progress rows written to the database",
+    ["result"]
+)
+PROGRESS_FLUSH_SECONDS = histogram(
+    "progress_flush_seconds",
+    "Time taken to upsert one batch of buffered progress"
+)
+
+def _is_transient(error: Exception) -> bool:
+    """Errors worth retrying on a later tick (database unreachable or busy)"""
+    if isinstance(error, DBAPIError) and error.connection_invalidated:
+        return True
+    return isinstance(error, (OperationalError, InterfaceError, OSError, asyncio.TimeoutError))
+
+def _previous_day(expression):
+    return func.date(expression, "-1 day") if is_sqlite else func.date(expression) - 1
+
+class BufferFull(Exception):
+    """Raised when the buffer holds max_rows rows and can't take a new one"""
+
+class ProgressBuffer:
+    """
+    Coalesces progress heartbeats per (user_id, course_id) in memory and
+    writes them as batched UPSERTs on a timer, when the buffer grows past
+    max_pending, and on shutdown. While the database is failing, rows are
+    held up to max_rows and size-triggered flushes wait for the next tick.
+    """
+
+    def __init__(self, flush_interval: float, max_pending: int, max_rows: int):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_rows = max_rows
+        self._pending: Dict[Tuple[int, int], dict] = {}
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._background = set()
+        self._retry_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, user_id: int, course_id: int, update: ProgressUpdate) -> None:
+        now = datetime.utcnow()
+        entry = self._pending.get((user_id, course_id))
+        if entry is None:
+            if len(self._pending) >= self.max_rows:
+                raise BufferFull()
+            entry = self._pending[(user_id, course_id)] = {
+                "completion_percentage": 0.0,
+                "time_spent": 0,
+                "points": 0,
+                "last_accessed": now,
+            }
+        if update.completion_percentage is not None:
+            entry["completion_percentage"] = max(
+                entry["completion_percentage"], update.completion_percentage
+            )
+        entry["time_spent"] += update.time_spent
+        entry["points"] += update.points
+        entry["last_accessed"] = now
+        PROGRESS_UPDATES.inc()
+        
+        # One size-triggered flush at a time, and none until the retry delay
+        # after a failure, so an outage doesn't turn each heartbeat into a query
+        if (
+            len(self._pending) >= self.max_pending
+            and not self._flush_lock.locked()
+            and time.monotonic() >= self._retry_at
+        ):
+            task = asyncio.create_task(self.flush())
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    def _restore(self, pending: Dict[Tuple[int, int], dict]) -> None:
+        """Merge a batch that failed to write back in front of newer updates"""
+        for key, entry in pending.items():
+            newer = self._pending.get(key)
+            if newer is not None:
+                entry["completion_percentage"] = max(
+                    entry["completion_percentage"], newer["completion_percentage"]
+                )
+                entry["time_spent"] += newer["time_spent"]
+                entry["points"] += newer["points"]
+                entry["last_accessed"] = newer["last_accessed"]
+            self._pending[key] = entry
+
+    async def flush(self) -> int:
+        """Write everything buffered so far; returns the number of rows upserted"""
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+            
+            start = time.perf_counter()
+            try:
+                written = await self._write(pending)
+                handled = len(pending)
+            except Exception as e:
+                if _is_transient(e):
+                    logger.exception("Progress flush failed; keeping %d rows buffered", len(pending))
+                    self._restore(pending)
+                    self._retry_at = time.monotonic() + self.flush_interval
+                    raise
+                # A permanent error (bad value, constraint) must not block everyone
+                # else's progress: find the offending rows by writing one at a time
+                logger.exception("Progress batch rejected; retrying %d rows individually", len(pending))
+                written, handled = await self._write_each(pending)
+            PROGRESS_FLUSH_SECONDS.observe(time.perf_counter() - start)
+            PROGRESS_ROWS_FLUSHED.inc(written, result="written")
+            PROGRESS_ROWS_FLUSHED.inc(handled - written, result="not_enrolled")
+            return written
+
+    async def _write_each(self, pending: Dict[Tuple[int, int], dict]) -> Tuple[int, int]:
+        """Write rows separately, dropping those the database rejects; returns (written, handled)"""
+        written = handled = 0
+        for key, entry in pending.items():
+            try:
+                written += await self._write({key: entry})
+                handled += 1
+            except Exception as e:
+                if _is_transient(e):
+                    self._restore({key: entry})
+                    continue
+                logger.error("Dropping progress for user %s, course %s: %s", key[0], key[1], e)
+                PROGRESS_ROWS_FLUSHED.inc(result="rejected")
+        return written, handled
+
+    async def _write(self, pending: Dict[Tuple[int, int], dict]) -> int:
+        async with AsyncSessionLocal() as db:
+            # Heartbeats are accepted without a lookup; drop those without an enrollment here
+            user_ids = {user_id for user_id, _ in pending}
+            result = await db.execute(
+                select(Enrollment.user_id, Enrollment.course_id)
+                .where(Enrollment.user_id.in_(user_ids))
+            )
+            enrolled = set(map(tuple, result.all()))
+            rows = [
+                {"user_id": user_id, "course_id": course_id, "streak": 1, **entry}
+                for (user_id, course_id), entry in pending.items()
+                if (user_id, course_id) in enrolled
+            ]
+            if not rows:
+                return 0
+            
+            progress = Progress.__table__
+            insert_stmt = dialect_insert(progress)
+            excluded = insert_stmt.excluded
+            upsert = insert_stmt.on_conflict_do_update(
+                index_elements=[progress.c.user_id, progress.c.course_id],
+                set_={
+                    "completion_percentage": greatest(
+                        func.coalesce(progress.c.completion_percentage, 0.0),
+                        excluded.completion_percentage
+                    ),
+                    "time_spent": func.coalesce(progress.c.time_spent, 0) + excluded.time_spent,
+                    "points": func.coalesce(progress.c.points, 0) + excluded.points,
+                    "streak": case(
+                        (func.date(progress.c.last_accessed) == func.date(excluded.last_accessed),
+                         progress.c.streak),
+                        (func.date(progress.c.last_accessed) == _previous_day(excluded.last_accessed),
+                         func.coalesce(progress.c.streak, 0) + 1),
+                        else_=1
+                    ),
+                    "last_accessed": excluded.last_accessed,
+                }
+            )
+            await db.execute(upsert, rows)
+            
+            deltas = {}
+            activity = {}
+            for row in rows:
+                delta = deltas.setdefault(row["user_id"], {"total_points": 0, "total_time_spent": 0})
+                delta["total_points"] += row["points"]
+                delta["total_time_spent"] += row["time_spent"]
+                bucket = activity.setdefault(
+                    (row["user_id"], row["last_accessed"].date()), {"points": 0, "time_spent": 0}
+                )
+                bucket["points"] += row["points"]
+                bucket["time_spent"] += row["time_spent"]
+            await apply_leaderboard_deltas(db, deltas, refresh_streaks=True)
+            await record_daily_activity(db, activity)
+            
+            # Keep enrollment progress (used for certificates) in step
+            completions = [
+                {
+                    "b_user_id": row["user_id"],
+                    "b_course_id": row["course_id"],
+                    "b_completion": row["completion_percentage"],
+                }
+                for row in rows
+                if row["completion_percentage"] > 0
+            ]
+            if completions:
+                enrollments = Enrollment.__table__
+                await db.execute(
+                    update(enrollments)
+                    .where(
+                        enrollments.c.user_id == bindparam("b_user_id"),
+                        enrollments.c.course_id == bindparam("b_course_id")
+                    )
+                    .values(progress_percentage=greatest(
+                        func.coalesce(enrollments.c.progress_percentage, 0.0),
+                        bindparam("b_completion")
+                    )),
+                    completions
+                )
+            await db.commit()
+            return len(rows)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                pass  # already logged; rows stay buffered for the next tick
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the timer and write out anything still buffered"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        await self.flush()
+
+progress_buffer = ProgressBuffer(
+    flush_interval=settings.PROGRESS_FLUSH_INTERVAL_SECONDS,
+    max_pending=settings.PROGRESS_FLUSH_MAX_PENDING,
+    max_rows=settings.PROGRESS_BUFFER_MAX_ROWS
+)
+
+gauge(
+    "progress_buffer_pending",
+    "Coalesced progress rows waiting to be flushed",
+    function=lambda: len(progress_buffer)
+)
+
+@router.post(
+    "/{course_id}",
+    response_model=ProgressAccepted,
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def record_progress(
+    course_id: int,
+    progress_in: ProgressUpdate,
+    current_user: User = Depends(get_current_user)
+):
+    """Record a progress heartbeat; it is written to the database asynchronously"""
+    try:
+        progress_buffer.add(current_user.id, course_id, progress_in)
+    except BufferFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Progress can't be saved right now, please retry shortly",
+            headers={"Retry-After": str(max(int(settings.PROGRESS_FLUSH_INTERVAL_SECONDS), 1))},
+        )
+    return ProgressAccepted()
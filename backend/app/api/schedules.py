@@ -0,0 +1,190 @@
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal, get_db
+from ..core.etag import etag_matches, make_etag
+from ..core.security import create_access_token, decode_access_token
+from ..models.user import User
+from ..models.course import Course, Enrollment
+from ..models.schedule import Schedule, ScheduleType
+from ..schemas.schedule import CalendarFeedResponse, ScheduleResponse
+from .auth import get_current_user
+
+router = APIRouter()
+
+MAX_RANGE = timedelta(days=366)
+FEED_BATCH_SIZE = 200
+FEED_SCOPE = "calendar"
+
+def _as_utc(value: datetime) -> datetime:
+    """Schedule times are stored as naive UTC"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def _overlapping(user_id: int, start: datetime, end: datetime) -> list:
+    """Filters for schedules of the user's enrolled courses overlapping [start, end)"""
+    enrolled = select(Enrollment.course_id).where(Enrollment.user_id == user_id)
+    return [
+        Schedule.course_id.in_(enrolled),
+        Schedule.start_time < end,
+        Schedule.end_time > start,
+    ]
+
+def _schedule_rows(user_id: int, start: datetime, end: datetime):
+    return (
+        select(
+            Schedule.id,
+            Schedule.course_id,
+            Course.title.label("course_title"),
+            Schedule.title,
+            # The default is Python-side only, so rows written in SQL may have no type
+            func.coalesce(Schedule.type, literal(ScheduleType.LIVE, Schedule.type.type)).label("type"),
+            Schedule.start_time,
+            Schedule.end_time,
+            Schedule.updated_at
+        )
+        .join(Course, Course.id == Schedule.course_id)
+        .where(*_overlapping(user_id, start, end))
+        .order_by(Schedule.start_time, Schedule.id)
+    )
+
+@router.get("/", response_model=List[ScheduleResponse])
+async def get_schedules(
+    start: datetime,
+    end: datetime,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Schedules of the caller's enrolled courses that overlap start..end"""
+    start, end = _as_utc(start), _as_utc(end)
+    if end <= start or end - start > MAX_RANGE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range must end after it starts and span at most {MAX_RANGE.days} days"
+        )
+    result = await db.execute(_schedule_rows(current_user.id, start, end))
+    return [ScheduleResponse(**row._mapping) for row in result.all()]
+
+@router.get("/feed", response_model=CalendarFeedResponse)
+async def get_calendar_feed_url(
+    request: Request,
+    current_user: User = Depends(get_current_user)
+):
+    """Subscription URL for the caller's calendar feed (calendar apps can't send bearer headers)"""
+    token = create_access_token(
+        data={"sub": current_user.email, "scope": FEED_SCOPE},
+        expires_delta=timedelta(days=settings.SCHEDULE_FEED_TOKEN_EXPIRE_DAYS)
+    )
+    url = request.url_for("get_calendar_feed").include_query_params(token=token)
+    return CalendarFeedResponse(token=token, url=str(url))
+
+def _ics_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+def _ics_time(value: datetime) -> str:
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+def _fold(line: str) -> bytes:
+    """Fold a content line at 75 octets without splitting UTF-8 sequences (RFC 5545 3.1)"""
+    data = line.encode("utf-8")
+    chunks = []
+    limit = 75
+    while len(data) > limit:
+        cut = limit
+        while data[cut] & 0xC0 == 0x80:
+            cut -= 1
+        chunks.append(data[:cut])
+        data = data[cut:]
+        # Continuation lines start with a space
+        limit = 74
+    chunks.append(data)
+    return b"\r\n ".join(chunks) + b"\r\n"
+
+def _vevent(row) -> bytes:
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:schedule-{row.id}@edu-platform",
+        f"DTSTAMP:{_ics_time(row.updated_at or row.start_time)}",
+        f"DTSTART:{_ics_time(row.start_time)}",
+        f"DTEND:{_ics_time(row.end_time)}",
+        f"SUMMARY:{_ics_text(f'{row.course_title}: {row.title}')}",
+        f"CATEGORIES:{row.type.value.upper()}",
+        "END:VEVENT",
+    ]
+    return b"".join(_fold(line) for line in lines)
+
+async def _render_feed(user_id: int, start: datetime, end: datetime) -> AsyncIterator[bytes]:
+    yield b"".join(_fold(line) for line in (
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:-//{settings.PROJECT_NAME}//Schedule//EN",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_ics_text(settings.PROJECT_NAME)}",
+    ))
+    # The request session is closed by the time the body streams, so use our own
+    async with AsyncSessionLocal() as db:
+        stmt = _schedule_rows(user_id, start, end).execution_options(yield_per=FEED_BATCH_SIZE)
+        result = await db.stream(stmt)
+        async for rows in result.partitions():
+            yield b"".join(_vevent(row) for row in rows)
+    yield b"END:VCALENDAR\r\n"
+
+@router.get("/calendar.ics", name="get_calendar_feed")
+async def get_calendar_feed(
+    request: Request,
+    token: str = Query(...),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Streamed iCalendar feed of the token owner's schedules within the feed
+    window. An aggregate over the same rows forms the ETag, so unchanged
+    feeds are answered with 304 without reading any events.
+    """
+    payload = decode_access_token(token)
+    if payload is None or payload.get("scope") != FEED_SCOPE:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid feed token")
+    user_id = (await db.execute(
+        select(User.id).where(User.email == payload.get("sub"))
+    )).scalar_one_or_none()
+    if user_id is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid feed token")
+
+    # Day-aligned so the window (and the ETag) only moves once a day
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    start = today - timedelta(days=settings.SCHEDULE_FEED_PAST_DAYS)
+    end = today + timedelta(days=settings.SCHEDULE_FEED_FUTURE_DAYS)
+
+    version = (await db.execute(
+        select(
+            func.count(Schedule.id),
+            func.max(Schedule.id),
+            func.max(Schedule.updated_at),
+            func.max(Course.updated_at)
+        )
+        .join(Course, Course.id == Schedule.course_id)
+        .where(*_overlapping(user_id, start, end))
+    )).one()
+    etag = make_etag(f"{user_id}|{start.date()}|{'|'.join(map(str, version))}".encode())
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    return StreamingResponse(
+        _render_feed(user_id, start, end),
+        media_type="text/calendar; charset=utf-8",
+        headers=headers
+    )
@@ -0,0 +1,255 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import column, desc, event, func, literal_column, or_, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.database import get_db, is_sqlite
+from ..core.fulltext import MARK_END, MARK_START, fts5_query, render_highlight
+from ..core.prefix_index import PrefixIndex
+from ..models.user import User
+from ..models.course import Course, Lesson
+from ..schemas.search import AutocompleteHit, CourseSearchHit, LessonSearchHit, SearchResponse
+from .auth import get_current_user
+
+router = APIRouter()
+
+# Renames committed shortly before the last sync are re-read to cover late commits
+SYNC_OVERLAP = timedelta(seconds=30)
+
+def _course_item(course_id: int, title: str) -> tuple:
+    return ("course", course_id), title, {"type": "course", "id": course_id, "title": title, "course_id": course_id}
+
+def _lesson_item(lesson_id: int, course_id: int, title: str) -> tuple:
+    return ("lesson", lesson_id), title, {"type": "lesson", "id": lesson_id, "title": title, "course_id": course_id}
+
+class TitleTypeahead:
+    """
+    In-memory prefix index over course and lesson titles. Writes made in this
+    process are applied by mapper events; rows added elsewhere (other workers,
+    the content loader) are pulled by id/updated_at high-water marks, and a periodic
+    full rebuild drops anything deleted out of process.
+    """
+
+    def __init__(self, sync_interval: float, rebuild_interval: float):
+        self.sync_interval = sync_interval
+        self.rebuild_interval = rebuild_interval
+        self.index = PrefixIndex()
+        self.loaded = False
+        self._max_course_id = 0
+        self._max_lesson_id = 0
+        self._synced_until: Optional[datetime] = None
+        self._checked_at = 0.0
+        self._rebuilt_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def put_course(self, course_id: int, title: str) -> None:
+        self.index.add(*_course_item(course_id, title))
+        self._max_course_id = max(self._max_course_id, course_id)
+
+    def put_lesson(self, lesson_id: int, course_id: int, title: str) -> None:
+        self.index.add(*_lesson_item(lesson_id, course_id, title))
+        self._max_lesson_id = max(self._max_lesson_id, lesson_id)
+
+    def reset(self) -> None:
+        self.index.rebuild([])
+        self.loaded = False
+        self._max_course_id = self._max_lesson_id = 0
+        self._synced_until = None
+        self._checked_at = self._rebuilt_at = 0.0
+
+    async def sync(self, db: AsyncSession) -> None:
+        now = time.monotonic()
+        if self.loaded and now - self._checked_at < self.sync_interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            if self.loaded and now - self._checked_at < self.sync_interval:
+                return
+            started = datetime.utcnow()
+            if not self.loaded or now - self._rebuilt_at >= self.rebuild_interval:
+                await self._rebuild(db)
+                self._rebuilt_at = now
+            else:
+                await self._pull_changes(db)
+            self.loaded = True
+            self._synced_until = started
+            self._checked_at = time.monotonic()
+
+    async def _rebuild(self, db: AsyncSession) -> None:
+        courses = (await db.execute(select(Course.id, Course.title))).all()
+        lessons = (await db.execute(select(Lesson.id, Lesson.course_id, Lesson.title))).all()
+        self.index.rebuild(
+            [_course_item(*row) for row in courses] + [_lesson_item(*row) for row in lessons]
+        )
+        self._max_course_id = max((row.id for row in courses), default=0)
+        self._max_lesson_id = max((row.id for row in lessons), default=0)
+
+    async def _pull_changes(self, db: AsyncSession) -> None:
+        courses = await db.execute(
+            select(Course.id, Course.title).where(or_(
+                Course.id > self._max_course_id,
+                Course.updated_at > self._synced_until - SYNC_OVERLAP
+            ))
+        )
+        for course_id, title in courses.all():
+            self.put_course(course_id, title)
+        # Lessons have no updated_at; out-of-process lesson renames wait for the rebuild
+        lessons = await db.execute(
+            select(Lesson.id, Lesson.course_id, Lesson.title).where(Lesson.id > self._max_lesson_id)
+        )
+        for lesson_id, course_id, title in lessons.all():
+            self.put_lesson(lesson_id, course_id, title)
+
+typeahead = TitleTypeahead(settings.TYPEAHEAD_SYNC_SECONDS, settings.TYPEAHEAD_REBUILD_SECONDS)
+
+@event.listens_for(Course, "after_insert")
+@event.listens_for(Course, "after_update")
+def _index_course(mapper, connection, target):
+    if typeahead.loaded:
+        typeahead.put_course(target.id, target.title)
+
+@event.listens_for(Lesson, "after_insert")
+@event.listens_for(Lesson, "after_update")
+def _index_lesson(mapper, connection, target):
+    if typeahead.loaded:
+        typeahead.put_lesson(target.id, target.course_id, target.title)
+
+@event.listens_for(Course, "after_delete")
+def _unindex_course(mapper, connection, target):
+    typeahead.index.remove(("course", target.id))
+
+@event.listens_for(Lesson, "after_delete")
+def _unindex_lesson(mapper, connection, target):
+    typeahead.index.remove(("lesson", target.id))
+
+courses_fts = table("courses_fts", column("rowid"))
+lessons_fts = table("lessons_fts", column("rowid"))
+
+def course_search(text: str, limit: int):
+    """Courses matching text, best first, with rank and highlight columns"""
+    if is_sqlite:
+        query = fts5_query(text)
+        if query is None:
+            return None
+        fts = literal_column("courses_fts")
+        # bm25 is lower-is-better; weights favour title, then category, then description
+        score = func.bm25(fts, 10.0, 2.0, 5.0)
+        return (
+            select(
+                Course.id,
+                Course.title,
+                Course.category,
+                (-score).label("rank"),
+                func.snippet(fts, -1, MARK_START, MARK_END, "…", 16).label("highlight")
+            )
+            .select_from(courses_fts)
+            .join(Course, Course.id == courses_fts.c.rowid)
+            .where(fts.match(query))
+            .order_by(score, Course.id)
+            .limit(limit)
+        )
+    tsquery = func.websearch_to_tsquery("english", text)
+    vector = literal_column("courses.search_vector")
+    return (
+        select(
+            Course.id,
+            Course.title,
+            Course.category,
+            func.ts_rank_cd(vector, tsquery).label("rank"),
+            func.ts_headline(
+                "english",
+                func.concat_ws(" - ", Course.title, Course.description),
+                tsquery,
+                f"StartSel={MARK_START}, StopSel={MARK_END}, MaxWords=30, MinWords=10"
+            ).label("highlight")
+        )
+        .where(vector.op("@@")(tsquery))
+        .order_by(desc("rank"), Course.id)
+        .limit(limit)
+    )
+
+def lesson_search(text: str, limit: int):
+    """Lessons matching text, best first, with their course title"""
+    if is_sqlite:
+        query = fts5_query(text)
+        if query is None:
+            return None
+        fts = literal_column("lessons_fts")
+        score = func.bm25(fts, 10.0, 5.0)
+        return (
+            select(
+                Lesson.id,
+                Lesson.course_id,
+                Course.title.label("course_title"),
+                Lesson.title,
+                (-score).label("rank"),
+                func.snippet(fts, -1, MARK_START, MARK_END, "…", 16).label("highlight")
+            )
+            .select_from(lessons_fts)
+            .join(Lesson, Lesson.id == lessons_fts.c.rowid)
+            .join(Course, Course.id == Lesson.course_id)
+            .where(fts.match(query))
+            .order_by(score, Lesson.id)
+            .limit(limit)
+        )
+    tsquery = func.websearch_to_tsquery("english", text)
+    vector = literal_column("lessons.search_vector")
+    return (
+        select(
+            Lesson.id,
+            Lesson.course_id,
+            Course.title.label("course_title"),
+            Lesson.title,
+            func.ts_rank_cd(vector, tsquery).label("rank"),
+            func.ts_headline(
+                "english",
+                func.concat_ws(" - ", Lesson.title, Lesson.description),
+                tsquery,
+                f"StartSel={MARK_START}, StopSel={MARK_END}, MaxWords=30, MinWords=10"
+            ).label("highlight")
+        )
+        .join(Course, Course.id == Lesson.course_id)
+        .where(vector.op("@@")(tsquery))
+        .order_by(desc("rank"), Lesson.id)
+        .limit(limit)
+    )
+
+@router.get("/", response_model=SearchResponse)
+async def search(
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(default=10, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Ranked full-text search over course and lesson text, with highlighted fragments"""
+    courses, lessons = [], []
+    course_stmt, lesson_stmt = course_search(q, limit), lesson_search(q, limit)
+    if course_stmt is not None:
+        result = await db.execute(course_stmt)
+        courses = [
+            CourseSearchHit(**{**row._mapping, "highlight": render_highlight(row.highlight)})
+            for row in result.all()
+        ]
+    if lesson_stmt is not None:
+        result = await db.execute(lesson_stmt)
+        lessons = [
+            LessonSearchHit(**{**row._mapping, "highlight": render_highlight(row.highlight)})
+            for row in result.all()
+        ]
+    return SearchResponse(query=q, courses=courses, lessons=lessons)
+
+@router.get("/autocomplete", response_model=List[AutocompleteHit])
+async def autocomplete(
+    q: str = Query(min_length=1, max_length=100),
+    limit: int = Query(default=8, ge=1, le=20),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Course and lesson titles with a word starting with q, served from memory"""
+    await typeahead.sync(db)
+    return typeahead.index.search(q, limit)
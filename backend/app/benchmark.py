@@ -0,0 +1,212 @@
+"""
+Drive the real API endpoints and report throughput and latency percentiles
+
+Runs in-process against the ASGI app by default, or against a running server
+with --base-url. Request targets are picked with a seeded RNG, so two runs
+against the same dataset issue the same requests.
+
+Usage:
+    python -m app.generate_dataset --users 5000        # once, to create data
+    python -m app.benchmark --requests 500 --concurrency 20 --output run.json
+    python -m app.benchmark --baseline run.json         # exit 1 if p95 or throughput regress
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+from sqlalchemy import select
+
+from app.core.database import SessionLocal
+from app.models import Certificate, Course
+
+SCENARIOS = (
+    "login",
+    "catalog",
+    "course_detail",
+    "my_courses",
+    "certificate_verify",
+    "leaderboard_window",
+    "schedules",
+)
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(ordered, 50) * 1000,
+        "p95_ms": percentile(ordered, 95) * 1000,
+        "p99_ms": percentile(ordered, 99) * 1000,
+        "max_ms": (ordered[-1] if ordered else 0.0) * 1000,
+    }
+
+async def run_scenario(
+    send: Callable[[int], Awaitable[httpx.Response]],
+    requests: int,
+    concurrency: int,
+    warmup: int
+) -> Dict[str, float]:
+    """
+    Issue `requests` calls with at most `concurrency` in flight after a warmup.
+    Warmup uses targets 0..warmup-1 and the measured calls the ones after, so
+    measured requests don't start on entries the warmup already cached.
+    """
+    for i in range(warmup):
+        await send(i)
+
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(warmup, warmup + requests))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            started = time.perf_counter()
+            response = await send(i)
+            latencies.append(time.perf_counter() - started)
+            # 404s are expected: some verify lookups target unknown numbers on purpose
+            if response.status_code >= 400 and response.status_code != 404:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+def _targets(seed: int, count: int) -> Dict[str, list]:
+    """Course ids, certificate numbers and dates to request, sampled reproducibly from the database"""
+    rng = random.Random(seed)
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    with SessionLocal() as db:
+        course_ids = db.scalars(select(Course.id).order_by(Course.id)).all()
+        numbers = db.scalars(
+            select(Certificate.certificate_number).order_by(Certificate.id).limit(10000)
+        ).all()
+        if not course_ids:
+            raise SystemExit("❌ No courses found; run python -m app.generate_dataset first")
+    return {
+        "course_ids": [rng.choice(course_ids) for _ in range(count)],
+        # Every tenth lookup is for a number that doesn't exist
+        "certificate_numbers": [
+            rng.choice(numbers) if numbers and i % 10 else f"CERT-00000000-{rng.getrandbits(32):08X}"
+            for i in range(count)
+        ],
+        # Mostly finished weeks (snapshotted after the first read), some the current one
+        "window_days": [(today - timedelta(days=rng.randint(0, 90))).date() for _ in range(count)],
+        "schedule_starts": [today + timedelta(days=rng.randint(-30, 30)) for _ in range(count)],
+    }
+
+async def benchmark(args) -> Dict[str, Dict[str, float]]:
+    if args.base_url:
+        transport, base_url = None, args.base_url
+    else:
+        from app.main import app
+        transport, base_url = httpx.ASGITransport(app=app), "http://benchmark"
+
+    targets = _targets(args.seed, args.requests + args.warmup)
+    async with httpx.AsyncClient(transport=transport, base_url=base_url, timeout=30) as client:
+        credentials = {"username": args.email, "password": args.password}
+        login = await client.post("/api/auth/login", data=credentials)
+        if login.status_code != 200:
+            raise SystemExit(f"❌ Login as {args.email} failed ({login.status_code}); generate a dataset first")
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        senders = {
+            "login": lambda i: client.post("/api/auth/login", data=credentials),
+            "catalog": lambda i: client.get("/api/courses/", params={"limit": 20}, headers=headers),
+            "course_detail": lambda i: client.get(
+                f"/api/courses/{targets['course_ids'][i]}", headers=headers
+            ),
+            "my_courses": lambda i: client.get("/api/courses/my-courses", headers=headers),
+            "certificate_verify": lambda i: client.get(
+                f"/api/certificates/verify/{targets['certificate_numbers'][i]}"
+            ),
+            "leaderboard_window": lambda i: client.get(
+                "/api/leaderboard/window",
+                params={"period": "week", "on": targets["window_days"][i].isoformat()},
+                headers=headers
+            ),
+            "schedules": lambda i: client.get(
+                "/api/schedules/",
+                params={
+                    "start": targets["schedule_starts"][i].isoformat(),
+                    "end": (targets["schedule_starts"][i] + timedelta(days=30)).isoformat()
+                },
+                headers=headers
+            ),
+        }
+        results = {}
+        for name in args.scenarios:
+            # Login is bcrypt-bound; cap it so a run stays quick
+            requests = min(args.requests, 100) if name == "login" else args.requests
+            results[name] = await run_scenario(senders[name], requests, args.concurrency, args.warmup)
+            print_row(name, results[name])
+    return results
+
+def print_row(name: str, stats: Dict[str, float]) -> None:
+    print(
+        f"{name:<20} {stats['requests']:>6} {stats['errors']:>6} {stats['rps']:>9.1f} "
+        f"{stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f} {stats['max_ms']:>8.2f}"
+    )
+
+def compare(results: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Scenarios whose p95 latency or throughput is worse than baseline by more than tolerance"""
+    regressions = []
+    for name, stats in results.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        if stats["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {before['p95_ms']:.2f}ms -> {stats['p95_ms']:.2f}ms")
+        if stats["rps"] < before["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {before['rps']:.1f} -> {stats['rps']:.1f} req/s")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the API")
+    parser.add_argument("--base-url", help="Target a running server instead of the in-process app")
+    parser.add_argument("--email", default="bench0@example.com")
+    parser.add_argument("--password", default="benchmark")
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--output", help="Write results as JSON")
+    parser.add_argument("--baseline", help="Compare against a previous --output file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed regression vs baseline (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    print(f"{'scenario':<20} {'reqs':>6} {'errors':>6} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    results = asyncio.run(benchmark(args))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"❌ {regression}")
+        if regressions:
+            return 1
+        print(f"✅ Within {args.tolerance:.0%} of baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
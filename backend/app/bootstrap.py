@@ -0,0 +1,49 @@
+"""
+Create any missing tables and the full-text index. The API never issues DDL
+itself, so run this once per deploy (or after pulling model changes) before
+starting workers. Safe to re-run.
+
+Usage:
+    python -m app.bootstrap
+    python -m app.bootstrap --check     # exit 1 if tables are missing, change nothing
+"""
+
+import argparse
+import sys
+import time
+from typing import List, Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+
+import app.models  # noqa: F401  registers every model on Base.metadata
+from app.core.database import Base, get_engine
+from app.core.fulltext import ensure_search_index
+
+def missing_tables(bind: Optional[Engine] = None) -> List[str]:
+    existing = set(inspect(bind or get_engine()).get_table_names())
+    return sorted(set(Base.metadata.tables) - existing)
+
+def bootstrap_schema(bind: Optional[Engine] = None) -> None:
+    """Create missing tables and the search index (idempotent)"""
+    bind = bind or get_engine()
+    Base.metadata.create_all(bind=bind)
+    with bind.begin() as connection:
+        ensure_search_index(connection)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create or check the database schema")
+    parser.add_argument("--check", action="store_true", help="Only report missing tables")
+    args = parser.parse_args()
+
+    if args.check:
+        missing = missing_tables()
+        if missing:
+            print(f"❌ Missing tables: {', '.join(missing)}")
+            sys.exit(1)
+        print(f"✅ All {len(Base.metadata.tables)} tables present")
+        sys.exit(0)
+
+    started = time.perf_counter()
+    bootstrap_schema()
+    print(f"✅ Schema ready ({len(Base.metadata.tables)} tables) in {time.perf_counter() - started:.2f}s")
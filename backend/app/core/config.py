@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Literal, Optional
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "Employee Education Platform"
@@ -11,6 +11,61 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # Optional read replica for read-only endpoints; the primary is used while it lags or is down
+    DATABASE_REPLICA_URL: Optional[str] = None
+    REPLICA_MAX_LAG_SECONDS: float = 5.0
+    REPLICA_CHECK_SECONDS: float = 5.0
+    REPLICA_RETRY_SECONDS: float = 30.0
+    
+    # Postgres connection pool per engine. "pgbouncer" is for Neon's pooled (-pooler) endpoint:
+    # no client-side pool unless sized explicitly, and no server-side prepared statements.
+    # Unset sizes default to 10 + 20 overflow (direct) or 0, i.e. NullPool (pgbouncer)
+    DATABASE_POOL_MODE: Literal["direct", "pgbouncer"] = "direct"
+    DATABASE_POOL_SIZE: Optional[int] = None
+    DATABASE_MAX_OVERFLOW: Optional[int] = None
+    DATABASE_POOL_TIMEOUT: float = 30.0
+    DATABASE_POOL_RECYCLE: int = 3600
+    DATABASE_POOL_PRE_PING: bool = True
+    
+    # Authenticated user lookups are cached per token subject
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    
+    # bcrypt runs in a process pool; requests beyond workers + queue limit get a 503
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_LIMIT: int = 32
+    
+    # Serialized course catalog responses; the TTL bounds staleness from out-of-process writes
+    CATALOG_CACHE_TTL_SECONDS: int = 300
+    CATALOG_CACHE_MAX_SIZE: int = 256
+    
+    # Public certificate verification: read-through cache + Bloom filter of known numbers
+    CERTIFICATE_CACHE_TTL_SECONDS: int = 600
+    CERTIFICATE_CACHE_MAX_SIZE: int = 10000
+    CERTIFICATE_FILTER_REBUILD_SECONDS: int = 3600
+    
+    # Progress heartbeats are merged in memory and upserted in batches
+    PROGRESS_FLUSH_INTERVAL_SECONDS: float = 5.0
+    PROGRESS_FLUSH_MAX_PENDING: int = 5000
+    # Rows held while the database is failing; new rows past this get a 503
+    PROGRESS_BUFFER_MAX_ROWS: int = 50000
+    
+    # How often each worker pulls leaderboard changes made by other workers
+    LEADERBOARD_SYNC_SECONDS: float = 5.0
+    
+    # Calendar feeds cover this window around now; feed tokens are long-lived
+    SCHEDULE_FEED_PAST_DAYS: int = 90
+    SCHEDULE_FEED_FUTURE_DAYS: int = 365
+    SCHEDULE_FEED_TOKEN_EXPIRE_DAYS: int = 365
+    
+    # Typeahead index: incremental pull of new/renamed titles, periodic full rebuild
+    TYPEAHEAD_SYNC_SECONDS: float = 5.0
+    TYPEAHEAD_REBUILD_SECONDS: int = 600
+    
+    # Submission uploads live in a local content-addressed store
+    UPLOAD_DIR: str = "./uploads"
+    MAX_UPLOAD_SIZE: int = 50 * 1024 * 1024
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
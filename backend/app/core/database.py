@@ -1,51 +1,215 @@
-from sqlalchemy import create_engine
+import inspect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+from uuid import uuid4
+
+from fastapi import Request
+from sqlalchemy import create_engine, event, func
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
+from .pool import TimedNullPool, TimedQueuePool, instrument_pool, pgbouncer_mode, pool_options
 
 # Determine if using SQLite or PostgreSQL/NeonDB
 is_sqlite = "sqlite" in settings.DATABASE_URL
 
-# Configure engine based on database type
-if is_sqlite:
-    # SQLite configuration (for development/testing)
-    engine = create_engine(
-        settings.DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        echo=False
-    )
-else:
-    # PostgreSQL/NeonDB configuration (for production)
-    engine = create_engine(
-        settings.DATABASE_URL,
-        pool_pre_ping=True,        # Verify connections before using
-        pool_recycle=3600,          # Recycle connections after 1 hour
-        pool_size=10,               # Number of connections to maintain
-        max_overflow=20,            # Additional connections when pool is full
+def _is_sqlite_url(database_url: str) -> bool:
+    return make_url(database_url).get_backend_name() == "sqlite"
+
+def _create_engine(database_url: str) -> Engine:
+    """Sync engine used by scripts and schema bootstrap"""
+    if _is_sqlite_url(database_url):
+        # SQLite configuration (for development/testing)
+        return create_engine(
+            database_url,
+            poolclass=TimedQueuePool,
+            pool_logging_name="sync",
+            connect_args={"check_same_thread": False},
+            echo=False
+        )
+    # PostgreSQL/NeonDB configuration (for production); pool sizing comes from settings
+    connect_args = {"connect_timeout": 10}  # Connection timeout in seconds
+    if not pgbouncer_mode():
+        # PgBouncer rejects startup options; Neon sessions default to UTC anyway
+        connect_args["options"] = "-c timezone=utc"
+    return create_engine(
+        database_url,
         echo=False,                 # Set to True for SQL debugging
-        connect_args={
-            "connect_timeout": 10,  # Connection timeout in seconds
-            "options": "-c timezone=utc"  # Set timezone to UTC
-        }
+        connect_args=connect_args,
+        **pool_options(is_async=False, name="sync")
+    )
+
+def _async_database_url(database_url: str) -> URL:
+    """Map DATABASE_URL onto its async driver (aiosqlite / asyncpg)"""
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite")
+    # asyncpg doesn't understand libpq query parameters; sslmode is passed as connect arg
+    return url.set(drivername="postgresql+asyncpg").difference_update_query(
+        ["sslmode", "channel_binding"]
+    )
+
+def _create_async_engine(database_url: str, name: str) -> AsyncEngine:
+    """Async engine used by the API routers (primary or replica)"""
+    if _is_sqlite_url(database_url):
+        return create_async_engine(
+            _async_database_url(database_url),
+            poolclass=TimedNullPool,
+            pool_logging_name=name,
+            echo=False
+        )
+    async_connect_args = {"timeout": 10}
+    if pgbouncer_mode():
+        # Transaction pooling can hand each statement a different server
+        # connection, so prepared statements must not outlive one use
+        async_connect_args["statement_cache_size"] = 0
+        async_connect_args["prepared_statement_cache_size"] = 0
+        async_connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+    else:
+        async_connect_args["server_settings"] = {"timezone": "utc"}
+    sslmode = make_url(database_url).query.get("sslmode")
+    if sslmode:
+        async_connect_args["ssl"] = sslmode
+    return create_async_engine(
+        _async_database_url(database_url),
+        echo=False,
+        connect_args=async_connect_args,
+        **pool_options(is_async=True, name=name)
     )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+class QueryStats:
+    """Statements executed and time spent in the database on behalf of one request"""
+    __slots__ = ("statements", "seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.seconds = 0.0
+
+# Set by RequestMetricsMiddleware; SQLAlchemy's greenlets inherit it, so async
+# sessions report into the request that opened them
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and current_query_stats.get() is not None:
+        context._query_started = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = current_query_stats.get()
+    if stats is None:
+        return
+    stats.statements += 1
+    started = getattr(context, "_query_started", None)
+    if started is not None:
+        stats.seconds += time.perf_counter() - started
+
+def _instrument(target: Engine, name: str) -> None:
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target, "after_cursor_execute", _after_cursor_execute)
+    instrument_pool(target, name)
+
+# Engines are built on first use, so importing the app never loads a database
+# driver or opens a connection
+_engines: Dict[str, Any] = {}
+_engines_lock = threading.Lock()
+
+def get_engine() -> Engine:
+    with _engines_lock:
+        if "sync" not in _engines:
+            _engines["sync"] = _create_engine(settings.DATABASE_URL)
+            _instrument(_engines["sync"], "sync")
+        return _engines["sync"]
+
+def get_async_engine() -> AsyncEngine:
+    with _engines_lock:
+        if "async" not in _engines:
+            _engines["async"] = _create_async_engine(settings.DATABASE_URL, "primary")
+            _instrument(_engines["async"].sync_engine, "primary")
+        return _engines["async"]
+
+def get_replica_engine() -> Optional[AsyncEngine]:
+    """Async engine for DATABASE_REPLICA_URL, or None when no replica is configured"""
+    if not settings.DATABASE_REPLICA_URL:
+        return None
+    with _engines_lock:
+        if "replica" not in _engines:
+            _engines["replica"] = _create_async_engine(settings.DATABASE_REPLICA_URL, "replica")
+            _instrument(_engines["replica"].sync_engine, "replica")
+        return _engines["replica"]
+
+async def dispose_engines() -> None:
+    """Close pooled connections of whichever engines were created"""
+    with _engines_lock:
+        engines = list(_engines.values())
+    for created in engines:
+        result = created.dispose()
+        if inspect.isawaitable(result):
+            await result
+
+def __getattr__(name: str):
+    # `from app.core.database import engine` keeps working; it just builds the engine then
+    if name == "engine":
+        return get_engine()
+    if name == "async_engine":
+        return get_async_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+class _BindOnFirstUse:
+    """Session factory that binds to its engine when the first session is made"""
+
+    def __init__(self, engine_factory: Callable[[], Any], **kw):
+        super().__init__(**kw)
+        self._engine_factory = engine_factory
+
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None:
+            self.kw["bind"] = self._engine_factory()
+        return super().__call__(**local_kw)
+
+class _LazySessionmaker(_BindOnFirstUse, sessionmaker):
+    pass
+
+class _LazyAsyncSessionmaker(_BindOnFirstUse, async_sessionmaker):
+    pass
+
+SessionLocal = _LazySessionmaker(get_engine, autocommit=False, autoflush=False)
+
+# expire_on_commit=False: attributes can't be lazily refreshed under asyncio
+AsyncSessionLocal = _LazyAsyncSessionmaker(
+    get_async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 Base = declarative_base()
 
-def get_db():
-    """Dependency for getting database sessions"""
-    db = SessionLocal()
-    try:
+def dialect_insert(entity):
+    """INSERT construct with on_conflict_* support for the configured database"""
+    return sqlite_insert(entity) if is_sqlite else postgresql_insert(entity)
+
+def greatest(*expressions):
+    """GREATEST() on Postgres; SQLite's multi-argument max() does the same"""
+    return func.max(*expressions) if is_sqlite else func.greatest(*expressions)
+
+async def get_db(request: Request):
+    """Dependency for getting async database sessions (always the primary)"""
+    async with AsyncSessionLocal() as db:
+        if settings.DATABASE_REPLICA_URL:
+            # Identifies the caller so their reads can be pinned to the primary after a write
+            db.sync_session.info["writer_key"] = request.headers.get("authorization")
         yield db
-    finally:
-        db.close()
 
 def check_connection():
     """Check if database connection is working"""
     try:
-        with engine.connect() as connection:
-            connection.execute("SELECT 1")
+        with get_engine().connect() as connection:
+            connection.exec_driver_sql("SELECT 1")
         return True
     except Exception as e:
         print(f"❌ Database connection failed: {e}")
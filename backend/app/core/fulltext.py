@@ -0,0 +1,99 @@
+"""
+Full-text index over course and lesson text: a generated tsvector column with
+a GIN index on Postgres, FTS5 external-content tables on SQLite. Both are
+maintained by the database itself, so ORM writes, bulk inserts and the
+content loader all stay in sync.
+"""
+
+import html
+import re
+from typing import Optional
+
+from sqlalchemy.engine import Connection
+
+from .database import is_sqlite
+
+# Control characters survive both engines' highlighters and never occur in
+# catalog text, so matches can be marked before the text is HTML-escaped
+MARK_START = "\x02"
+MARK_END = "\x03"
+
+SQLITE_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS courses_fts USING fts5(
+        title, description, category,
+        content='courses', content_rowid='id', tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS courses_fts_ai AFTER INSERT ON courses BEGIN
+        INSERT INTO courses_fts(rowid, title, description, category)
+        VALUES (new.id, new.title, new.description, new.category);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS courses_fts_ad AFTER DELETE ON courses BEGIN
+        INSERT INTO courses_fts(courses_fts, rowid, title, description, category)
+        VALUES ('delete', old.id, old.title, old.description, old.category);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS courses_fts_au AFTER UPDATE OF title, description, category ON courses BEGIN
+        INSERT INTO courses_fts(courses_fts, rowid, title, description, category)
+        VALUES ('delete', old.id, old.title, old.description, old.category);
+        INSERT INTO courses_fts(rowid, title, description, category)
+        VALUES (new.id, new.title, new.description, new.category);
+    END""",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS lessons_fts USING fts5(
+        title, description,
+        content='lessons', content_rowid='id', tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS lessons_fts_ai AFTER INSERT ON lessons BEGIN
+        INSERT INTO lessons_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS lessons_fts_ad AFTER DELETE ON lessons BEGIN
+        INSERT INTO lessons_fts(lessons_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS lessons_fts_au AFTER UPDATE OF title, description ON lessons BEGIN
+        INSERT INTO lessons_fts(lessons_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO lessons_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+]
+
+POSTGRES_DDL = [
+    """ALTER TABLE courses ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(category, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'C')
+        ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_courses_search_vector ON courses USING GIN (search_vector)",
+    """ALTER TABLE lessons ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'C')
+        ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_lessons_search_vector ON lessons USING GIN (search_vector)",
+]
+
+def ensure_search_index(connection: Connection) -> None:
+    """Create the full-text index if missing (idempotent); runs after create_all"""
+    if not is_sqlite:
+        for statement in POSTGRES_DDL:
+            connection.exec_driver_sql(statement)
+        return
+    existing = connection.exec_driver_sql(
+        "SELECT count(*) FROM sqlite_master WHERE name IN ('courses_fts', 'lessons_fts')"
+    ).scalar()
+    for statement in SQLITE_DDL:
+        connection.exec_driver_sql(statement)
+    if existing < 2:
+        # Index rows written before the FTS tables existed
+        connection.exec_driver_sql("INSERT INTO courses_fts(courses_fts) VALUES ('rebuild')")
+        connection.exec_driver_sql("INSERT INTO lessons_fts(lessons_fts) VALUES ('rebuild')")
+
+def render_highlight(fragment: Optional[str]) -> str:
+    """HTML-escape a highlighted fragment and turn match markers into <mark> tags"""
+    return html.escape(fragment or "").replace(MARK_START, "<mark>").replace(MARK_END, "</mark>")
+
+def fts5_query(text: str) -> Optional[str]:
+    """Quote each word so user input can't use FTS5 query syntax; words are ANDed"""
+    words = re.findall(r"\w+", text)
+    return " ".join(f'"{word}"' for word in words) or None
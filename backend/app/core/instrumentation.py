@@ -0,0 +1,71 @@
+"""
+Per-route request latency and database statement metrics. Statement counts
+come from the cursor hooks in core.database; a jump in a route's
+db_statements_per_request is usually an N+1 query.
+"""
+
+import time
+
+from .database import QueryStats, current_query_stats
+from .metrics import histogram
+
+STATEMENT_BUCKETS = (0, 1, 2, 3, 4, 5, 7, 10, 15, 25, 50, 100)
+
+REQUEST_SECONDS = histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request to sending the last byte of its response",
+    ["method", "route", "status"]
+)
+DB_STATEMENTS_PER_REQUEST = histogram(
+    "db_statements_per_request",
+    "SQL statements executed while handling one request",
+    ["method", "route"],
+    buckets=STATEMENT_BUCKETS
+)
+DB_SECONDS_PER_REQUEST = histogram(
+    "db_seconds_per_request",
+    "Time spent executing SQL while handling one request",
+    ["method", "route"]
+)
+
+
+class RequestMetricsMiddleware:
+    """
+    Pure ASGI middleware so streamed bodies are timed to the end. Requests are
+    labelled with the route template (/api/courses/{course_id}), never the raw
+    path, to keep label cardinality bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            current_query_stats.reset(token)
+            # The router records the matched route in the shared scope
+            route = scope.get("route")
+            labels = {
+                "method": scope["method"],
+                "route": getattr(route, "path", "unmatched"),
+            }
+            REQUEST_SECONDS.observe(elapsed, status=status_code, **labels)
+            DB_STATEMENTS_PER_REQUEST.observe(stats.statements, **labels)
+            DB_SECONDS_PER_REQUEST.observe(stats.seconds, **labels)
@@ -0,0 +1,34 @@
+import base64
+import json
+from typing import List, Optional, Sequence, Tuple
+
+def encode_cursor(last_id: int) -> str:
+    """Opaque cursor pointing just past the row with the given id"""
+    raw = json.dumps({"id": last_id}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Optional[int]:
+    """Return the last seen id, or None for the first page; raises ValueError if malformed"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        last_id = json.loads(base64.urlsafe_b64decode(padded))["id"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(last_id, int):
+        raise ValueError("Invalid cursor")
+    return last_id
+
+def apply_keyset(stmt, id_column, cursor: str, limit: int):
+    """Restrict a select to the page after cursor, ordered by id, fetching one extra row"""
+    last_id = decode_cursor(cursor)
+    if last_id is not None:
+        stmt = stmt.where(id_column > last_id)
+    return stmt.order_by(id_column).limit(limit + 1)
+
+def split_page(rows: Sequence, limit: int) -> Tuple[List, Optional[str]]:
+    """Trim the look-ahead row and build the cursor for the next page"""
+    items = list(rows[:limit])
+    next_cursor = encode_cursor(items[-1].id) if len(rows) > limit and items else None
+    return items, next_cursor
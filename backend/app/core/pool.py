@@ -0,0 +1,162 @@
+"""
+Connection pool configuration and metrics. Pool classes are the stock
+SQLAlchemy ones with checkout timing added; sizing comes from Settings, with
+a "pgbouncer" mode for Neon's pooled endpoint where the server-side pooler
+owns the connections and each worker keeps few or none of its own.
+"""
+
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+from .config import settings
+from .metrics import counter, gauge, histogram
+
+POOL_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Mode defaults for (pool_size, max_overflow) when the settings leave them unset
+DIRECT_POOL = (10, 20)
+PGBOUNCER_POOL = (0, 0)
+
+POOL_CHECKOUT_SECONDS = histogram(
+    "db_pool_checkout_seconds",
+    "Time to get a connection from the pool, including waiting for a free one and connecting",
+    ["engine"],
+    buckets=POOL_BUCKETS
+)
+POOL_CHECKOUT_TIMEOUTS = counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after DATABASE_POOL_TIMEOUT with the pool exhausted",
+    ["engine"]
+)
+POOL_PRE_PING_SECONDS = histogram(
+    "db_pool_pre_ping_seconds",
+    "Time spent on the liveness ping before handing out a pooled connection",
+    ["engine"],
+    buckets=POOL_BUCKETS
+)
+POOL_CONNECTIONS_OPENED = counter(
+    "db_pool_connections_opened_total",
+    "New database connections opened",
+    ["engine"]
+)
+POOL_IN_USE = gauge(
+    "db_pool_connections_in_use",
+    "Connections currently checked out of the pool",
+    ["engine"]
+)
+
+_engines: Dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def _queue_pool_stat(stat) -> Dict[tuple, float]:
+    with _engines_lock:
+        engines = list(_engines.items())
+    # engine.pool is read at scrape time; dispose() swaps in a new pool
+    return {(name,): stat(engine.pool) for name, engine in engines if isinstance(engine.pool, QueuePool)}
+
+
+gauge(
+    "db_pool_size",
+    "Connections the pool keeps open",
+    ["engine"],
+    function=lambda: _queue_pool_stat(lambda pool: pool.size())
+)
+gauge(
+    "db_pool_idle",
+    "Open connections waiting in the pool",
+    ["engine"],
+    function=lambda: _queue_pool_stat(lambda pool: pool.checkedin())
+)
+gauge(
+    "db_pool_overflow",
+    "Connections open beyond the pool size",
+    ["engine"],
+    function=lambda: _queue_pool_stat(lambda pool: max(pool.overflow(), 0))
+)
+
+
+class _TimedCheckout:
+    """Times _do_get, the point where a checkout waits for or opens a connection"""
+
+    def _do_get(self):
+        engine = self._orig_logging_name or "default"
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.inc(engine=engine)
+            raise
+        finally:
+            POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - started, engine=engine)
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+class TimedNullPool(_TimedCheckout, NullPool):
+    pass
+
+
+def pgbouncer_mode() -> bool:
+    return settings.DATABASE_POOL_MODE == "pgbouncer"
+
+
+def pool_options(is_async: bool, name: str) -> dict:
+    """create_engine pool arguments for a Postgres engine"""
+    default_size, default_overflow = PGBOUNCER_POOL if pgbouncer_mode() else DIRECT_POOL
+    pool_size = default_size if settings.DATABASE_POOL_SIZE is None else settings.DATABASE_POOL_SIZE
+    if pool_size <= 0:
+        # Every checkout opens a fresh connection (cheap against a pooler), so there
+        # is nothing to pre-ping or recycle
+        return {"poolclass": TimedNullPool, "pool_logging_name": name}
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+        "pool_logging_name": name,
+        "pool_size": pool_size,
+        "max_overflow": default_overflow if settings.DATABASE_MAX_OVERFLOW is None else settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+
+
+def instrument_pool(engine: Engine, name: str) -> None:
+    """Report this engine's pool activity under engine=name"""
+    with _engines_lock:
+        _engines[name] = engine
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        POOL_CONNECTIONS_OPENED.inc(engine=name)
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        POOL_IN_USE.inc(engine=name)
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        POOL_IN_USE.dec(engine=name)
+
+    # Pre-ping has no event of its own; time the dialect's ping instead
+    ping = engine.dialect.do_ping
+
+    def timed_ping(dbapi_connection):
+        started = time.perf_counter()
+        try:
+            return ping(dbapi_connection)
+        finally:
+            POOL_PRE_PING_SECONDS.observe(time.perf_counter() - started, engine=name)
+
+    engine.dialect.do_ping = timed_ping
@@ -0,0 +1,98 @@
+import bisect
+import re
+import threading
+from typing import Any, Dict, Hashable, Iterable, List, Tuple
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def normalize(text: str) -> str:
+    """Case-fold and collapse punctuation/whitespace to single spaces"""
+    return _NON_WORD.sub(" ", text.casefold()).strip()
+
+
+def _word_suffixes(text: str) -> List[Tuple[str, int]]:
+    """Every suffix of the normalized text starting at a word, with its word position"""
+    normalized = normalize(text)
+    suffixes = []
+    position = 0
+    for match in re.finditer(r"\S+", normalized):
+        suffixes.append((normalized[match.start():], position))
+        position += 1
+    return suffixes
+
+
+class PrefixIndex:
+    """
+    Sorted array of (word suffix, position, key) entries. A prefix query is one
+    bisection plus a scan over the matching run, so matches anywhere a word
+    starts ("trap" finds "Grease Trap Cleaning") cost the same as title prefixes.
+    """
+
+    def __init__(self):
+        self._entries: List[Tuple[str, int, Hashable]] = []
+        self._items: Dict[Hashable, Tuple[List[Tuple[str, int]], Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def rebuild(self, items: Iterable[Tuple[Hashable, str, Any]]) -> None:
+        """Replace the contents with (key, text, payload) items, sorting once"""
+        entries = []
+        index = {}
+        for key, text, payload in items:
+            suffixes = _word_suffixes(text)
+            index[key] = (suffixes, payload)
+            entries.extend((suffix, position, key) for suffix, position in suffixes)
+        entries.sort()
+        with self._lock:
+            self._entries = entries
+            self._items = index
+
+    def add(self, key: Hashable, text: str, payload: Any) -> None:
+        with self._lock:
+            self._remove(key)
+            suffixes = _word_suffixes(text)
+            self._items[key] = (suffixes, payload)
+            for suffix, position in suffixes:
+                bisect.insort(self._entries, (suffix, position, key))
+
+    def remove(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key: Hashable) -> None:
+        item = self._items.pop(key, None)
+        if item is None:
+            return
+        for suffix, position in item[0]:
+            i = bisect.bisect_left(self._entries, (suffix, position, key))
+            if i < len(self._entries) and self._entries[i] == (suffix, position, key):
+                del self._entries[i]
+
+    def search(self, prefix: str, limit: int) -> List[Any]:
+        """
+        Payloads whose text has a word starting with prefix. Title-prefix
+        matches come first, then earlier word positions, then shorter titles.
+        """
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        # Bound the scan so very short prefixes stay cheap on large catalogs
+        scan_limit = limit * 20
+        matches: Dict[Hashable, Tuple[int, int]] = {}
+        with self._lock:
+            i = bisect.bisect_left(self._entries, (prefix,))
+            while i < len(self._entries) and len(matches) < scan_limit:
+                suffix, position, key = self._entries[i]
+                if not suffix.startswith(prefix):
+                    break
+                if key not in matches or position < matches[key][0]:
+                    matches[key] = (position, len(self._items[key][0]))
+                i += 1
+            ranked = sorted(matches, key=lambda key: matches[key])
+            return [self._items[key][1] for key in ranked[:limit]]
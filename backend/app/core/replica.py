@@ -0,0 +1,161 @@
+"""
+Routing of read-only endpoints to an optional read replica. Reads go to the
+replica only while it answers and its replay lag is under
+REPLICA_MAX_LAG_SECONDS; otherwise they fall back to the primary. A caller
+who has just written is pinned to the primary for the same window so they
+read their own writes (per worker, keyed by their Authorization header).
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Tuple
+
+from fastapi import Request
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+from .cache import TTLCache
+from .config import settings
+from .database import AsyncSessionLocal, get_async_engine, get_replica_engine, is_sqlite
+from .metrics import counter, gauge
+
+# Seconds the replica is behind; 0 when it has replayed everything it received
+POSTGRES_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE coalesce(extract(epoch FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+LAG_CHECK_TIMEOUT = 2.0
+
+READ_ROUTING = counter(
+    "db_read_routing_total",
+    "Read-only requests by the database that served them and why",
+    ["target", "reason"]
+)
+
+
+class ReplicaRouter:
+    def __init__(self, max_lag: float, check_interval: float, retry_after: float):
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.retry_after = retry_after
+        self.lag: Optional[float] = None
+        self.healthy = False
+        self.checked_at = float("-inf")
+        self.down_until = 0.0
+        self.pinned = TTLCache(maxsize=10000, ttl=max_lag)
+        self._lock = asyncio.Lock()
+
+    def pin(self, key: Optional[str]) -> None:
+        if key:
+            self.pinned.set(key, True)
+
+    def mark_down(self) -> None:
+        """Stop using the replica until retry_after has passed"""
+        self.healthy = False
+        self.down_until = time.monotonic() + self.retry_after
+
+    async def check(self, replica: AsyncEngine) -> None:
+        """Re-measure replica lag at most once per check_interval"""
+        async with self._lock:
+            if time.monotonic() - self.checked_at < self.check_interval:
+                return
+            self.checked_at = time.monotonic()
+            try:
+                lag = await asyncio.wait_for(self._measure_lag(replica), LAG_CHECK_TIMEOUT)
+            except (DBAPIError, OSError, asyncio.TimeoutError):
+                self.lag = None
+                self.mark_down()
+                return
+            self.lag = float(lag)
+            self.healthy = self.lag <= self.max_lag
+
+    async def _measure_lag(self, replica: AsyncEngine) -> float:
+        async with replica.connect() as connection:
+            return await connection.scalar(text("SELECT 0") if is_sqlite else POSTGRES_LAG_SQL)
+
+    async def choose(self, key: Optional[str]) -> Tuple[AsyncEngine, str]:
+        """Engine to read from and the reason, for metrics"""
+        replica = get_replica_engine()
+        if replica is None:
+            return get_async_engine(), "no_replica"
+        if key and self.pinned.get(key):
+            return get_async_engine(), "pinned"
+        if time.monotonic() < self.down_until:
+            return get_async_engine(), "replica_down"
+        await self.check(replica)
+        if not self.healthy:
+            return get_async_engine(), "replica_down" if self.lag is None else "replica_lag"
+        return replica, "healthy"
+
+
+replica_router = ReplicaRouter(
+    max_lag=settings.REPLICA_MAX_LAG_SECONDS,
+    check_interval=settings.REPLICA_CHECK_SECONDS,
+    retry_after=settings.REPLICA_RETRY_SECONDS
+)
+
+gauge(
+    "db_replica_lag_seconds",
+    "Replay lag measured on the read replica at the last check (-1 if unknown)",
+    function=lambda: -1.0 if replica_router.lag is None else replica_router.lag
+)
+
+
+@asynccontextmanager
+async def read_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """
+    A session on the replica when it's up and caught up, otherwise on the
+    primary. Endpoints that can answer from a cache open it only on a miss,
+    so cached responses never touch a pool.
+    """
+    key = request.headers.get("authorization")
+    engine, reason = await replica_router.choose(key)
+    db = AsyncSessionLocal(bind=engine)
+    if reason == "healthy":
+        try:
+            # Connect now so a dead replica falls back before the endpoint runs
+            await db.connection()
+        except (DBAPIError, OSError):
+            await db.close()
+            replica_router.mark_down()
+            engine, reason = get_async_engine(), "replica_down"
+            db = AsyncSessionLocal(bind=engine)
+    READ_ROUTING.inc(target="replica" if reason == "healthy" else "primary", reason=reason)
+    # Lets endpoints that cache what they read tell replica results apart
+    db.info["replica"] = reason == "healthy"
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+async def get_read_db(request: Request):
+    """
+    Dependency for read-only endpoints (see read_session). Never use it for
+    writes, or for endpoints that may answer without the database.
+    """
+    async with read_session(request) as db:
+        yield db
+
+
+if settings.DATABASE_REPLICA_URL:
+    @event.listens_for(Session, "do_orm_execute")
+    def _note_statement_write(orm_execute_state):
+        if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+            orm_execute_state.session.info["wrote"] = True
+
+    @event.listens_for(Session, "after_flush")
+    def _note_flush_write(session, flush_context):
+        session.info["wrote"] = True
+
+    @event.listens_for(Session, "after_commit")
+    def _pin_writer_to_primary(session):
+        if session.info.pop("wrote", False):
+            replica_router.pin(session.info.get("writer_key"))
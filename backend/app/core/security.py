@@ -1,8 +1,13 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 import bcrypt
 from .config import settings
+from .metrics import counter, gauge, histogram
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
@@ -10,6 +15,95 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
 
+def _timed(fn, *args):
+    """Run fn inside a hashing worker and report how long the bcrypt work took"""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+HASH_SECONDS = histogram(
+    "password_hash_seconds",
+    "Time spent inside bcrypt per operation",
+    ["operation"]
+)
+HASH_QUEUE_WAIT_SECONDS = histogram(
+    "password_hash_queue_wait_seconds",
+    "Time a hashing request waited for a free worker",
+    ["operation"]
+)
+HASH_REJECTED = counter(
+    "password_hash_rejected_total",
+    "Hashing requests turned away because the queue was full",
+    ["operation"]
+)
+
+class HashingOverloaded(Exception):
+    """Raised when the password hashing queue is full"""
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a dedicated process pool so it neither blocks the event
+    loop nor occupies the threadpool shared with every other endpoint.
+    Requests beyond workers + queue_limit are rejected immediately.
+    """
+
+    def __init__(self, workers: int, queue_limit: int):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.pending = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> Optional[ProcessPoolExecutor]:
+        # workers=0 falls back to the default thread executor (tests, tiny deployments)
+        if self._executor is None and self.workers > 0:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def _run(self, operation: str, fn, *args):
+        if self.pending >= max(self.workers, 1) + self.queue_limit:
+            HASH_REJECTED.inc(operation=operation)
+            raise HashingOverloaded()
+        
+        self.pending += 1
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result, hash_seconds = await loop.run_in_executor(self.executor, _timed, fn, *args)
+        finally:
+            self.pending -= 1
+        
+        HASH_SECONDS.observe(hash_seconds, operation=operation)
+        HASH_QUEUE_WAIT_SECONDS.observe(
+            max(time.perf_counter() - start - hash_seconds, 0.0), operation=operation
+        )
+        return result
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run("verify", verify_password, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", get_password_hash, password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_limit=settings.PASSWORD_HASH_QUEUE_LIMIT
+)
+
+gauge(
+    "password_hash_pending",
+    "Hashing requests running or queued in this worker",
+    function=lambda: password_hasher.pending
+)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     if expires_delta:
@@ -0,0 +1,279 @@
+"""
+Local content-addressed file storage and ranged, streamed file responses
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Optional, Tuple
+
+import anyio
+from multipart.exceptions import MultipartParseError
+from multipart.multipart import MultipartParser, parse_options_header
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import Response
+
+CHUNK_SIZE = 1024 * 1024
+DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+# Allowance for multipart boundaries, part headers and small form fields
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds the store's size limit"""
+
+
+class InvalidUpload(Exception):
+    """Raised when a request body isn't a multipart form carrying the expected file"""
+
+
+class StagedFile:
+    """A file being written into the store, hashed and size-checked as it arrives"""
+
+    def __init__(self, store: "ContentStore"):
+        self.store = store
+        staging = store.root / "tmp"
+        staging.mkdir(parents=True, exist_ok=True)
+        self.file = tempfile.NamedTemporaryFile(dir=staging, delete=False)
+        self.hasher = hashlib.sha256()
+        self.size = 0
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.size > self.store.max_bytes:
+            raise UploadTooLarge()
+        self.hasher.update(chunk)
+        self.file.write(chunk)
+
+    def abort(self) -> None:
+        self.file.close()
+        os.unlink(self.file.name)
+
+    def commit(self) -> Tuple[str, int, bool]:
+        """Move the staged bytes under their digest; returns (digest, size, created)"""
+        self.file.close()
+        digest = self.hasher.hexdigest()
+        target = self.store.path(digest)
+        if target.exists():
+            os.unlink(self.file.name)
+            return digest, self.size, False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Atomic; a concurrent identical upload just replaces equal bytes
+        os.replace(self.file.name, target)
+        return digest, self.size, True
+
+
+class _MultipartUpload:
+    """python-multipart callbacks that stage one named file field and skip the rest"""
+
+    def __init__(self, store: "ContentStore", field: str):
+        self.store = store
+        self.field = field.encode()
+        self.staged: Optional[StagedFile] = None
+        self.content_type: Optional[str] = None
+        self.complete = False
+        self._headers = {}
+        self._header_field = b""
+        self._header_value = b""
+        self._writing = False
+
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+            "on_end": self.on_end,
+        }
+
+    def on_part_begin(self) -> None:
+        self._headers = {}
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        if options.get(b"name") == self.field and self.staged is None:
+            self.staged = StagedFile(self.store)
+            content_type = self._headers.get(b"content-type", b"application/octet-stream")
+            self.content_type = content_type.decode("latin-1")
+            self._writing = True
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._writing:
+            self.staged.write(data[start:end])
+
+    def on_part_end(self) -> None:
+        self._writing = False
+
+    def on_end(self) -> None:
+        self.complete = True
+
+
+class ContentStore:
+    """
+    Files stored under their SHA-256 digest, so identical uploads share one
+    copy on disk. Content is hashed while it is copied in fixed-size chunks.
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    def path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def ingest(self, source: BinaryIO) -> Tuple[str, int, bool]:
+        """Copy source into the store; returns (digest, size, created)"""
+        staged = StagedFile(self)
+        try:
+            while chunk := source.read(CHUNK_SIZE):
+                staged.write(chunk)
+        except BaseException:
+            staged.abort()
+            raise
+        return staged.commit()
+
+    async def receive(self, request: Request, field: str = "file") -> Tuple[str, int, bool, str]:
+        """
+        Stream the `field` file of a multipart request body straight into the
+        store, enforcing max_bytes as bytes arrive instead of after the whole
+        body has been spooled. Returns (digest, size, created, content_type).
+        """
+        content_type, params = parse_options_header(request.headers.get("content-type", ""))
+        boundary = params.get(b"boundary")
+        if content_type != b"multipart/form-data" or not boundary:
+            raise InvalidUpload("Expected a multipart/form-data body")
+        body_limit = self.max_bytes + MULTIPART_OVERHEAD
+        length = request.headers.get("content-length", "")
+        if length.isdigit() and int(length) > body_limit:
+            raise UploadTooLarge()
+
+        upload = _MultipartUpload(self, field)
+        parser = MultipartParser(boundary, upload.callbacks())
+        received = 0
+        try:
+            async for chunk in request.stream():
+                received += len(chunk)
+                if received > body_limit:
+                    raise UploadTooLarge()
+                # Hashing and disk writes happen in the parser callbacks
+                await run_in_threadpool(parser.write, chunk)
+            if not upload.complete:
+                raise InvalidUpload("Incomplete multipart body")
+            if upload.staged is None:
+                raise InvalidUpload(f"Missing file field '{field}'")
+        except MultipartParseError:
+            if upload.staged is not None:
+                upload.staged.abort()
+            raise InvalidUpload("Malformed multipart body")
+        except BaseException:
+            if upload.staged is not None:
+                upload.staged.abort()
+            raise
+        digest, size, created = await run_in_threadpool(upload.staged.commit)
+        return digest, size, created, upload.content_type
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Resolve a single `bytes=` range to (offset, count). Returns None to serve
+    the whole file (no header, or forms we don't support such as multiple
+    ranges) and raises ValueError when the range is unsatisfiable.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header[6:].strip().partition("-")
+    try:
+        if not first:
+            suffix = int(last)
+            if suffix <= 0:
+                raise ValueError("Unsatisfiable range")
+            start, end = max(size - suffix, 0), size - 1
+        else:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+    except ValueError:
+        raise ValueError("Unsatisfiable range")
+    if start >= size or end < start:
+        raise ValueError("Unsatisfiable range")
+    return start, end - start + 1
+
+
+class RangeFileResponse(Response):
+    """
+    Serve a file (or one byte range of it) from disk, streamed in chunks
+    without reading it into memory.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        size: int,
+        range_header: Optional[str] = None,
+        media_type: Optional[str] = None,
+        headers: Optional[dict] = None
+    ):
+        self.path = path
+        self.media_type = media_type or "application/octet-stream"
+        self.background = None
+        headers = dict(headers or {})
+        headers["accept-ranges"] = "bytes"
+
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            self.status_code = 416
+            self.offset, self.count = 0, 0
+            headers["content-range"] = f"bytes */{size}"
+        else:
+            if byte_range is None:
+                self.status_code = 200
+                self.offset, self.count = 0, size
+            else:
+                self.status_code = 206
+                self.offset, self.count = byte_range
+                last = self.offset + self.count - 1
+                headers["content-range"] = f"bytes {self.offset}-{last}/{size}"
+        headers["content-length"] = str(self.count)
+        self.init_headers(headers)
+
+    async def __call__(self, scope, receive, send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        })
+        if scope["method"] == "HEAD" or self.count == 0:
+            await send({"type": "http.response.body", "body": b""})
+        else:
+            async with await anyio.open_file(self.path, "rb") as file:
+                await file.seek(self.offset)
+                remaining = self.count
+                while remaining:
+                    chunk = await file.read(min(CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    await send({
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": remaining > 0,
+                    })
+                if remaining:
+                    # File shrank underneath us; close the body rather than hang
+                    await send({"type": "http.response.body", "body": b""})
@@ -3,6 +3,7 @@ Create all database tables for the educational platform
 This script creates tables based on SQLAlchemy models
 """
 
+from app.bootstrap import bootstrap_schema
 from app.core.database import engine, Base
 from app.models import user, course, progress, assignment
 
@@ -19,7 +20,7 @@ def create_tables():
         from app.models.assignment import Assignment, Submission
         
         # Create all tables
-        Base.metadata.create_all(bind=engine)
+        bootstrap_schema(engine)
         
         print("\n✅ All tables created successfully!")
         print("\n📋 Tables created:")
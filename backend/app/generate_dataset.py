@@ -0,0 +1,310 @@
+"""
+Populate the configured database (SQLite or Postgres) with a synthetic dataset
+for load testing: users, courses, lessons, schedules, enrollments, progress,
+daily activity, assignments, submissions, certificates and leaderboard totals,
+all written with bulk inserts.
+The same --seed always produces the same data.
+
+Usage:
+    python -m app.generate_dataset --users 10000 --courses 200
+    python -m app.generate_dataset --users 500 --seed 7 --prefix small
+
+Every generated user can sign in as <prefix><n>@example.com with --password.
+"""
+
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Tuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Connection
+
+from app.bootstrap import bootstrap_schema
+from app.core.database import engine
+from app.core.security import get_password_hash
+from app.models import (
+    Assignment,
+    Certificate,
+    Course,
+    DailyActivity,
+    Enrollment,
+    LeaderboardEntry,
+    Lesson,
+    Progress,
+    Schedule,
+    Submission,
+    User
+)
+from app.models.assignment import AssignmentStatus
+from app.models.course import CourseLevel
+from app.models.schedule import ScheduleType
+from app.models.user import UserRole
+from app.api.certificates import certificate_grade
+
+# Rows per INSERT batch; keeps parameter counts well inside SQLite/asyncpg limits
+BATCH_SIZE = 2000
+
+TOPICS = [
+    "Food Safety", "Knife Handling", "Allergen Awareness", "Fire Safety", "Phishing Defense",
+    "Password Hygiene", "Customer Service", "Cash Handling", "Slip and Fall Prevention",
+    "Chemical Safety", "Cold Chain", "Incident Reporting", "Data Privacy", "Workplace Conduct",
+]
+CATEGORIES = ["Safety & Compliance", "Cybersecurity", "Operations", "Customer Experience"]
+LESSON_VERBS = ["Introduction to", "Practical", "Advanced", "Reviewing", "Case Study:", "Assessing"]
+
+def _insert(conn: Connection, model, rows: List[dict], returning: bool = False) -> List[int]:
+    """Bulk insert rows in batches; optionally return the new ids in row order"""
+    ids = []
+    table = model.__table__
+    for start in range(0, len(rows), BATCH_SIZE):
+        batch = rows[start:start + BATCH_SIZE]
+        if returning:
+            stmt = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+            ids.extend(conn.execute(stmt, batch).scalars().all())
+        else:
+            conn.execute(insert(table), batch)
+    return ids
+
+def generate(
+    conn: Connection,
+    users: int,
+    courses: int,
+    lessons_per_course: int,
+    enrollments_per_user: int,
+    seed: int,
+    prefix: str,
+    password: str
+) -> Dict[str, int]:
+    rng = random.Random(seed)
+    now = datetime.utcnow().replace(microsecond=0)
+    # bcrypt once; every synthetic account shares the hash
+    hashed_password = get_password_hash(password)
+    counts = {}
+
+    instructor_count = max(1, courses // 10)
+    user_rows = [
+        {
+            "email": f"{prefix}{i}@example.com",
+            "name": f"Bench User {i}",
+            "hashed_password": hashed_password,
+            "role": UserRole.STUDENT,
+            "created_at": now - timedelta(days=rng.randint(0, 365)),
+        }
+        for i in range(users)
+    ] + [
+        {
+            "email": f"{prefix}-instructor{i}@example.com",
+            "name": f"Bench Instructor {i}",
+            "hashed_password": hashed_password,
+            "role": UserRole.INSTRUCTOR,
+            "created_at": now,
+        }
+        for i in range(instructor_count)
+    ]
+    user_ids = _insert(conn, User, user_rows, returning=True)
+    student_ids, instructor_ids = user_ids[:users], user_ids[users:]
+    counts["users"] = len(user_ids)
+
+    course_rows = [
+        {
+            "title": f"{rng.choice(TOPICS)} {rng.choice(['Basics', 'Essentials', 'Refresher', 'Deep Dive'])} {i}",
+            "description": f"Synthetic course {i} covering {rng.choice(TOPICS).lower()} for frontline staff.",
+            "category": rng.choice(CATEGORIES),
+            "level": rng.choice(list(CourseLevel)),
+            "duration": rng.randint(1, 40),
+            "rating": round(rng.uniform(3.0, 5.0), 1),
+            "instructor_id": rng.choice(instructor_ids),
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(courses)
+    ]
+    course_ids = _insert(conn, Course, course_rows, returning=True)
+    counts["courses"] = len(course_ids)
+
+    lesson_rows = [
+        {
+            "course_id": course_id,
+            "title": f"{rng.choice(LESSON_VERBS)} {rng.choice(TOPICS)} part {order}",
+            "description": "Synthetic lesson content.",
+            "duration": rng.choice([5, 10, 15, 30, 45]),
+            "order": order,
+            "created_at": now,
+        }
+        for course_id in course_ids
+        for order in range(1, lessons_per_course + 1)
+    ]
+    _insert(conn, Lesson, lesson_rows)
+    counts["lessons"] = len(lesson_rows)
+
+    # Weekly sessions from a month back to two months ahead, plus an exam
+    schedule_rows = []
+    for course_id in course_ids:
+        first = now.replace(hour=rng.randint(8, 17), minute=0, second=0) - timedelta(days=rng.randint(28, 34))
+        for week in range(13):
+            start = first + timedelta(weeks=week)
+            schedule_rows.append({
+                "course_id": course_id,
+                "title": f"Live session {week + 1}",
+                "type": ScheduleType.LIVE,
+                "start_time": start,
+                "end_time": start + timedelta(hours=1),
+                "created_at": now,
+                "updated_at": now,
+            })
+        exam = first + timedelta(weeks=13)
+        schedule_rows.append({
+            "course_id": course_id,
+            "title": "Final exam",
+            "type": ScheduleType.EXAM,
+            "start_time": exam,
+            "end_time": exam + timedelta(hours=2),
+            "created_at": now,
+            "updated_at": now,
+        })
+    _insert(conn, Schedule, schedule_rows)
+    counts["schedules"] = len(schedule_rows)
+
+    assignment_rows = [
+        {
+            "course_id": course_id,
+            "title": f"Assessment {n}",
+            "max_grade": 100.0,
+            "due_date": now + timedelta(days=rng.randint(-30, 60)),
+            "created_at": now,
+        }
+        for course_id in course_ids
+        for n in (1, 2)
+    ]
+    assignment_ids = _insert(conn, Assignment, assignment_rows, returning=True)
+    assignments_by_course: Dict[int, List[int]] = {}
+    for row, assignment_id in zip(assignment_rows, assignment_ids):
+        assignments_by_course.setdefault(row["course_id"], []).append(assignment_id)
+    counts["assignments"] = len(assignment_ids)
+
+    enrollment_rows, progress_rows, submission_rows, certificate_rows = [], [], [], []
+    totals: Dict[int, Dict[str, int]] = {}
+    activity: Dict[Tuple[int, date], Dict[str, int]] = {}
+    course_titles = {course_id: row["title"] for course_id, row in zip(course_ids, course_rows)}
+    used_numbers = set()
+    per_user = min(enrollments_per_user, len(course_ids))
+    for user_id, user_row in zip(student_ids, user_rows):
+        for course_id in rng.sample(course_ids, per_user):
+            enrolled_at = now - timedelta(days=rng.randint(1, 180))
+            completion = rng.choice([0.0, 0.0, rng.uniform(1, 99), 100.0])
+            completed_at = enrolled_at + timedelta(days=rng.randint(1, 30)) if completion >= 100 else None
+            enrollment_rows.append({
+                "user_id": user_id,
+                "course_id": course_id,
+                "enrolled_at": enrolled_at,
+                "completed_at": completed_at,
+                "progress_percentage": completion,
+            })
+            time_spent, points, streak = rng.randint(0, 600), int(completion * 10), rng.randint(0, 30)
+            progress_rows.append({
+                "user_id": user_id,
+                "course_id": course_id,
+                "completion_percentage": completion,
+                "time_spent": time_spent,
+                "points": points,
+                "streak": streak,
+                "last_accessed": enrolled_at + timedelta(days=rng.randint(0, 30)),
+            })
+            entry = totals.setdefault(user_id, {
+                "total_points": 0, "total_time_spent": 0, "courses_completed": 0, "current_streak": 0
+            })
+            entry["total_points"] += points
+            entry["total_time_spent"] += time_spent
+            entry["current_streak"] = max(entry["current_streak"], streak)
+            # Spread the course's points and time over a few of the last 90 days
+            days = rng.sample(range(90), rng.randint(1, 5))
+            for n, days_ago in enumerate(days):
+                bucket = activity.setdefault((user_id, (now - timedelta(days=days_ago)).date()), {
+                    "points": 0, "time_spent": 0
+                })
+                bucket["points"] += points // len(days) + (points % len(days) if n == 0 else 0)
+                bucket["time_spent"] += time_spent // len(days) + (time_spent % len(days) if n == 0 else 0)
+
+            if completion > 50:
+                graded = rng.random() < 0.5
+                submission_rows.append({
+                    "assignment_id": rng.choice(assignments_by_course[course_id]),
+                    "student_id": user_id,
+                    "content": "Synthetic submission",
+                    "status": AssignmentStatus.GRADED if graded else AssignmentStatus.SUBMITTED,
+                    "grade": round(rng.uniform(50, 100), 1) if graded else None,
+                    "submitted_at": enrolled_at + timedelta(days=1),
+                    "graded_at": enrolled_at + timedelta(days=2) if graded else None,
+                })
+            if completed_at is not None:
+                entry["courses_completed"] += 1
+                number = None
+                while number is None or number in used_numbers:
+                    number = f"CERT-{completed_at:%Y%m%d}-{rng.getrandbits(32):08X}"
+                used_numbers.add(number)
+                certificate_rows.append({
+                    "user_id": user_id,
+                    "course_id": course_id,
+                    "certificate_number": number,
+                    "issued_at": completed_at,
+                    "completed_at": completed_at,
+                    "instructor_name": "Bench Instructor",
+                    "course_title": course_titles[course_id],
+                    "student_name": user_row["name"],
+                    "grade": certificate_grade(completion),
+                })
+
+    for model, rows, name in (
+        (Enrollment, enrollment_rows, "enrollments"),
+        (Progress, progress_rows, "progress"),
+        (Submission, submission_rows, "submissions"),
+        (Certificate, certificate_rows, "certificates"),
+    ):
+        _insert(conn, model, rows)
+        counts[name] = len(rows)
+
+    _insert(conn, LeaderboardEntry, [
+        {"user_id": user_id, "updated_at": now, **entry} for user_id, entry in totals.items()
+    ])
+    counts["leaderboard_entries"] = len(totals)
+
+    _insert(conn, DailyActivity, [
+        {"user_id": user_id, "day": day, **bucket} for (user_id, day), bucket in activity.items()
+    ])
+    counts["daily_activity"] = len(activity)
+    return counts
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic dataset")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--courses", type=int, default=50)
+    parser.add_argument("--lessons-per-course", type=int, default=12)
+    parser.add_argument("--enrollments-per-user", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--prefix", default="bench", help="Email prefix for generated accounts")
+    parser.add_argument("--password", default="benchmark")
+    args = parser.parse_args()
+
+    bootstrap_schema(engine)
+    with engine.connect() as conn:
+        if conn.scalar(select(User.id).where(User.email == f"{args.prefix}0@example.com")):
+            raise SystemExit(f"❌ A '{args.prefix}' dataset already exists; use another --prefix or a fresh database")
+
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        counts = generate(
+            conn,
+            users=args.users,
+            courses=args.courses,
+            lessons_per_course=args.lessons_per_course,
+            enrollments_per_user=args.enrollments_per_user,
+            seed=args.seed,
+            prefix=args.prefix,
+            password=args.password
+        )
+    print(f"✅ Generated in {time.perf_counter() - started:.1f}s:")
+    for name, count in counts.items():
+        print(f"  {name:<20} {count:>10,}")
+    print(f"\n🔑 Sign in as {args.prefix}0@example.com / {args.password}")
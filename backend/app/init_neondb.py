@@ -5,6 +5,7 @@ Run this to set up your database for the first time
 
 import sys
 from sqlalchemy import text
+from app.bootstrap import bootstrap_schema
 from app.core.database import engine, Base, check_connection
 from app.models.user import User, UserRole
 from app.models.course import Course, Enrollment, Lesson, CourseLevel
@@ -30,7 +31,7 @@ def init_database():
     # Step 2: Create tables
     print("\n📊 Step 2: Creating tables...")
     try:
-        Base.metadata.create_all(bind=engine)
+        bootstrap_schema(engine)
         print("✅ All tables created!")
     except Exception as e:
         print(f"❌ Error creating tables: {e}")
@@ -106,10 +107,8 @@ def init_database():
     print("✅ Database initialization complete!")
     print("="*60)
     print("\n📋 Next steps:")
-    print("  1. Run seed scripts to add courses:")
-    print("     python -m app.seed_nist_course")
-    print("     python -m app.seed_osha_course")
-    print("     python -m app.seed_phishing_course")
+    print("  1. Load the course content packs:")
+    print("     python -m app.load_content content/")
     print("\n  2. Start the backend server:")
     print("     uvicorn app.main:app --reload")
     print("\n  3. Access the API documentation:")
@@ -0,0 +1,37 @@
+"""
+Issue certificates for every completed enrollment in a course
+Safe to re-run: enrollments that already have a certificate are skipped
+
+Usage: python -m app.issue_certificates <course_id>
+"""
+
+import asyncio
+import sys
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from app.core.database import AsyncSessionLocal, async_engine
+from app.models.course import Course
+from app.api.certificates import issue_course_certificates
+
+async def issue_certificates(course_id: int):
+    """Issue all outstanding certificates for one course"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Course).where(Course.id == course_id).options(selectinload(Course.instructor))
+        )
+        course = result.scalar_one_or_none()
+        if not course:
+            print(f"❌ Course {course_id} not found")
+            return
+        
+        print(f"🎓 Issuing certificates for: {course.title}")
+        summary = await issue_course_certificates(db, course)
+        print(f"✅ Issued {summary.issued} certificate(s) in {summary.batches} batch(es)")
+    
+    await async_engine.dispose()
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python -m app.issue_certificates <course_id>")
+        sys.exit(1)
+    asyncio.run(issue_certificates(int(sys.argv[1])))
@@ -0,0 +1,183 @@
+"""
+Load course content packs (JSON, or YAML when PyYAML is installed) into the database
+Safe to re-run: courses are upserted by slug and unchanged ones are skipped by content hash
+
+Usage:
+    python -m app.load_content content/                # every pack in a directory
+    python -m app.load_content content/osha.json --dry-run
+    python -m app.load_content content/ --prune        # also delete lessons dropped from a pack
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from pydantic import ValidationError
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal, dialect_insert
+from app.models.course import Course, CourseLevel, CourseSource, Lesson
+from app.models.user import User, UserRole
+from app.schemas.course import ContentPack, CourseContent
+
+PACK_SUFFIXES = (".json", ".yaml", ".yml")
+
+def read_pack(path: Path) -> ContentPack:
+    """Parse and validate one pack file"""
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".json":
+        data = json.loads(text)
+    else:
+        try:
+            import yaml
+        except ImportError:
+            raise SystemExit(f"PyYAML is required to load {path}; install it or use JSON")
+        data = yaml.safe_load(text)
+    return ContentPack.model_validate(data)
+
+def pack_paths(paths: Iterable[str]) -> List[Path]:
+    found = []
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            found.extend(sorted(p for p in path.iterdir() if p.suffix in PACK_SUFFIXES))
+        else:
+            found.append(path)
+    return found
+
+def content_hash(course: CourseContent) -> str:
+    """Stable digest of a course definition, independent of key order and formatting"""
+    canonical = json.dumps(course.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+def default_instructor_id(db: Session) -> Optional[int]:
+    """First instructor, falling back to the first user (as the old seed scripts did)"""
+    return db.scalar(
+        select(User.id).where(User.role == UserRole.INSTRUCTOR).order_by(User.id).limit(1)
+    ) or db.scalar(select(User.id).order_by(User.id).limit(1))
+
+def load_course(
+    db: Session,
+    course: CourseContent,
+    prune: bool = False,
+    fallback_instructor_id: Optional[int] = None
+) -> str:
+    """Upsert one course and its lessons; returns "created", "updated" or "unchanged" """
+    digest = content_hash(course)
+    source = db.get(CourseSource, course.slug)
+    if source is not None and source.content_hash == digest:
+        return "unchanged"
+
+    values = course.model_dump(exclude={"slug", "lessons", "instructor_email"})
+    values["level"] = CourseLevel(values["level"])
+    if course.instructor_email:
+        values["instructor_id"] = db.scalar(select(User.id).where(User.email == course.instructor_email))
+        if values["instructor_id"] is None:
+            raise ValueError(f"{course.slug}: instructor {course.instructor_email} not found")
+
+    # Courses created by the old seed scripts are adopted by title on first load
+    course_id = source.course_id if source else db.scalar(
+        select(Course.id).where(Course.title == course.title).order_by(Course.id).limit(1)
+    )
+    if course_id is None:
+        values.setdefault("instructor_id", fallback_instructor_id)
+        if values["instructor_id"] is None:
+            raise ValueError(f"{course.slug}: no instructor to assign; create a user first or set instructor_email")
+        course_id = db.execute(insert(Course).values(**values).returning(Course.id)).scalar_one()
+        status = "created"
+    else:
+        db.execute(update(Course).where(Course.id == course_id).values(**values, updated_at=datetime.utcnow()))
+        status = "updated"
+
+    # Lessons are matched by their order within the course
+    existing = dict(db.execute(select(Lesson.order, Lesson.id).where(Lesson.course_id == course_id)).all())
+    lessons = [lesson.model_dump() for lesson in course.lessons]
+    new_lessons = [lesson for lesson in lessons if lesson["order"] not in existing]
+    if new_lessons:
+        # A single multi-row INSERT per course
+        db.execute(insert(Lesson).values([{**lesson, "course_id": course_id} for lesson in new_lessons]))
+    changed = [{**lesson, "b_id": existing[lesson["order"]]} for lesson in lessons if lesson["order"] in existing]
+    if changed:
+        lessons_table = Lesson.__table__
+        db.execute(
+            update(lessons_table)
+            .where(lessons_table.c.id == bindparam("b_id"))
+            .values(
+                title=bindparam("title"),
+                description=bindparam("description"),
+                video_url=bindparam("video_url"),
+                duration=bindparam("duration")
+            ),
+            changed
+        )
+    if prune:
+        db.execute(delete(Lesson).where(
+            Lesson.course_id == course_id,
+            Lesson.order.not_in([lesson["order"] for lesson in lessons])
+        ))
+
+    upsert = dialect_insert(CourseSource).values(
+        slug=course.slug,
+        course_id=course_id,
+        content_hash=digest,
+        loaded_at=datetime.utcnow()
+    )
+    db.execute(upsert.on_conflict_do_update(
+        index_elements=[CourseSource.slug],
+        set_={"content_hash": upsert.excluded.content_hash, "loaded_at": upsert.excluded.loaded_at}
+    ))
+    return status
+
+def load_packs(paths: Iterable[str], dry_run: bool = False, prune: bool = False) -> Counter:
+    """Load every course in the given pack files/directories in a single transaction"""
+    packs = []
+    for path in pack_paths(paths):
+        try:
+            packs.append((path, read_pack(path)))
+        except ValidationError as e:
+            raise ValueError(f"{path}: {e}") from e
+    summary = Counter()
+    db = SessionLocal()
+    try:
+        fallback_instructor_id = default_instructor_id(db)
+        for path, pack in packs:
+            for course in pack.courses:
+                status = load_course(db, course, prune=prune, fallback_instructor_id=fallback_instructor_id)
+                summary[status] += 1
+                print(f"  {status:<9} {course.slug} ({len(course.lessons)} lessons) from {path.name}")
+        if dry_run:
+            db.rollback()
+        else:
+            db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    return summary
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load course content packs")
+    parser.add_argument("paths", nargs="+", help="Pack files or directories containing them")
+    parser.add_argument("--dry-run", action="store_true", help="Validate and apply, then roll back")
+    parser.add_argument("--prune", action="store_true", help="Delete lessons no longer in a pack")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    try:
+        summary = load_packs(args.paths, dry_run=args.dry_run, prune=args.prune)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(
+        f"✅ {summary['created']} created, {summary['updated']} updated, "
+        f"{summary['unchanged']} unchanged in {time.perf_counter() - started:.2f}s"
+        + (" (dry run, rolled back)" if args.dry_run else "")
+    )
@@ -1,11 +1,15 @@
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from .core.config import settings
-from .core.database import engine, Base
-from .api import auth, courses, assignments, certificates
+from .core.database import dispose_engines
+from .core.instrumentation import RequestMetricsMiddleware
+from .core.metrics import REGISTRY
+from .core.security import password_hasher
+from .api import auth, courses, assignments, certificates, progress, leaderboard, schedules, search
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+# Schema changes are applied by `python -m app.bootstrap`, never at import,
+# so workers start without touching the database
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -20,13 +24,31 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Cache"],
 )
 
+# Per-route latency and SQL statement metrics, served on /metrics
+app.add_middleware(RequestMetricsMiddleware)
+
 # Include routers
 app.include_router(auth.router, prefix=f"{settings.API_V1_STR}/auth", tags=["auth"])
 app.include_router(courses.router, prefix=f"{settings.API_V1_STR}/courses", tags=["courses"])
 app.include_router(assignments.router, prefix=f"{settings.API_V1_STR}/assignments", tags=["assignments"])
 app.include_router(certificates.router, prefix=f"{settings.API_V1_STR}/certificates", tags=["certificates"])
+app.include_router(progress.router, prefix=f"{settings.API_V1_STR}/progress", tags=["progress"])
+app.include_router(leaderboard.router, prefix=f"{settings.API_V1_STR}/leaderboard", tags=["leaderboard"])
+app.include_router(schedules.router, prefix=f"{settings.API_V1_STR}/schedules", tags=["schedules"])
+app.include_router(search.router, prefix=f"{settings.API_V1_STR}/search", tags=["search"])
+
+@app.on_event("startup")
+async def startup():
+    progress.progress_buffer.start()
+
+@app.on_event("shutdown")
+async def shutdown():
+    password_hasher.shutdown()
+    await progress.progress_buffer.stop()
+    await dispose_engines()
 
 @app.get("/")
 def root():
@@ -38,4 +60,11 @@ def root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "principal_cache": auth.principal_cache.stats()
+    }
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
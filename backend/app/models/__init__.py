@@ -1,18 +1,33 @@
 from .user import User
-from .course import Course, Enrollment, Lesson
-from .assignment import Assignment, Submission
+from .course import Course, CourseSource, Enrollment, Lesson
+from .assignment import Assignment, FileUpload, StoredFile, Submission
 from .progress import Progress
 from .schedule import Schedule
 from .certificate import Certificate
+from .leaderboard import (
+    DailyActivity,
+    LeaderboardEntry,
+    LeaderboardSnapshot,
+    LeaderboardSnapshotEntry,
+    LeaderboardState
+)
 
 __all__ = [
     "User",
     "Course",
     "Enrollment",
     "Lesson",
+    "CourseSource",
     "Assignment",
     "Submission",
+    "StoredFile",
+    "FileUpload",
     "Progress",
     "Schedule",
     "Certificate",
+    "LeaderboardEntry",
+    "LeaderboardState",
+    "DailyActivity",
+    "LeaderboardSnapshot",
+    "LeaderboardSnapshotEntry",
 ]
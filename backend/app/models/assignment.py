@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Float, ForeignKey, DateTime, Enum
+from sqlalchemy import BigInteger, Column, Integer, String, Text, Float, ForeignKey, DateTime, Enum, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -41,3 +41,24 @@ class Submission(Base):
     # Relationships
     assignment = relationship("Assignment", back_populates="submissions")
     student = relationship("User", back_populates="submissions")
+
+class StoredFile(Base):
+    """Uploaded file content, keyed by its SHA-256 digest"""
+    __tablename__ = "stored_files"
+    
+    digest = Column(String(64), primary_key=True)
+    size = Column(BigInteger, nullable=False)
+    content_type = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class FileUpload(Base):
+    """Who uploaded a stored file; downloads and submissions are authorised against it"""
+    __tablename__ = "file_uploads"
+    __table_args__ = (
+        UniqueConstraint("user_id", "digest", name="uq_file_uploads_user_digest"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    digest = Column(String(64), ForeignKey("stored_files.digest"), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
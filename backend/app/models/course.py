@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Float, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Text, Float, ForeignKey, DateTime, Enum, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -33,6 +33,9 @@ class Course(Base):
 
 class Enrollment(Base):
     __tablename__ = "enrollments"
+    __table_args__ = (
+        UniqueConstraint("user_id", "course_id", name="uq_enrollments_user_course"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -59,3 +62,12 @@ class Lesson(Base):
     
     # Relationships
     course = relationship("Course", back_populates="lessons")
+
+class CourseSource(Base):
+    """Content-pack definition a course was loaded from, with a hash to skip unchanged reloads"""
+    __tablename__ = "course_sources"
+    
+    slug = Column(String, primary_key=True)
+    course_id = Column(Integer, ForeignKey("courses.id"), nullable=False, unique=True)
+    content_hash = Column(String(64), nullable=False)
+    loaded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,69 @@
+from sqlalchemy import Column, Integer, ForeignKey, Date, DateTime, Index, UniqueConstraint
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from ..core.database import Base
+
+class LeaderboardEntry(Base):
+    """Per-user totals maintained incrementally as progress and completions are written"""
+    __tablename__ = "leaderboard_entries"
+    
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    total_points = Column(Integer, default=0, nullable=False)
+    courses_completed = Column(Integer, default=0, nullable=False)
+    current_streak = Column(Integer, default=0, nullable=False)  # days
+    total_time_spent = Column(Integer, default=0, nullable=False)  # in minutes
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+class LeaderboardState(Base):
+    """Single row whose generation changes on every full rebuild of leaderboard_entries"""
+    __tablename__ = "leaderboard_state"
+    
+    id = Column(Integer, primary_key=True)
+    generation = Column(Integer, default=0, nullable=False)
+    rebuilt_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+class DailyActivity(Base):
+    """Points and time per user per UTC day, the buckets windowed leaderboards sum over"""
+    __tablename__ = "daily_activity"
+    __table_args__ = (
+        UniqueConstraint("user_id", "day", name="uq_daily_activity_user_day"),
+        Index("ix_daily_activity_day_user", "day", "user_id"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    day = Column(Date, nullable=False)
+    points = Column(Integer, default=0, nullable=False)
+    time_spent = Column(Integer, default=0, nullable=False)  # in minutes
+
+class LeaderboardSnapshot(Base):
+    """Frozen ranking of a finished window (week, month or custom range)"""
+    __tablename__ = "leaderboard_snapshots"
+    __table_args__ = (
+        UniqueConstraint("window_start", "window_end", name="uq_leaderboard_snapshots_window"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    window_start = Column(Date, nullable=False)
+    window_end = Column(Date, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    # Relationships
+    entries = relationship("LeaderboardSnapshotEntry", back_populates="snapshot")
+
+class LeaderboardSnapshotEntry(Base):
+    __tablename__ = "leaderboard_snapshot_entries"
+    __table_args__ = (
+        Index("ix_leaderboard_snapshot_entries_rank", "snapshot_id", "rank"),
+        Index("ix_leaderboard_snapshot_entries_user", "snapshot_id", "user_id"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    snapshot_id = Column(Integer, ForeignKey("leaderboard_snapshots.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    rank = Column(Integer, nullable=False)
+    points = Column(Integer, default=0, nullable=False)
+    time_spent = Column(Integer, default=0, nullable=False)  # in minutes
+    
+    # Relationships
+    snapshot = relationship("LeaderboardSnapshot", back_populates="entries")
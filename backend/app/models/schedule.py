@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum, Index
 from datetime import datetime
 import enum
 from ..core.database import Base
@@ -10,6 +10,11 @@ class ScheduleType(str, enum.Enum):
 
 class Schedule(Base):
     __tablename__ = "schedules"
+    __table_args__ = (
+        # Overlap queries bound start_time from above and end_time from below
+        Index("ix_schedules_course_start", "course_id", "start_time"),
+        Index("ix_schedules_course_end", "course_id", "end_time"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
@@ -18,3 +23,4 @@ class Schedule(Base):
     start_time = Column(DateTime, nullable=False)
     end_time = Column(DateTime, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
 
 class AssignmentBase(BaseModel):
@@ -19,6 +19,10 @@ class AssignmentResponse(AssignmentBase):
     class Config:
         from_attributes = True
 
+class AssignmentPage(BaseModel):
+    items: List[AssignmentResponse]
+    next_cursor: Optional[str] = None
+
 class SubmissionCreate(BaseModel):
     assignment_id: int
     content: Optional[str] = None
@@ -28,6 +32,24 @@ class SubmissionUpdate(BaseModel):
     grade: Optional[float] = None
     feedback: Optional[str] = None
 
+class SubmissionGrade(SubmissionUpdate):
+    submission_id: int
+    grade: float = Field(ge=0)
+
+class BulkGradeRequest(BaseModel):
+    grades: List[SubmissionGrade] = Field(min_length=1)
+
+class BulkGradeResponse(BaseModel):
+    graded: int
+    graded_at: datetime
+
+class StoredFileResponse(BaseModel):
+    digest: str
+    size: int
+    content_type: Optional[str] = None
+    url: str
+    deduplicated: bool
+
 class SubmissionResponse(BaseModel):
     id: int
     assignment_id: int
@@ -34,6 +34,8 @@ class CertificateDetail(CertificateResponse):
     course_category: Optional[str] = None
     course_duration: Optional[int] = None
 
-
-
-
+class CertificateBatchResponse(BaseModel):
+    """Result of issuing certificates for every completed enrollment in a course"""
+    course_id: int
+    issued: int
+    batches: int
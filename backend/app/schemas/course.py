@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, Field, field_validator
+from typing import Literal, Optional, List
 from datetime import datetime
 
 class LessonBase(BaseModel):
@@ -47,9 +47,50 @@ class CourseResponse(CourseBase):
     class Config:
         from_attributes = True
 
+class CoursePage(BaseModel):
+    items: List[CourseResponse]
+    next_cursor: Optional[str] = None
+
+class CourseContent(CourseBase):
+    """One course in a content pack; `slug` identifies it across reloads"""
+    slug: str = Field(pattern=r"^[a-z0-9]+(-[a-z0-9]+)*$")
+    level: Literal["beginner", "intermediate", "advanced"] = "beginner"
+    rating: float = Field(default=0.0, ge=0, le=5)
+    instructor_email: Optional[str] = None
+    lessons: List[LessonBase] = []
+    
+    @field_validator("lessons")
+    @classmethod
+    def unique_lesson_order(cls, lessons: List[LessonBase]) -> List[LessonBase]:
+        orders = [lesson.order for lesson in lessons]
+        if len(orders) != len(set(orders)):
+            raise ValueError("Lesson order values must be unique within a course")
+        return lessons
+
+class ContentPack(BaseModel):
+    courses: List[CourseContent]
+    
+    @field_validator("courses")
+    @classmethod
+    def unique_slugs(cls, courses: List[CourseContent]) -> List[CourseContent]:
+        slugs = [course.slug for course in courses]
+        if len(slugs) != len(set(slugs)):
+            raise ValueError("Course slugs must be unique within a pack")
+        return courses
+
 class EnrollmentCreate(BaseModel):
     course_id: int
 
+class BulkEnrollmentRequest(BaseModel):
+    user_ids: List[int]
+
+class BulkEnrollmentResponse(BaseModel):
+    course_id: int
+    requested: int
+    created: int
+    already_enrolled: int
+    unknown_user_ids: List[int] = []
+
 class EnrollmentResponse(BaseModel):
     id: int
     user_id: int
@@ -0,0 +1,33 @@
+from pydantic import BaseModel
+from datetime import date
+from typing import List, Optional
+
+class LeaderboardEntryResponse(BaseModel):
+    rank: int
+    user_id: int
+    name: str
+    avatar: Optional[str] = None
+    total_points: int = 0
+    courses_completed: int = 0
+    current_streak: int = 0
+    total_time_spent: int = 0
+
+class LeaderboardRebuildResponse(BaseModel):
+    users: int
+    mismatches: int
+
+class WindowEntryResponse(BaseModel):
+    rank: int
+    user_id: int
+    name: str
+    avatar: Optional[str] = None
+    points: int = 0
+    time_spent: int = 0
+
+class WindowLeaderboardResponse(BaseModel):
+    """Leaderboard over [start, end]; finished windows are served from a frozen snapshot"""
+    start: date
+    end: date
+    finished: bool
+    entries: List[WindowEntryResponse]
+    me: Optional[WindowEntryResponse] = None
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+
+# Upper bounds for one heartbeat's deltas; anything larger isn't a real session
+MAX_HEARTBEAT_MINUTES = 240
+MAX_HEARTBEAT_POINTS = 1000
+
+class ProgressUpdate(BaseModel):
+    """A progress heartbeat; time_spent and points are deltas since the last one"""
+    completion_percentage: Optional[float] = Field(default=None, ge=0, le=100)
+    time_spent: int = Field(default=0, ge=0, le=MAX_HEARTBEAT_MINUTES)  # in minutes
+    points: int = Field(default=0, ge=0, le=MAX_HEARTBEAT_POINTS)
+
+class ProgressAccepted(BaseModel):
+    status: str = "accepted"
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from datetime import datetime
+
+class ScheduleResponse(BaseModel):
+    id: int
+    course_id: int
+    course_title: str
+    title: str
+    type: str
+    start_time: datetime
+    end_time: datetime
+
+class CalendarFeedResponse(BaseModel):
+    token: str
+    url: str
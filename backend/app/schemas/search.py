@@ -0,0 +1,28 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+class CourseSearchHit(BaseModel):
+    id: int
+    title: str
+    category: Optional[str] = None
+    rank: float
+    highlight: str
+
+class LessonSearchHit(BaseModel):
+    id: int
+    course_id: int
+    course_title: str
+    title: str
+    rank: float
+    highlight: str
+
+class AutocompleteHit(BaseModel):
+    type: str
+    id: int
+    title: str
+    course_id: int
+
+class SearchResponse(BaseModel):
+    query: str
+    courses: List[CourseSearchHit]
+    lessons: List[LessonSearchHit]
@@ -0,0 +1,111 @@
+"""
+Per-item CPU cost of the list endpoints' response paths: ORM objects validated
+through the response schema and JSON-encoded (the old path) versus Core rows
+mapped to dicts and encoded with orjson (the current one). Runs against the
+configured database, so generate a dataset first for meaningful numbers.
+
+Usage:
+    python -m app.generate_dataset --users 2000 --courses 500
+    python -m app.serialization_benchmark --items 500 --repeat 20
+"""
+
+import argparse
+import json
+import time
+from typing import Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.core.database import SessionLocal
+from app.core.serialization import dumps, row_dicts, schema_columns
+from app.models import Assignment, Certificate, Course, Lesson
+from app.schemas.assignment import AssignmentResponse
+from app.schemas.certificate import CertificateResponse
+from app.schemas.course import CourseResponse, LessonResponse
+
+def _orm_path(schema, query) -> Callable[[], bytes]:
+    """Hydrate ORM objects, validate them into the schema and encode like JSONResponse"""
+    adapter = TypeAdapter(List[schema])
+    def run():
+        with SessionLocal() as db:
+            objects = db.scalars(query).all()
+            content = jsonable_encoder(adapter.validate_python(objects, from_attributes=True))
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+    return run
+
+def _row_path(query) -> Callable[[], bytes]:
+    def run():
+        with SessionLocal() as db:
+            return dumps(row_dicts(db.execute(query)))
+    return run
+
+def _course_row_path(limit: int) -> Callable[[], bytes]:
+    course_columns = schema_columns(Course, CourseResponse)
+    lesson_columns = schema_columns(Lesson, LessonResponse)
+    def run():
+        with SessionLocal() as db:
+            courses = row_dicts(db.execute(select(*course_columns).order_by(Course.id).limit(limit)))
+            by_course = {}
+            for course in courses:
+                course["lessons"] = by_course[course["id"]] = []
+            for row in db.execute(
+                select(*lesson_columns).where(Lesson.course_id.in_(by_course)).order_by(Lesson.course_id, Lesson.id)
+            ):
+                by_course[row.course_id].append(row._asdict())
+            return dumps(courses)
+    return run
+
+def measure(run: Callable[[], bytes], repeat: int) -> float:
+    """Best-of-repeat CPU seconds for one call"""
+    run()
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.process_time()
+        run()
+        best = min(best, time.process_time() - started)
+    return best
+
+def cases(items: int) -> Dict[str, tuple]:
+    return {
+        "courses (+lessons)": (
+            _orm_path(
+                CourseResponse,
+                select(Course).options(selectinload(Course.lessons)).order_by(Course.id).limit(items)
+            ),
+            _course_row_path(items),
+            lambda db: db.scalars(select(Course.id).order_by(Course.id).limit(items)).all(),
+        ),
+        "assignments": (
+            _orm_path(AssignmentResponse, select(Assignment).order_by(Assignment.id).limit(items)),
+            _row_path(select(*schema_columns(Assignment, AssignmentResponse)).order_by(Assignment.id).limit(items)),
+            lambda db: db.scalars(select(Assignment.id).order_by(Assignment.id).limit(items)).all(),
+        ),
+        "certificates": (
+            _orm_path(CertificateResponse, select(Certificate).order_by(Certificate.id).limit(items)),
+            _row_path(select(*schema_columns(Certificate, CertificateResponse)).order_by(Certificate.id).limit(items)),
+            lambda db: db.scalars(select(Certificate.id).order_by(Certificate.id).limit(items)).all(),
+        ),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare per-item serialization CPU cost")
+    parser.add_argument("--items", type=int, default=500, help="Rows per list response")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'endpoint':<20} {'items':>6} {'orm µs/item':>12} {'rows µs/item':>13} {'speedup':>8}")
+    for name, (orm_run, row_run, count) in cases(args.items).items():
+        with SessionLocal() as db:
+            n = len(count(db))
+        if not n:
+            print(f"{name:<20} {'-':>6}  (no rows; run python -m app.generate_dataset)")
+            continue
+        orm_seconds = measure(orm_run, args.repeat)
+        row_seconds = measure(row_run, args.repeat)
+        print(
+            f"{name:<20} {n:>6} {orm_seconds / n * 1e6:>12.1f} {row_seconds / n * 1e6:>13.1f} "
+            f"{orm_seconds / row_seconds:>7.1f}x"
+        )
@@ -0,0 +1,86 @@
+"""
+Measure how long a fresh worker takes to come online and fail if it's over
+budget: importing app.main, running startup handlers, and serving the first
+request (which is when the database engine is created and first connects).
+Each run uses a new interpreter so nothing is already imported or cached.
+
+Usage:
+    python -m app.startup_check
+    python -m app.startup_check --import-budget 1.5 --first-request-budget 0.5
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+# Runs in the child interpreter; prints the timings as JSON on the last line
+_PROBE = """
+import json, time
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app.main.app) as client:
+    ready = time.perf_counter()
+    status = client.get({path!r}).status_code
+    served = time.perf_counter()
+print(json.dumps({{
+    "import": imported - started,
+    "startup": ready - imported,
+    "first_request": served - ready,
+    "status": status,
+}}))
+"""
+
+def measure(path: str = "/api/certificates/verify/CERT-00000000-00000000", env: Optional[dict] = None) -> Tuple[Dict[str, float], List[Tuple[float, str]]]:
+    """Timings from a fresh interpreter, plus its slowest imports (seconds, module)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(path=path)],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **(env or {})},
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Startup probe failed:\n{result.stderr[-2000:]}")
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+
+    imports = []
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|(\s*)(\S+)", line)
+        if match and len(match.group(2)) == 1:
+            imports.append((int(match.group(1)) / 1e6, match.group(3)))
+    return timings, sorted(imports, reverse=True)[:10]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check worker startup time against a budget")
+    parser.add_argument("--import-budget", type=float, default=3.0, help="Seconds to import app.main")
+    parser.add_argument("--startup-budget", type=float, default=1.0, help="Seconds to run startup handlers")
+    parser.add_argument("--first-request-budget", type=float, default=1.0, help="Seconds to serve the first request")
+    parser.add_argument("--path", default="/api/certificates/verify/CERT-00000000-00000000")
+    args = parser.parse_args()
+
+    timings, slowest = measure(args.path)
+    budgets = {
+        "import": args.import_budget,
+        "startup": args.startup_budget,
+        "first_request": args.first_request_budget,
+    }
+    over = False
+    for phase, budget in budgets.items():
+        ok = timings[phase] <= budget
+        over = over or not ok
+        print(f"{'✅' if ok else '❌'} {phase:<14} {timings[phase] * 1000:>8.1f} ms  (budget {budget * 1000:.0f} ms)")
+    if timings["status"] >= 500:
+        print(f"❌ First request to {args.path} returned {timings['status']}")
+        over = True
+    if over:
+        print("\n🐢 Slowest top-level imports:")
+        for seconds, module in slowest:
+            print(f"  {seconds * 1000:>8.1f} ms  {module}")
+    sys.exit(1 if over else 0)
@@ -1,6 +1,10 @@
 import uvicorn
 
+from app.bootstrap import bootstrap_schema
+
 if __name__ == "__main__":
+    # Dev convenience: apply schema once here, not in every reloaded worker
+    bootstrap_schema()
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
@@ -66,16 +66,8 @@ echo ""
 echo "🌱 Step 4: Seeding courses..."
 echo ""
 
-echo "  📚 Seeding NIST Cybersecurity Framework..."
-python -m app.seed_nist_course
-echo ""
-
-echo "  🏥 Seeding OSHA Restaurant Training..."
-python -m app.seed_osha_course
-echo ""
-
-echo "  🎣 Seeding Phishing and Scam Alert Training..."
-python -m app.seed_phishing_course
+echo "  📚 Loading NIST, OSHA and Phishing course packs..."
+python -m app.load_content content/
 echo ""
 
 echo "=========================================="
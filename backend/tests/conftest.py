@@ -0,0 +1,131 @@
+import os
+import tempfile
+
+import pytest
+
+# Point the app at a throwaway SQLite database before anything imports settings
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/test.db"
+# Reads go through the replica router; the "replica" is the same file
+os.environ["DATABASE_REPLICA_URL"] = f"sqlite:///{_db_dir}/test.db"
+os.environ["PASSWORD_HASH_WORKERS"] = "0"
+os.environ["UPLOAD_DIR"] = f"{_db_dir}/uploads"
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.main import app
+from app.bootstrap import bootstrap_schema
+from app.core.database import SessionLocal, async_engine, get_replica_engine
+from app.core.security import get_password_hash
+from app.models import Course, Lesson, User
+from app.models.user import UserRole
+
+# The app no longer creates tables on import
+bootstrap_schema()
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def user_headers(client):
+    """Register a fresh user and return its bearer auth headers"""
+    email = f"user{os.urandom(4).hex()}@example.com"
+    client.post(
+        "/api/auth/register",
+        json={"email": email, "name": "Test User", "password": "secret"}
+    )
+    response = client.post("/api/auth/login", data={"username": email, "password": "secret"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def _staff_headers(client, db, role: UserRole) -> dict:
+    email = f"{role.value}{os.urandom(4).hex()}@example.com"
+    db.add(User(
+        email=email,
+        name=role.value.title(),
+        role=role,
+        hashed_password=get_password_hash("secret")
+    ))
+    db.commit()
+    response = client.post("/api/auth/login", data={"username": email, "password": "secret"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+def manager_headers(client, db):
+    """Bearer auth headers for a fresh instructor account"""
+    return _staff_headers(client, db, UserRole.INSTRUCTOR)
+
+
+@pytest.fixture
+def admin_headers(client, db):
+    return _staff_headers(client, db, UserRole.ADMIN)
+
+
+@pytest.fixture
+def make_users(db):
+    def _make_users(count: int) -> list:
+        users = [
+            User(email=f"crew{os.urandom(4).hex()}@example.com", name="Crew", hashed_password="x")
+            for _ in range(count)
+        ]
+        db.add_all(users)
+        db.commit()
+        return users
+    return _make_users
+
+
+@pytest.fixture
+def make_course(db):
+    def _make_course(lesson_count: int = 0, **fields) -> Course:
+        instructor = db.query(User).first()
+        course = Course(
+            title=fields.pop("title", "Test Course"),
+            category=fields.pop("category", "Testing"),
+            duration=fields.pop("duration", 1),
+            instructor_id=instructor.id if instructor else None,
+            **fields
+        )
+        db.add(course)
+        db.flush()
+        for order in range(lesson_count):
+            course.lessons.append(
+                Lesson(course_id=course.id, title=f"Lesson {order}", duration=10, order=order)
+            )
+        db.commit()
+        return course
+    return _make_course
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+@pytest.fixture
+def count_queries():
+    """Count SQL statements the API issues while the fixture is active"""
+    counter = QueryCounter()
+    engines = [async_engine.sync_engine, get_replica_engine().sync_engine]
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", counter)
+    yield counter
+    for engine in engines:
+        event.remove(engine, "before_cursor_execute", counter)
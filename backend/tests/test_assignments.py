@@ -0,0 +1,134 @@
+import os
+
+from app.api.assignments import content_store
+from app.models import Submission
+
+
+def _student_headers(client):
+    email = f"student{os.urandom(4).hex()}@example.com"
+    client.post("/api/auth/register", json={"email": email, "name": "Student", "password": "secret"})
+    response = client.post("/api/auth/login", data={"username": email, "password": "secret"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def _submissions(client, manager_headers, student_headers, make_course, count):
+    course = make_course()
+    assignment = client.post(
+        "/api/assignments/",
+        headers=manager_headers,
+        json={"title": "Quiz", "max_grade": 10, "due_date": "2030-01-01T00:00:00", "course_id": course.id}
+    ).json()
+    return [
+        client.post(
+            f"/api/assignments/{assignment['id']}/submit",
+            headers=student_headers,
+            json={"assignment_id": assignment["id"], "content": f"Answer {i}"}
+        ).json()["id"]
+        for i in range(count)
+    ]
+
+
+def test_bulk_grading_updates_all_submissions(
+    client, db, user_headers, manager_headers, make_course, count_queries
+):
+    ids = _submissions(client, manager_headers, user_headers, make_course, 3)
+
+    count_queries.count = 0
+    response = client.post(
+        "/api/assignments/submissions/grade",
+        headers=manager_headers,
+        json={"grades": [
+            {"submission_id": ids[0], "grade": 9.5, "feedback": "Great"},
+            {"submission_id": ids[1], "grade": 7},
+            {"submission_id": ids[2], "grade": 10, "feedback": "Perfect"},
+        ]}
+    )
+    assert response.status_code == 200
+    assert response.json()["graded"] == 3
+    # Max-grade lookup and one batched UPDATE, regardless of submission count
+    assert count_queries.count == 2
+
+    graded = {s.id: s for s in db.query(Submission).filter(Submission.id.in_(ids))}
+    assert [graded[i].grade for i in ids] == [9.5, 7, 10]
+    assert [graded[i].feedback for i in ids] == ["Great", None, "Perfect"]
+    assert all(s.status.value == "graded" and s.graded_at for s in graded.values())
+
+
+def test_bulk_grading_rejects_the_whole_batch(client, db, user_headers, manager_headers, make_course):
+    ids = _submissions(client, manager_headers, user_headers, make_course, 2)
+    grades = [{"submission_id": ids[0], "grade": 5}, {"submission_id": ids[1], "grade": 11}]
+
+    response = client.post("/api/assignments/submissions/grade", headers=manager_headers, json={"grades": grades})
+    assert response.status_code == 400
+    assert str(ids[1]) in response.json()["detail"]
+    assert db.query(Submission).filter(Submission.id.in_(ids), Submission.grade.isnot(None)).count() == 0
+
+    denied = client.post("/api/assignments/submissions/grade", headers=user_headers, json={"grades": grades[:1]})
+    assert denied.status_code == 403
+
+
+def test_uploads_are_deduplicated_and_served_with_ranges(client, user_headers, manager_headers, make_course):
+    photo = bytes(range(256)) * 40
+    first = client.post("/api/assignments/files", headers=user_headers, files={"file": ("log.jpg", photo, "image/jpeg")})
+    second = client.post("/api/assignments/files", headers=user_headers, files={"file": ("copy.jpg", photo, "image/jpeg")})
+    assert first.status_code == 200
+    assert first.json()["digest"] == second.json()["digest"]
+    assert (first.json()["deduplicated"], second.json()["deduplicated"]) == (False, True)
+    assert content_store.path(first.json()["digest"]).read_bytes() == photo
+
+    url = first.json()["url"]
+    # Only the uploader (and staff) may read it, before and after submitting
+    assert client.get(url, headers=user_headers).content == photo
+    course = make_course()
+    assignment = client.post(
+        "/api/assignments/",
+        headers=manager_headers,
+        json={"title": "Log photo", "due_date": "2030-01-01T00:00:00", "course_id": course.id}
+    ).json()
+    submit = f"/api/assignments/{assignment['id']}/submit"
+    submitted = client.post(submit, headers=user_headers, json={"assignment_id": assignment["id"], "file_url": url})
+    assert submitted.status_code == 200
+
+    # Knowing the digest doesn't help: it can't be claimed through a submission
+    other_headers = _student_headers(client)
+    assert client.get(url, headers=other_headers).status_code == 403
+    claimed = client.post(submit, headers=other_headers, json={"assignment_id": assignment["id"], "file_url": url})
+    assert claimed.status_code == 400
+    assert client.get(url, headers=other_headers).status_code == 403
+
+    full = client.get(url, headers=manager_headers)
+    assert full.status_code == 200 and full.content == photo
+    assert full.headers["content-type"] == "image/jpeg"
+
+    partial = client.get(url, headers={**manager_headers, "Range": "bytes=10-19"})
+    assert partial.status_code == 206
+    assert partial.content == photo[10:20]
+    assert partial.headers["content-range"] == f"bytes 10-19/{len(photo)}"
+
+    suffix = client.get(url, headers={**manager_headers, "Range": "bytes=-5"})
+    assert suffix.content == photo[-5:]
+
+    beyond = client.get(url, headers={**manager_headers, "Range": f"bytes={len(photo)}-"})
+    assert beyond.status_code == 416
+
+    cached = client.get(url, headers={**manager_headers, "If-None-Match": full.headers["etag"]})
+    assert cached.status_code == 304
+
+
+def test_uploads_are_limited_while_streaming(client, user_headers, monkeypatch):
+    monkeypatch.setattr(content_store, "max_bytes", 1000)
+    staging = content_store.root / "tmp"
+
+    small = client.post("/api/assignments/files", headers=user_headers, files={"file": ("a.txt", b"x" * 1000, "text/plain")})
+    assert small.status_code == 200
+    assert small.json()["content_type"] == "text/plain"
+
+    over = client.post("/api/assignments/files", headers=user_headers, files={"file": ("b.txt", b"y" * 1001, "text/plain")})
+    assert over.status_code == 413
+    # Rejected on Content-Length before any of the body is read
+    huge = client.post("/api/assignments/files", headers=user_headers, files={"file": ("c.txt", b"z" * 200_000, "text/plain")})
+    assert huge.status_code == 413
+    assert list(staging.iterdir()) == []
+
+    missing = client.post("/api/assignments/files", headers=user_headers, files={"other": ("d.txt", b"d", "text/plain")})
+    assert missing.status_code == 400
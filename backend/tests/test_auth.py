@@ -0,0 +1,13 @@
+from app.api.auth import principal_cache
+
+
+def test_principal_is_invalidated_on_commit(db, make_users):
+    user = make_users(1)[0]
+    old_email = user.email
+    principal_cache.set(old_email, user)
+
+    user.email = f"renamed-{old_email}"
+    db.flush()
+    assert principal_cache.get(old_email) is user
+    db.commit()
+    assert principal_cache.get(old_email) is None
@@ -0,0 +1,64 @@
+import time
+
+from app.api.certificates import certificate_filter
+from app.models import Certificate, Enrollment
+
+
+def test_batch_issuance_is_resumable(client, db, manager_headers, make_users, make_course):
+    course = make_course()
+    users = make_users(5)
+    for user in users:
+        db.add(Enrollment(user_id=user.id, course_id=course.id, progress_percentage=100.0))
+    db.add(Enrollment(user_id=make_users(1)[0].id, course_id=course.id, progress_percentage=40.0))
+    # One learner already generated their own certificate
+    db.add(Certificate(
+        user_id=users[0].id, course_id=course.id, certificate_number="CERT-EXISTING",
+        completed_at=course.created_at, instructor_name="x", course_title="x", student_name="x"
+    ))
+    db.commit()
+
+    response = client.post(f"/api/certificates/issue/{course.id}", headers=manager_headers)
+    assert response.json()["issued"] == 4
+
+    rerun = client.post(f"/api/certificates/issue/{course.id}", headers=manager_headers)
+    assert rerun.json()["issued"] == 0
+
+    certificates = db.query(Certificate).filter(Certificate.course_id == course.id).count()
+    completed = db.query(Enrollment).filter(
+        Enrollment.course_id == course.id, Enrollment.completed_at.isnot(None)
+    ).count()
+    assert certificates == 5
+    assert completed == 4
+
+
+def test_batch_issuance_requires_manager(client, user_headers, make_course):
+    course = make_course()
+    response = client.post(f"/api/certificates/issue/{course.id}", headers=user_headers)
+    assert response.status_code == 403
+
+
+def test_verify_rejects_unknown_numbers_without_querying(client, db, make_users, make_course,
+                                                         count_queries):
+    course = make_course()
+    user = make_users(1)[0]
+    db.add(Certificate(
+        user_id=user.id, course_id=course.id, certificate_number="CERT-20200101-0000ABCD",
+        completed_at=course.created_at, instructor_name="x", course_title="x", student_name="x"
+    ))
+    db.commit()
+    certificate_filter.built_at = 0.0
+
+    # A stale filter is rebuilt in the background; this lookup goes to the database
+    assert client.get("/api/certificates/verify/CERT-20200101-0000ABCD").status_code == 200
+    deadline = time.monotonic() + 5
+    while certificate_filter.is_stale() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not certificate_filter.is_stale()
+
+    count_queries.count = 0
+    assert client.get("/api/certificates/verify/CERT-20200101-0000ABCD").status_code == 200
+    assert client.get("/api/certificates/verify/CERT-20200101-FFFFFFFF").status_code == 404
+    assert client.get("/api/certificates/verify/garbage").status_code == 404
+    # Dated after today: can't have been issued, so no query even past the cutoff
+    assert client.get("/api/certificates/verify/CERT-99991231-DEADBEEF").status_code == 404
+    assert count_queries.count == 0
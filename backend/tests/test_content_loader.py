@@ -0,0 +1,70 @@
+import json
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+
+from app.core.database import engine
+from app.load_content import load_course, load_packs, pack_paths, read_pack
+from app.models import Course, CourseSource, Lesson
+from app.schemas.course import CourseContent
+
+
+def _write_pack(tmp_path, lessons, title="Dish Machine Safety"):
+    pack = {"courses": [{
+        "slug": "dish-machine-safety",
+        "title": title,
+        "category": "Safety",
+        "duration": 2,
+        "lessons": lessons,
+    }]}
+    path = tmp_path / "pack.json"
+    path.write_text(json.dumps(pack))
+    return path
+
+
+def _lessons(count):
+    return [{"title": f"Step {i}", "duration": 5, "order": i} for i in range(count)]
+
+
+def test_loader_bulk_inserts_and_skips_unchanged_courses(tmp_path, db):
+    path = _write_pack(tmp_path, _lessons(50))
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        assert load_packs([str(path)])["created"] == 1
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert sum(s.startswith("INSERT INTO lessons") for s in statements) == 1
+
+    course_id = db.get(CourseSource, "dish-machine-safety").course_id
+    assert db.query(Lesson).filter(Lesson.course_id == course_id).count() == 50
+    assert load_packs([str(path)])["unchanged"] == 1
+
+    # Edits update in place (lesson ids survive) and new lessons are appended
+    lesson_ids = {lesson.order: lesson.id for lesson in db.query(Lesson).filter(Lesson.course_id == course_id)}
+    lessons = _lessons(52)
+    lessons[0]["title"] = "Pre-rinse"
+    assert load_packs([str(_write_pack(tmp_path, lessons, title="Dish Machines"))])["updated"] == 1
+    db.expire_all()
+    updated = {lesson.order: lesson for lesson in db.query(Lesson).filter(Lesson.course_id == course_id)}
+    assert len(updated) == 52 and updated[0].title == "Pre-rinse" and updated[0].id == lesson_ids[0]
+    assert db.get(Course, course_id).title == "Dish Machines"
+
+
+def test_loader_rejects_invalid_packs(tmp_path):
+    with pytest.raises(ValueError, match="order"):
+        load_packs([str(_write_pack(tmp_path, _lessons(2) + _lessons(1)))])
+
+
+def test_bundled_content_packs_are_valid():
+    packs = [read_pack(path) for path in pack_paths([str(Path(__file__).parents[1] / "content")])]
+    assert sum(len(pack.courses) for pack in packs) == 3
+
+
+def test_loader_refuses_to_create_courses_without_an_instructor(db):
+    course = CourseContent(slug="orphan-course", title="Orphan Course", category="Safety", duration=1, lessons=[])
+    with pytest.raises(ValueError, match="no instructor"):
+        load_course(db, course, fallback_instructor_id=None)
+    db.rollback()
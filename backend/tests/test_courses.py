@@ -0,0 +1,143 @@
+from sqlalchemy import update
+
+from app.api.courses import catalog_cache
+from app.models import Lesson
+
+
+def test_course_list_query_count_is_constant(client, user_headers, make_course, count_queries):
+    user_headers = {**user_headers, "X-Cache-Bypass": "1"}
+    make_course(lesson_count=2)
+    # Warm the principal cache so only the catalog queries are counted
+    client.get("/api/courses/", headers=user_headers)
+
+    count_queries.count = 0
+    client.get("/api/courses/", headers=user_headers)
+    baseline = count_queries.count
+
+    created = [make_course(lesson_count=3) for _ in range(5)]
+
+    count_queries.count = 0
+    response = client.get("/api/courses/", headers=user_headers)
+    assert response.status_code == 200
+    lessons = {course["id"]: course["lessons"] for course in response.json()}
+    assert all(len(lessons[course.id]) == 3 for course in created)
+    assert count_queries.count == baseline == 2
+
+
+def test_course_list_without_lessons(client, user_headers, make_course, count_queries):
+    user_headers = {**user_headers, "X-Cache-Bypass": "1"}
+    make_course(lesson_count=2)
+    client.get("/api/courses/", headers=user_headers)
+
+    count_queries.count = 0
+    response = client.get("/api/courses/?include_lessons=false", headers=user_headers)
+    assert response.status_code == 200
+    assert all(course["lessons"] == [] for course in response.json())
+    assert count_queries.count == 1
+
+
+def test_my_courses_query_count_is_constant(client, user_headers, make_course, count_queries):
+    for _ in range(4):
+        course = make_course(lesson_count=2)
+        client.post(f"/api/courses/{course.id}/enroll", headers=user_headers)
+
+    count_queries.count = 0
+    response = client.get("/api/courses/my-courses", headers=user_headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 4
+    assert all(len(course["lessons"]) == 2 for course in response.json())
+    assert count_queries.count == 2
+
+
+def test_course_keyset_pagination_walks_every_course(client, user_headers, make_course):
+    for _ in range(5):
+        make_course()
+    expected = [course["id"] for course in client.get(
+        "/api/courses/?limit=1000&include_lessons=false", headers=user_headers
+    ).json()]
+
+    seen, cursor = [], ""
+    while cursor is not None:
+        page = client.get(
+            "/api/courses/", params={"cursor": cursor, "limit": 2}, headers=user_headers
+        ).json()
+        seen.extend(course["id"] for course in page["items"])
+        cursor = page["next_cursor"]
+
+    assert seen == sorted(expected)
+
+
+def test_course_invalid_cursor(client, user_headers):
+    response = client.get("/api/courses/?cursor=not-a-cursor", headers=user_headers)
+    assert response.status_code == 400
+
+
+def test_course_catalog_revalidates_with_etag(client, user_headers, make_course, count_queries):
+    make_course(lesson_count=1)
+    # The replica has caught up, so its answer may be cached
+    catalog_cache.bumped_at = float("-inf")
+    first = client.get("/api/courses/", headers=user_headers)
+    etag = first.headers["etag"]
+
+    count_queries.count = 0
+    revalidated = client.get("/api/courses/", headers={**user_headers, "If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert count_queries.count == 0
+
+    make_course(title="New Course")
+    changed = client.get("/api/courses/", headers={**user_headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_course_catalog_cache_bypass(client, user_headers, make_course):
+    make_course()
+    client.get("/api/courses/", headers=user_headers)
+    response = client.get("/api/courses/", headers={**user_headers, "X-Cache-Bypass": "1"})
+    assert response.headers["x-cache"] == "BYPASS"
+
+
+def test_course_detail_is_one_query(client, user_headers, make_course, count_queries):
+    course = make_course()
+    client.post(f"/api/courses/{course.id}/enroll", headers=user_headers)
+
+    count_queries.count = 0
+    response = client.get(f"/api/courses/{course.id}", headers=user_headers)
+    assert response.json()["is_enrolled"] is True
+    assert response.json()["has_certificate"] is False
+    assert count_queries.count == 1
+
+
+def test_bulk_enrollment_skips_existing(client, manager_headers, make_users, make_course):
+    course = make_course()
+    crew_ids = [user.id for user in make_users(3)]
+
+    first = client.post(f"/api/courses/{course.id}/enrollments", headers=manager_headers,
+                        json={"user_ids": crew_ids[:2]})
+    assert first.json()["created"] == 2
+
+    second = client.post(f"/api/courses/{course.id}/enrollments", headers=manager_headers,
+                         json={"user_ids": crew_ids + [999999]})
+    assert second.json() == {
+        "course_id": course.id,
+        "requested": 4,
+        "created": 1,
+        "already_enrolled": 2,
+        "unknown_user_ids": [999999],
+    }
+
+
+def test_catalog_version_bumps_on_commit_only(db, make_course):
+    course = make_course()
+    version = catalog_cache.version
+
+    course.title = "Renamed"
+    db.flush()
+    assert catalog_cache.version == version
+    db.commit()
+    assert catalog_cache.version == version + 1
+
+    db.execute(update(Lesson).where(Lesson.course_id == course.id).values(duration=5))
+    db.rollback()
+    assert catalog_cache.version == version + 1
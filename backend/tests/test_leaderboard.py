@@ -0,0 +1,108 @@
+import asyncio
+from datetime import date
+
+from app.api.leaderboard import LeaderboardIndex, leaderboard_index
+from app.api.progress import progress_buffer
+from app.core.database import AsyncSessionLocal
+from app.models import DailyActivity, Enrollment, LeaderboardEntry, LeaderboardSnapshot
+from app.schemas.progress import ProgressUpdate
+
+
+def test_leaderboard_tracks_flushed_progress(client, db, user_headers, admin_headers,
+                                             make_users, make_course):
+    course = make_course()
+    rivals = make_users(2)
+    for rival, points in zip(rivals, (50, 5)):
+        db.add(Enrollment(user_id=rival.id, course_id=course.id))
+        db.commit()
+        progress_buffer.add(rival.id, course.id, ProgressUpdate(points=points, time_spent=1))
+    client.post(f"/api/courses/{course.id}/enroll", headers=user_headers)
+    client.post(f"/api/progress/{course.id}", headers=user_headers,
+                json={"points": 20, "time_spent": 3})
+    asyncio.run(progress_buffer.flush())
+    leaderboard_index.reset()
+
+    me = client.get("/api/leaderboard/me", headers=user_headers).json()
+    top = client.get("/api/leaderboard/?limit=100", headers=user_headers).json()
+    ranks = {entry["user_id"]: entry["rank"] for entry in top}
+    assert me["total_points"] == 20
+    assert me["total_time_spent"] == 3
+    assert ranks[rivals[0].id] < me["rank"] < ranks[rivals[1].id]
+    assert [entry["rank"] for entry in top] == list(range(1, len(top) + 1))
+
+    verify = client.post("/api/leaderboard/rebuild?dry_run=true", headers=admin_headers)
+    assert verify.json()["mismatches"] == 0
+
+
+def test_leaderboard_rebuild_repairs_drift(client, db, admin_headers, make_users, make_course):
+    user = make_users(1)[0]
+    db.add(LeaderboardEntry(user_id=user.id, total_points=999))
+    db.commit()
+
+    assert client.post("/api/leaderboard/rebuild", headers=admin_headers).json()["mismatches"] >= 1
+    assert db.get(LeaderboardEntry, user.id) is None
+    verify = client.post("/api/leaderboard/rebuild?dry_run=true", headers=admin_headers)
+    assert verify.json()["mismatches"] == 0
+
+
+def test_window_leaderboard_snapshots_finished_windows(client, db, user_headers, make_users):
+    rival, other = make_users(2)
+    db.add_all([
+        DailyActivity(user_id=rival.id, day=date(2024, 3, 4), points=30, time_spent=10),
+        DailyActivity(user_id=rival.id, day=date(2024, 3, 6), points=5, time_spent=2),
+        DailyActivity(user_id=other.id, day=date(2024, 3, 5), points=20, time_spent=4),
+        DailyActivity(user_id=other.id, day=date(2024, 3, 12), points=99, time_spent=9),
+    ])
+    db.commit()
+
+    week = client.get("/api/leaderboard/window?period=week&on=2024-03-07", headers=user_headers)
+    body = week.json()
+    assert (body["start"], body["end"], body["finished"]) == ("2024-03-04", "2024-03-10", True)
+    assert [(e["user_id"], e["points"]) for e in body["entries"]] == [(rival.id, 35), (other.id, 20)]
+
+    # Late writes to a frozen window don't change its results
+    db.add(DailyActivity(user_id=other.id, day=date(2024, 3, 7), points=100, time_spent=1))
+    db.commit()
+    again = client.get("/api/leaderboard/window?period=week&on=2024-03-07", headers=user_headers)
+    assert again.json()["entries"] == body["entries"]
+
+    month = client.get("/api/leaderboard/window?period=month&on=2024-03-01", headers=user_headers)
+    assert month.json()["entries"][0] == {**month.json()["entries"][0], "user_id": other.id, "points": 219}
+
+
+def test_custom_window_requires_range(client, user_headers):
+    response = client.get("/api/leaderboard/window?period=custom&start=2024-03-01", headers=user_headers)
+    assert response.status_code == 400
+
+
+def test_custom_windows_are_not_snapshotted(client, db, user_headers, make_users):
+    rival = make_users(1)[0]
+    db.add(DailyActivity(user_id=rival.id, day=date(2023, 5, 2), points=7, time_spent=1))
+    db.commit()
+
+    response = client.get(
+        "/api/leaderboard/window?period=custom&start=2023-05-01&end=2023-05-03", headers=user_headers
+    )
+    assert response.json()["finished"] is True
+    assert [(e["user_id"], e["points"]) for e in response.json()["entries"]] == [(rival.id, 7)]
+    assert db.query(LeaderboardSnapshot).filter(LeaderboardSnapshot.window_start == date(2023, 5, 1)).count() == 0
+
+
+def test_other_workers_drop_entries_removed_by_a_rebuild(client, db, admin_headers, make_users):
+    user = make_users(1)[0]
+    db.add(LeaderboardEntry(user_id=user.id, total_points=999))
+    db.commit()
+
+    # Another worker's index, loaded before the rebuild
+    other = LeaderboardIndex(sync_interval=60)
+    asyncio.run(_sync(other))
+    assert other.get(user.id) is not None
+
+    client.post("/api/leaderboard/rebuild", headers=admin_headers)
+    asyncio.run(_sync(other))
+    assert other.get(user.id) is None
+
+
+async def _sync(index):
+    async with AsyncSessionLocal() as session:
+        await index.sync(session, force=True)
@@ -0,0 +1,37 @@
+import re
+
+
+def _sample(text, name, **labels):
+    """Value of one series from the Prometheus text output (0 if absent)"""
+    for line in text.splitlines():
+        match = re.match(rf"{name}\{{(.*)\}} (\S+)$", line)
+        if match and all(f'{key}="{value}"' in match.group(1) for key, value in labels.items()):
+            return float(match.group(2))
+    return 0.0
+
+
+def test_statements_are_attributed_to_the_route_template(client, user_headers, make_course, count_queries):
+    course = make_course(lesson_count=2)
+    route = "/api/courses/{course_id}"
+    before = client.get("/metrics").text
+    count_queries.count = 0
+    response = client.get(f"/api/courses/{course.id}", headers=user_headers)
+    assert response.status_code == 200
+    issued = count_queries.count
+    after = client.get("/metrics").text
+
+    assert issued > 0
+    statements = _sample(after, "db_statements_per_request_sum", method="GET", route=route) \
+        - _sample(before, "db_statements_per_request_sum", method="GET", route=route)
+    assert statements == issued
+    assert _sample(after, "db_statements_per_request_count", method="GET", route=route) \
+        == _sample(before, "db_statements_per_request_count", method="GET", route=route) + 1
+    assert _sample(after, "http_request_duration_seconds_count", method="GET", route=route, status="200") >= 1
+    # Raw paths never become labels
+    assert f"/api/courses/{course.id}\"" not in after
+
+
+def test_unmatched_paths_share_one_label(client):
+    client.get("/no/such/path")
+    text = client.get("/metrics").text
+    assert _sample(text, "http_request_duration_seconds_count", route="unmatched", status="404") >= 1
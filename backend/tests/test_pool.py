@@ -0,0 +1,71 @@
+from sqlalchemy import create_engine, text
+
+from app.core import database
+from app.core.config import settings
+from app.core.pool import (
+    POOL_CHECKOUT_SECONDS,
+    POOL_IN_USE,
+    POOL_PRE_PING_SECONDS,
+    TimedAsyncAdaptedQueuePool,
+    TimedNullPool,
+    TimedQueuePool,
+    instrument_pool
+)
+
+
+def _capture_engine_args(monkeypatch):
+    captured = {}
+    def fake_create_async_engine(url, **kwargs):
+        captured.update(kwargs, url=url)
+    monkeypatch.setattr(database, "create_async_engine", fake_create_async_engine)
+    return captured
+
+
+def test_requests_report_checkout_time_and_release_connections(client, user_headers):
+    before = POOL_CHECKOUT_SECONDS._series.get(("primary",), [0])[-1]
+    client.get("/api/auth/me", headers=user_headers)
+    client.get("/api/assignments/", headers=user_headers)
+    assert POOL_CHECKOUT_SECONDS._series[("primary",)][-1] > before
+    assert POOL_IN_USE._values.get(("primary",), 0) == 0
+    assert 'db_pool_checkout_seconds_count{engine="primary"}' in client.get("/metrics").text
+
+
+def test_pre_ping_cost_is_measured(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path}/ping.db", poolclass=TimedQueuePool, pool_pre_ping=True, pool_logging_name="ping-test"
+    )
+    instrument_pool(engine, "ping-test")
+    for _ in range(2):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    assert POOL_PRE_PING_SECONDS._series[("ping-test",)][-1] >= 1
+    engine.dispose()
+
+
+def test_pgbouncer_mode_disables_client_pool_and_prepared_statements(monkeypatch):
+    monkeypatch.setattr(settings, "DATABASE_POOL_MODE", "pgbouncer")
+    captured = _capture_engine_args(monkeypatch)
+    database._create_async_engine("postgresql://u:p@ep-x-pooler.neon.tech/db?sslmode=require", "primary")
+
+    assert captured["poolclass"] is TimedNullPool
+    assert "pool_size" not in captured and "pool_pre_ping" not in captured
+    assert captured["connect_args"]["statement_cache_size"] == 0
+    assert captured["connect_args"]["prepared_statement_cache_size"] == 0
+    assert "server_settings" not in captured["connect_args"]
+    assert captured["connect_args"]["ssl"] == "require"
+
+
+def test_pool_sizing_comes_from_settings(monkeypatch):
+    monkeypatch.setattr(settings, "DATABASE_POOL_MODE", "pgbouncer")
+    monkeypatch.setattr(settings, "DATABASE_POOL_SIZE", 2)
+    captured = _capture_engine_args(monkeypatch)
+    database._create_async_engine("postgresql://u:p@host/db", "primary")
+    assert captured["poolclass"] is TimedAsyncAdaptedQueuePool
+    assert (captured["pool_size"], captured["max_overflow"]) == (2, 0)
+
+    monkeypatch.setattr(settings, "DATABASE_POOL_MODE", "direct")
+    monkeypatch.setattr(settings, "DATABASE_POOL_SIZE", None)
+    database._create_async_engine("postgresql://u:p@host/db", "primary")
+    assert (captured["pool_size"], captured["max_overflow"]) == (10, 20)
+    assert captured["pool_pre_ping"] is True
+    assert captured["connect_args"]["server_settings"] == {"timezone": "utc"}
@@ -0,0 +1,94 @@
+import asyncio
+from datetime import datetime
+
+from sqlalchemy.exc import OperationalError
+
+from app.api.progress import BufferFull, ProgressBuffer, progress_buffer
+from app.models import Enrollment, Progress
+from app.schemas.progress import ProgressUpdate
+
+
+def test_progress_heartbeats_are_coalesced(client, db, user_headers, make_course):
+    course = make_course()
+    client.post(f"/api/courses/{course.id}/enroll", headers=user_headers)
+    user_id = client.get("/api/auth/me", headers=user_headers).json()["id"]
+
+    for percentage in (10, 30, 20):
+        response = client.post(
+            f"/api/progress/{course.id}",
+            headers=user_headers,
+            json={"completion_percentage": percentage, "time_spent": 2, "points": 5}
+        )
+        assert response.status_code == 202
+    assert db.query(Progress).filter(Progress.user_id == user_id).count() == 0
+
+    asyncio.run(progress_buffer.flush())
+    client.post(f"/api/progress/{course.id}", headers=user_headers, json={"time_spent": 1})
+    asyncio.run(progress_buffer.flush())
+
+    progress = db.query(Progress).filter(Progress.user_id == user_id).one()
+    assert progress.completion_percentage == 30
+    assert progress.time_spent == 7
+    assert progress.points == 15
+    assert progress.streak == 1
+    enrollment = db.query(Enrollment).filter(Enrollment.user_id == user_id).one()
+    assert enrollment.progress_percentage == 30
+
+
+def test_progress_without_enrollment_is_dropped(client, db, user_headers, make_course):
+    course = make_course()
+    client.post(f"/api/progress/{course.id}", headers=user_headers, json={"points": 5})
+    assert asyncio.run(progress_buffer.flush()) == 0
+    assert db.query(Progress).filter(Progress.course_id == course.id).count() == 0
+
+
+def test_oversized_heartbeats_are_rejected(client, user_headers, make_course):
+    course = make_course()
+    response = client.post(f"/api/progress/{course.id}", headers=user_headers, json={"points": 2**70})
+    assert response.status_code == 422
+
+
+def test_a_rejected_row_does_not_block_other_progress(client, db, user_headers, make_users, make_course):
+    course = make_course()
+    client.post(f"/api/courses/{course.id}/enroll", headers=user_headers)
+    user_id = client.get("/api/auth/me", headers=user_headers).json()["id"]
+    client.post(f"/api/progress/{course.id}", headers=user_headers, json={"points": 5})
+
+    # Bypasses validation, as a value the database can't store would
+    bad_user = make_users(1)[0]
+    db.add(Enrollment(user_id=bad_user.id, course_id=course.id))
+    db.commit()
+    progress_buffer._pending[(bad_user.id, course.id)] = {
+        "completion_percentage": 0.0, "time_spent": 0, "points": 2**70, "last_accessed": datetime.utcnow()
+    }
+
+    assert asyncio.run(progress_buffer.flush()) == 1
+    assert len(progress_buffer) == 0
+    assert db.query(Progress).filter(Progress.user_id == user_id).one().points == 5
+    assert db.query(Progress).filter(Progress.user_id == bad_user.id).count() == 0
+
+
+def test_database_outage_flushes_once_and_caps_the_buffer(monkeypatch):
+    buffer = ProgressBuffer(flush_interval=60, max_pending=2, max_rows=10)
+    attempts = []
+
+    async def down(pending):
+        attempts.append(len(pending))
+        raise OperationalError("INSERT", {}, Exception("connection refused"))
+    monkeypatch.setattr(buffer, "_write", down)
+
+    async def heartbeats():
+        accepted = 0
+        for user_id in range(200):
+            try:
+                buffer.add(user_id, 1, ProgressUpdate(points=1))
+                accepted += 1
+            except BufferFull:
+                pass
+            await asyncio.sleep(0)
+        await asyncio.gather(*buffer._background, return_exceptions=True)
+        return accepted
+
+    assert asyncio.run(heartbeats()) == 10
+    assert len(attempts) == 1
+    assert len(buffer) == 10
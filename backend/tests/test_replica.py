@@ -0,0 +1,84 @@
+import time
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.courses import catalog_cache
+from app.core import database
+from app.core.pool import POOL_CONNECTIONS_OPENED
+from app.core.replica import READ_ROUTING, replica_router
+
+
+def _routed(reason):
+    return READ_ROUTING._values.get(("replica" if reason == "healthy" else "primary", reason), 0)
+
+
+@pytest.fixture
+def fresh_router(monkeypatch):
+    monkeypatch.setattr(replica_router, "checked_at", float("-inf"))
+    monkeypatch.setattr(replica_router, "down_until", 0.0)
+    monkeypatch.setattr(replica_router, "lag", None)
+    replica_router.pinned.clear()
+    yield replica_router
+    replica_router.pinned.clear()
+
+
+def test_catalog_reads_use_a_healthy_replica(client, user_headers, fresh_router):
+    before = _routed("healthy")
+    response = client.get("/api/courses/", headers={**user_headers, "X-Cache-Bypass": "1"})
+    assert response.status_code == 200
+    assert _routed("healthy") == before + 1
+    assert fresh_router.lag == 0
+
+
+def test_writers_read_from_the_primary_until_the_replica_catches_up(client, user_headers, make_course, fresh_router):
+    course = make_course()
+    assert client.post(f"/api/courses/{course.id}/enroll", headers=user_headers).status_code == 200
+
+    before = _routed("pinned")
+    response = client.get(f"/api/courses/{course.id}", headers=user_headers)
+    assert response.json()["is_enrolled"] is True
+    assert _routed("pinned") == before + 1
+
+
+def test_lagging_replica_falls_back_to_primary(client, user_headers, fresh_router, monkeypatch):
+    async def lagging(replica):
+        return 60.0
+    monkeypatch.setattr(fresh_router, "_measure_lag", lagging)
+    before = _routed("replica_lag")
+    assert client.get("/api/certificates/", headers=user_headers).status_code == 200
+    assert _routed("replica_lag") == before + 1
+
+
+def test_unreachable_replica_falls_back_and_backs_off(client, user_headers, fresh_router, monkeypatch, tmp_path):
+    broken = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/missing/replica.db")
+    monkeypatch.setitem(database._engines, "replica", broken)
+    before = _routed("replica_down")
+    for _ in range(2):
+        response = client.get("/api/courses/", headers={**user_headers, "X-Cache-Bypass": "1"})
+        assert response.status_code == 200
+    assert _routed("replica_down") == before + 2
+    assert fresh_router.down_until > time.monotonic()
+
+
+def test_replica_catalog_reads_are_not_cached_right_after_a_change(client, user_headers, make_course, fresh_router):
+    make_course()
+    first = client.get("/api/courses/", headers=user_headers)
+    again = client.get("/api/courses/", headers=user_headers)
+    assert (first.headers["x-cache"], again.headers["x-cache"]) == ("MISS", "MISS")
+
+    catalog_cache.bumped_at = float("-inf")
+    client.get("/api/courses/", headers=user_headers)
+    assert client.get("/api/courses/", headers=user_headers).headers["x-cache"] == "HIT"
+
+
+def test_catalog_revalidation_opens_no_connection(client, user_headers, make_course, fresh_router):
+    make_course()
+    catalog_cache.bumped_at = float("-inf")
+    etag = client.get("/api/courses/", headers=user_headers).headers["etag"]
+
+    opened = dict(POOL_CONNECTIONS_OPENED._values)
+    for _ in range(5):
+        response = client.get("/api/courses/", headers={**user_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+    assert POOL_CONNECTIONS_OPENED._values == opened
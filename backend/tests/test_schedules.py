@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+
+from app.models import Schedule
+from app.models.schedule import ScheduleType
+
+
+def _add_schedule(db, course, title, start, end, type=ScheduleType.LIVE):
+    db.add(Schedule(course_id=course.id, title=title, type=type, start_time=start, end_time=end))
+    db.commit()
+
+
+def test_schedules_overlap_range_for_enrolled_courses(client, db, user_headers, make_course):
+    enrolled, other = make_course(title="Food Safety"), make_course()
+    client.post(f"/api/courses/{enrolled.id}/enroll", headers=user_headers)
+    _add_schedule(db, enrolled, "Spans start", datetime(2024, 5, 31, 23), datetime(2024, 6, 1, 1))
+    _add_schedule(db, enrolled, "Inside", datetime(2024, 6, 10, 9), datetime(2024, 6, 10, 10))
+    _add_schedule(db, enrolled, "After", datetime(2024, 7, 1, 9), datetime(2024, 7, 1, 10))
+    _add_schedule(db, other, "Not enrolled", datetime(2024, 6, 10, 9), datetime(2024, 6, 10, 10))
+
+    response = client.get(
+        "/api/schedules/?start=2024-06-01T00:00:00Z&end=2024-07-01T00:00:00Z",
+        headers=user_headers
+    )
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()] == ["Spans start", "Inside"]
+    assert response.json()[0]["course_title"] == "Food Safety"
+
+    invalid = client.get("/api/schedules/?start=2024-07-01T00:00:00&end=2024-06-01T00:00:00", headers=user_headers)
+    assert invalid.status_code == 400
+
+
+def test_calendar_feed_streams_ics_and_revalidates(client, db, user_headers, make_course):
+    course = make_course(title="Kitchen, Safety; Basics")
+    client.post(f"/api/courses/{course.id}/enroll", headers=user_headers)
+    now = datetime.utcnow()
+    _add_schedule(db, course, "Final exam", now.replace(microsecond=0), now, ScheduleType.EXAM)
+
+    feed_url = client.get("/api/schedules/feed", headers=user_headers).json()["url"]
+    response = client.get(feed_url)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/calendar")
+    body = response.text
+    assert body.startswith("BEGIN:VCALENDAR\r\n") and body.endswith("END:VCALENDAR\r\n")
+    assert "SUMMARY:Kitchen\\, Safety\\; Basics: Final exam" in body.replace("\r\n ", "")
+    assert "CATEGORIES:EXAM" in body
+
+    etag = response.headers["etag"]
+    assert client.get(feed_url, headers={"If-None-Match": etag}).status_code == 304
+
+    _add_schedule(db, course, "Review", now, now)
+    changed = client.get(feed_url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+
+    assert client.get("/api/schedules/calendar.ics?token=bogus").status_code == 401
+
+
+def test_feed_token_is_not_a_bearer_token(client, user_headers):
+    token = client.get("/api/schedules/feed", headers=user_headers).json()["token"]
+    response = client.get("/api/auth/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
+
+
+def test_schedules_without_a_type_default_to_live(client, db, user_headers, make_course):
+    course = make_course()
+    client.post(f"/api/courses/{course.id}/enroll", headers=user_headers)
+    now = datetime.utcnow().replace(microsecond=0)
+    _add_schedule(db, course, "Untyped", now, now + timedelta(hours=1))
+    db.execute(update(Schedule).where(Schedule.course_id == course.id).values(type=None))
+    db.commit()
+
+    window = {"start": (now - timedelta(hours=1)).isoformat(), "end": (now + timedelta(hours=2)).isoformat()}
+    listed = client.get("/api/schedules/", params=window, headers=user_headers)
+    assert [row["type"] for row in listed.json()] == ["live"]
+    feed_url = client.get("/api/schedules/feed", headers=user_headers).json()["url"]
+    assert "CATEGORIES:LIVE" in client.get(feed_url).text
@@ -0,0 +1,58 @@
+from app.api.search import typeahead
+from app.models import Course
+
+
+def test_search_ranks_and_highlights_courses_and_lessons(client, db, user_headers, make_course):
+    in_title = make_course(title="Grease trap maintenance", description="Weekly kitchen duties")
+    in_description = make_course(title="Kitchen basics", description="Covers grease <fires> and spills")
+    lesson_course = make_course(lesson_count=1, title="Closing shift")
+    lesson_course.lessons[0].description = "Empty the grease bins before mopping"
+    db.commit()
+
+    response = client.get("/api/search/?q=grease", headers=user_headers)
+    assert response.status_code == 200
+    body = response.json()
+    hits = [hit["id"] for hit in body["courses"]]
+    # Title matches outrank description matches
+    assert hits.index(in_title.id) < hits.index(in_description.id)
+    highlight = next(hit["highlight"] for hit in body["courses"] if hit["id"] == in_description.id)
+    assert "<mark>grease</mark> &lt;fires&gt;" in highlight
+    lesson = next(hit for hit in body["lessons"] if hit["course_id"] == lesson_course.id)
+    assert lesson["course_title"] == "Closing shift"
+
+
+def test_search_index_follows_writes(client, db, user_headers, make_course):
+    course = make_course(title="Allergen labelling")
+    assert [hit["id"] for hit in client.get("/api/search/?q=allergen", headers=user_headers).json()["courses"]] == [course.id]
+
+    course.title = "Sanitizer concentrations"
+    db.commit()
+    assert client.get("/api/search/?q=allergen", headers=user_headers).json()["courses"] == []
+    # Stemming: "concentration" matches "concentrations"
+    hits = client.get("/api/search/?q=concentration", headers=user_headers).json()["courses"]
+    assert [hit["id"] for hit in hits] == [course.id]
+
+    # Query syntax in user input is treated as plain words
+    assert client.get('/api/search/?q="NEAR(*', headers=user_headers).status_code == 200
+
+
+def test_autocomplete_matches_word_prefixes_and_picks_up_new_titles(
+    client, db, user_headers, make_course, monkeypatch
+):
+    course = make_course(lesson_count=1, title="Walk-in Cooler Temperatures")
+    hits = client.get("/api/search/autocomplete?q=walk", headers=user_headers).json()
+    assert {"type": "course", "id": course.id, "title": course.title, "course_id": course.id} in hits
+    # Any word start matches, and punctuation/case are ignored
+    assert course.id in [hit["id"] for hit in client.get("/api/search/autocomplete?q=COOLER t", headers=user_headers).json()]
+
+    # ORM writes in this process are indexed immediately
+    course.lessons[0].title = "Thermometer calibration"
+    db.commit()
+    lesson_hits = client.get("/api/search/autocomplete?q=thermom", headers=user_headers).json()
+    assert [(hit["type"], hit["course_id"]) for hit in lesson_hits] == [("lesson", course.id)]
+
+    # Rows written without mapper events (e.g. another process) arrive on the next sync
+    db.execute(Course.__table__.insert().values(title="Xylophone safety"))
+    db.commit()
+    monkeypatch.setattr(typeahead, "sync_interval", 0)
+    assert [hit["title"] for hit in client.get("/api/search/autocomplete?q=xylo", headers=user_headers).json()] == ["Xylophone safety"]
@@ -0,0 +1,68 @@
+import json
+from datetime import datetime, timedelta
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from app.models import Assignment, Certificate, Course
+from app.schemas.assignment import AssignmentResponse
+from app.schemas.certificate import CertificateResponse
+from app.schemas.course import CourseResponse
+
+
+def _expected(schema, objects):
+    """What the pydantic response_model path would have produced"""
+    adapter = TypeAdapter(List[schema])
+    return json.loads(adapter.dump_json(adapter.validate_python(objects, from_attributes=True)))
+
+
+def test_course_list_matches_schema_output(client, db, user_headers, make_course):
+    created = [make_course(lesson_count=3, description="Fast path", rating=4.5), make_course(lesson_count=0)]
+    ids = [course.id for course in created]
+    response = client.get(
+        "/api/courses/",
+        params={"cursor": "", "limit": 1000},
+        headers={**user_headers, "X-Cache-Bypass": "1"}
+    )
+    assert response.status_code == 200
+
+    assert response.json()["next_cursor"] is None
+    # Other tests leave rows the schema would reject, so compare just these courses
+    served = [course for course in response.json()["items"] if course["id"] in ids]
+    expected = _expected(CourseResponse, db.scalars(select(Course).where(Course.id.in_(ids)).order_by(Course.id)).all())
+    for course in expected:
+        course["lessons"].sort(key=lambda lesson: lesson["id"])
+    assert served == expected
+    assert len(served[0]["lessons"]) == 3
+
+
+def test_assignment_and_certificate_lists_match_schema_output(client, db, user_headers, make_course):
+    course = make_course()
+    db.add(Assignment(course_id=course.id, title="Quiz", due_date=datetime(2030, 1, 1, 9, 30)))
+    me = client.get("/api/auth/me", headers=user_headers).json()
+    for days, certified in ((1, course), (2, make_course())):
+        db.add(Certificate(
+            user_id=me["id"],
+            course_id=certified.id,
+            certificate_number=f"CERT-FAST-{me['id']}-{days}",
+            issued_at=datetime.utcnow() - timedelta(days=days),
+            completed_at=datetime.utcnow() - timedelta(days=days),
+            instructor_name="Instructor",
+            course_title=certified.title,
+            student_name="Test User",
+            grade="A"
+        ))
+    db.commit()
+
+    response = client.get("/api/assignments/", params={"cursor": "", "limit": 1000}, headers=user_headers)
+    served = [item for item in response.json()["items"] if item["course_id"] == course.id]
+    assignments = db.scalars(select(Assignment).where(Assignment.course_id == course.id)).all()
+    assert served == _expected(AssignmentResponse, assignments)
+
+    response = client.get("/api/certificates/", headers=user_headers)
+    certificates = db.scalars(
+        select(Certificate).where(Certificate.user_id == me["id"]).order_by(Certificate.issued_at.desc())
+    ).all()
+    assert len(response.json()) == 2
+    assert response.json() == _expected(CertificateResponse, certificates)
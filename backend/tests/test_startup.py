@@ -0,0 +1,32 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from app.startup_check import measure
+
+BACKEND = Path(__file__).resolve().parent.parent
+
+
+def test_importing_the_app_does_not_touch_the_database(tmp_path):
+    # A database in a directory that doesn't exist would fail any DDL or connect
+    probe = (
+        "import sys, app.main\n"
+        "assert 'aiosqlite' not in sys.modules and 'asyncpg' not in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=BACKEND,
+        capture_output=True,
+        text=True,
+        env={"DATABASE_URL": f"sqlite:///{tmp_path}/missing/app.db", "PATH": ""}
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_startup_budget_probe_reports_each_phase():
+    timings, slowest = measure(path="/health")
+    assert timings["status"] == 200
+    assert set(timings) >= {"import", "startup", "first_request"}
+    # Generous bound; python -m app.startup_check enforces the real budget
+    assert timings["import"] < 30
+    assert slowest and all(seconds >= 0 for seconds, _ in slowest)
@@ -40,6 +40,15 @@ CREATE INDEX idx_courses_category ON courses(category);
 CREATE INDEX idx_courses_level ON courses(level);
 CREATE INDEX idx_courses_instructor ON courses(instructor_id);
 
+-- Full-text search: weighted tsvector maintained by Postgres, GIN-indexed
+ALTER TABLE courses ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(category, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'C')
+    ) STORED;
+CREATE INDEX ix_courses_search_vector ON courses USING GIN (search_vector);
+
 -- Lessons Table
 CREATE TABLE lessons (
     id SERIAL PRIMARY KEY,
@@ -55,6 +64,21 @@ CREATE TABLE lessons (
 CREATE INDEX idx_lessons_course ON lessons(course_id);
 CREATE INDEX idx_lessons_order ON lessons("order");
 
+ALTER TABLE lessons ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'C')
+    ) STORED;
+CREATE INDEX ix_lessons_search_vector ON lessons USING GIN (search_vector);
+
+-- Course Sources Table (content packs each course was loaded from)
+CREATE TABLE course_sources (
+    slug VARCHAR(255) PRIMARY KEY,
+    course_id INTEGER NOT NULL UNIQUE REFERENCES courses(id) ON DELETE CASCADE,
+    content_hash VARCHAR(64) NOT NULL,
+    loaded_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Enrollments Table
 CREATE TABLE enrollments (
     id SERIAL PRIMARY KEY,
@@ -81,9 +105,27 @@ CREATE TABLE progress (
     last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     streak INTEGER DEFAULT 0, -- days
     points INTEGER DEFAULT 0,
-    completed BOOLEAN DEFAULT FALSE
+    completed BOOLEAN DEFAULT FALSE,
+    -- One row per user and course; progress writes upsert ON CONFLICT (user_id, course_id)
+    CONSTRAINT uq_progress_user_course UNIQUE (user_id, course_id)
 );
 
+-- Existing databases: merge duplicates onto the oldest row, then add the constraint
+--   UPDATE progress keep SET
+--       time_spent = totals.time_spent,
+--       points = totals.points,
+--       completion_percentage = totals.completion_percentage,
+--       last_accessed = totals.last_accessed
+--   FROM (
+--       SELECT min(id) AS id, sum(time_spent) AS time_spent, sum(points) AS points,
+--              max(completion_percentage) AS completion_percentage, max(last_accessed) AS last_accessed
+--       FROM progress GROUP BY user_id, course_id HAVING count(*) > 1
+--   ) totals
+--   WHERE keep.id = totals.id;
+--   DELETE FROM progress dup USING progress keep
+--   WHERE dup.user_id = keep.user_id AND dup.course_id = keep.course_id AND dup.id > keep.id;
+--   ALTER TABLE progress ADD CONSTRAINT uq_progress_user_course UNIQUE (user_id, course_id);
+
 CREATE INDEX idx_progress_user ON progress(user_id);
 CREATE INDEX idx_progress_course ON progress(course_id);
 CREATE INDEX idx_progress_lesson ON progress(lesson_id);
@@ -118,6 +160,38 @@ CREATE INDEX idx_submissions_assignment ON submissions(assignment_id);
 CREATE INDEX idx_submissions_student ON submissions(student_id);
 CREATE INDEX idx_submissions_status ON submissions(status);
 
+-- Schedules Table
+CREATE TABLE schedules (
+    id SERIAL PRIMARY KEY,
+    course_id INTEGER NOT NULL REFERENCES courses(id) ON DELETE CASCADE,
+    title VARCHAR(255) NOT NULL,
+    type VARCHAR(50) DEFAULT 'live' CHECK (type IN ('live', 'exam', 'assignment')),
+    start_time TIMESTAMP NOT NULL,
+    end_time TIMESTAMP NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX ix_schedules_course_start ON schedules(course_id, start_time);
+CREATE INDEX ix_schedules_course_end ON schedules(course_id, end_time);
+
+-- Stored Files Table (content-addressed submission uploads)
+CREATE TABLE stored_files (
+    digest VARCHAR(64) PRIMARY KEY,
+    size BIGINT NOT NULL,
+    content_type VARCHAR(255),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Who uploaded each stored file (identical uploads share one stored file)
+CREATE TABLE file_uploads (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    digest VARCHAR(64) NOT NULL REFERENCES stored_files(digest) ON DELETE CASCADE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_file_uploads_user_digest UNIQUE (user_id, digest)
+);
+
 -- Certificates Table
 CREATE TABLE certificates (
     id SERIAL PRIMARY KEY,
@@ -143,21 +217,82 @@ CREATE TABLE achievements (
 
 CREATE INDEX idx_achievements_user ON achievements(user_id);
 
--- Leaderboard View (for quick access)
+-- Leaderboard Entries (per-user totals maintained incrementally by the API)
+CREATE TABLE leaderboard_entries (
+    user_id INTEGER PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+    total_points INTEGER NOT NULL DEFAULT 0,
+    courses_completed INTEGER NOT NULL DEFAULT 0,
+    current_streak INTEGER NOT NULL DEFAULT 0,
+    total_time_spent INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_leaderboard_entries_updated ON leaderboard_entries(updated_at);
+
+-- Rebuild generation; workers reload their in-memory ranking when it changes
+CREATE TABLE leaderboard_state (
+    id INTEGER PRIMARY KEY,
+    generation INTEGER NOT NULL DEFAULT 0,
+    rebuilt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Daily point/time buckets backing windowed leaderboards
+CREATE TABLE daily_activity (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    day DATE NOT NULL,
+    points INTEGER NOT NULL DEFAULT 0,
+    time_spent INTEGER NOT NULL DEFAULT 0,
+    CONSTRAINT uq_daily_activity_user_day UNIQUE (user_id, day)
+);
+
+CREATE INDEX ix_daily_activity_day_user ON daily_activity(day, user_id);
+
+-- Frozen rankings of finished leaderboard windows
+CREATE TABLE leaderboard_snapshots (
+    id SERIAL PRIMARY KEY,
+    window_start DATE NOT NULL,
+    window_end DATE NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_leaderboard_snapshots_window UNIQUE (window_start, window_end)
+);
+
+CREATE TABLE leaderboard_snapshot_entries (
+    id SERIAL PRIMARY KEY,
+    snapshot_id INTEGER NOT NULL REFERENCES leaderboard_snapshots(id) ON DELETE CASCADE,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    rank INTEGER NOT NULL,
+    points INTEGER NOT NULL DEFAULT 0,
+    time_spent INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX ix_leaderboard_snapshot_entries_rank ON leaderboard_snapshot_entries(snapshot_id, rank);
+CREATE INDEX ix_leaderboard_snapshot_entries_user ON leaderboard_snapshot_entries(snapshot_id, user_id);
+
+-- Leaderboard View (recomputed from source tables; aggregates separately to avoid join fan-out)
 CREATE OR REPLACE VIEW leaderboard AS
 SELECT 
     u.id,
     u.name,
     u.avatar,
-    COALESCE(SUM(p.points), 0) as total_points,
-    COALESCE(COUNT(DISTINCT e.course_id) FILTER (WHERE e.completed_at IS NOT NULL), 0) as courses_completed,
-    COALESCE(MAX(p.streak), 0) as current_streak,
-    COALESCE(SUM(p.time_spent), 0) as total_time_spent
+    COALESCE(p.total_points, 0) as total_points,
+    COALESCE(e.courses_completed, 0) as courses_completed,
+    COALESCE(p.current_streak, 0) as current_streak,
+    COALESCE(p.total_time_spent, 0) as total_time_spent
 FROM users u
-LEFT JOIN progress p ON u.id = p.user_id
-LEFT JOIN enrollments e ON u.id = e.user_id
+LEFT JOIN (
+    SELECT user_id, SUM(points) as total_points, MAX(streak) as current_streak,
+           SUM(time_spent) as total_time_spent
+    FROM progress
+    GROUP BY user_id
+) p ON u.id = p.user_id
+LEFT JOIN (
+    SELECT user_id, COUNT(DISTINCT course_id) as courses_completed
+    FROM enrollments
+    WHERE completed_at IS NOT NULL
+    GROUP BY user_id
+) e ON u.id = e.user_id
 WHERE u.role = 'student'
-GROUP BY u.id, u.name, u.avatar
 ORDER BY total_points DESC, courses_completed DESC;
 
 -- Function to update updated_at timestamp
@@ -176,6 +311,9 @@ CREATE TRIGGER update_users_updated_at BEFORE UPDATE ON users
 CREATE TRIGGER update_courses_updated_at BEFORE UPDATE ON courses
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
+CREATE TRIGGER update_schedules_updated_at BEFORE UPDATE ON schedules
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
 -- Insert sample admin user (password: admin123 - hashed with bcrypt)
 -- Note: This is a sample hash. Generate your own in production!
 INSERT INTO users (email, hashed_password, name, role) VALUES